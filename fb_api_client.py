@@ -1,35 +1,481 @@
 # fb_api_client.py
 from __future__ import annotations
-import os, json, time, pathlib
-from datetime import datetime
-from openai import OpenAI
+import os, json, time, uuid, pathlib, asyncio, hashlib, sqlite3, threading, queue, atexit
+from datetime import datetime, timezone
+from functools import lru_cache
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:  # openai/httpx are imported lazily when a client is first built
+    from openai import OpenAI, AsyncOpenAI
+
+# Fast JSON when orjson is installed; stdlib otherwise. Cache keys stay on
+# stdlib json so their hashes don't depend on which backend is present.
+try:
+    import orjson
+    def _dumps(obj) -> str:
+        return orjson.dumps(obj).decode("utf-8")
+    _loads = orjson.loads
+except ImportError:
+    def _dumps(obj) -> str:
+        return json.dumps(obj, ensure_ascii=False)
+    _loads = json.loads
 
 # --- Configurable defaults ---
 DEFAULT_MODEL = os.getenv("FB_OPENAI_MODEL", "gpt-4o-mini")
-MAX_RETRIES = int(os.getenv("FB_API_MAX_RETRIES", "3"))
-RETRY_BASE_SLEEP = float(os.getenv("FB_API_RETRY_BASE", "0.8"))  # seconds
+MAX_RETRIES = int(os.getenv("FB_API_MAX_RETRIES", "3"))  # SDK backoff, honours Retry-After
+REQUEST_TIMEOUT = float(os.getenv("FB_API_TIMEOUT", "60"))  # seconds
+CONNECT_TIMEOUT = float(os.getenv("FB_API_CONNECT_TIMEOUT", "5"))  # seconds
+MAX_CONNECTIONS = int(os.getenv("FB_API_MAX_CONNECTIONS", "64"))
+MAX_KEEPALIVE = int(os.getenv("FB_API_MAX_KEEPALIVE", "32"))
+DEFAULT_CONCURRENCY = int(os.getenv("FB_API_CONCURRENCY", "8"))
+CACHE_ENABLED = os.getenv("FB_API_CACHE", "1") != "0"  # exact-match cache for temperature=0 calls
+SEMANTIC_CACHE_ENABLED = os.getenv("FB_SEMANTIC_CACHE", "0") == "1"  # opt-in, needs faiss + numpy
+AUTO_MAX_TOKENS = os.getenv("FB_API_AUTO_MAX_TOKENS", "0") == "1"  # opt-in: may truncate long answers
+RATE_LIMIT_RPM = float(os.getenv("FB_API_RPM", "0"))  # 0 = no client-side request limit
+RATE_LIMIT_TPM = float(os.getenv("FB_API_TPM", "0"))  # 0 = no client-side token limit
 
-# Where we store reliability logs (auto-created)
+# Where we store reliability logs (auto-created on first write)
 REPORTS_DIR = pathlib.Path(os.getenv("FB_REPORTS_DIR", "./Reports")).resolve()
-REPORTS_DIR.mkdir(parents=True, exist_ok=True)
+_reports_dir_ready = False
+
+def _ensure_reports_dir() -> pathlib.Path:
+    global _reports_dir_ready
+    if not _reports_dir_ready:
+        REPORTS_DIR.mkdir(parents=True, exist_ok=True)
+        _reports_dir_ready = True
+    return REPORTS_DIR
 
-# --- Singleton client ---
+# --- Singleton clients ---
 _client: OpenAI | None = None
+_aclient: AsyncOpenAI | None = None
+
+def _http_options() -> dict:
+    """Shared pooling/timeout settings; HTTP/2 only when the `h2` extra is installed."""
+    import httpx
+    try:
+        import h2  # noqa: F401
+        http2 = True
+    except ImportError:
+        http2 = False
+    return {
+        "timeout": httpx.Timeout(REQUEST_TIMEOUT, connect=CONNECT_TIMEOUT),
+        "limits": httpx.Limits(
+            max_connections=MAX_CONNECTIONS,
+            max_keepalive_connections=MAX_KEEPALIVE,
+        ),
+        "http2": http2,
+    }
 
 def _client_singleton() -> OpenAI:
     global _client
     if _client is None:
-        _client = OpenAI()  # Picks up OPENAI_API_KEY from environment
+        import httpx
+        from openai import OpenAI
+        opts = _http_options()
+        _client = OpenAI(  # Picks up OPENAI_API_KEY from environment
+            max_retries=MAX_RETRIES,
+            timeout=opts["timeout"],
+            http_client=httpx.Client(**opts),
+        )
     return _client
 
+def _aclient_singleton() -> AsyncOpenAI:
+    global _aclient
+    if _aclient is None:
+        import httpx
+        from openai import AsyncOpenAI
+        opts = _http_options()
+        _aclient = AsyncOpenAI(  # Picks up OPENAI_API_KEY from environment
+            max_retries=MAX_RETRIES,
+            timeout=opts["timeout"],
+            http_client=httpx.AsyncClient(**opts),
+        )
+    return _aclient
+
 # --- Logging ---
+# Events are queued and written by one daemon thread that keeps the day's
+# file open, so callers never block on open()/write()/close().
+_LOG_Q: "queue.Queue[tuple[str, str] | None]" = queue.Queue()
+_log_thread: threading.Thread | None = None
+_log_thread_lock = threading.Lock()
+
+def _drain_log_queue() -> None:
+    f = None
+    cur_stamp: str | None = None
+    try:
+        while True:
+            item = _LOG_Q.get()
+            try:
+                if item is None:
+                    return
+                stamp, line = item
+                if stamp != cur_stamp:  # rotate at UTC midnight
+                    if f is not None:
+                        f.close()
+                    log_file = _ensure_reports_dir() / f"openai_calls_{stamp}.jsonl"
+                    f = log_file.open("a", encoding="utf-8")
+                    cur_stamp = stamp
+                f.write(line)
+                if _LOG_Q.empty():
+                    f.flush()
+            except OSError:
+                # Drop the line rather than kill the writer; reopen on next event.
+                f, cur_stamp = None, None
+            finally:
+                _LOG_Q.task_done()
+    finally:
+        if f is not None:
+            f.close()
+
+def _ensure_log_writer() -> None:
+    global _log_thread
+    if _log_thread is None:
+        with _log_thread_lock:
+            if _log_thread is None:
+                t = threading.Thread(target=_drain_log_queue, name="fb-api-log", daemon=True)
+                t.start()
+                _log_thread = t
+                atexit.register(_stop_log_writer)
+
+def _stop_log_writer() -> None:
+    if _log_thread is not None and _log_thread.is_alive():
+        _LOG_Q.put(None)
+        _log_thread.join(timeout=5)
+
+def flush_logs() -> None:
+    """Block until every queued log event has been written to disk."""
+    if _log_thread is not None:
+        _LOG_Q.join()
+
+_DAY_CACHE: tuple[int, str] = (-1, "")  # (days since epoch, "YYYY-MM-DD")
+
 def _log_event(event: dict) -> None:
-    """Append a JSON line to daily log for reliability tracking."""
-    stamp = datetime.utcnow().strftime("%Y-%m-%d")
-    log_file = REPORTS_DIR / f"openai_calls_{stamp}.jsonl"
-    event["ts_utc"] = datetime.utcnow().isoformat(timespec="seconds") + "Z"
-    with log_file.open("a", encoding="utf-8") as f:
-        f.write(json.dumps(event, ensure_ascii=False) + "\n")
+    """Queue a JSON line for the daily reliability log."""
+    global _DAY_CACHE
+    _ensure_log_writer()
+    now = datetime.now(timezone.utc)
+    day = int(now.timestamp()) // 86400
+    if day != _DAY_CACHE[0]:
+        _DAY_CACHE = (day, now.strftime("%Y-%m-%d"))
+    stamp = _DAY_CACHE[1]
+    event["ts_utc"] = now.isoformat(timespec="seconds").replace("+00:00", "Z")
+    _LOG_Q.put((stamp, _dumps(event) + "\n"))
+
+# --- Response cache (deterministic calls only) ---
+_cache_db: sqlite3.Connection | None = None
+_cache_lock = threading.Lock()
+
+def _cache_singleton() -> sqlite3.Connection:
+    global _cache_db
+    if _cache_db is None:
+        _cache_db = sqlite3.connect(
+            _ensure_reports_dir() / "llm_cache.sqlite",
+            isolation_level=None,
+            check_same_thread=False,
+        )
+        _cache_db.execute(
+            "CREATE TABLE IF NOT EXISTS responses (key TEXT PRIMARY KEY, content TEXT NOT NULL)"
+        )
+    return _cache_db
+
+def _cache_key(model: str, messages: list[dict], temperature: float,
+               max_tokens: int | None) -> str | None:
+    """Stable key for a request, or None when the call must not be cached."""
+    if not CACHE_ENABLED or temperature != 0.0:
+        return None
+    blob = json.dumps(
+        {"model": model, "messages": messages,
+         "temperature": temperature, "max_tokens": max_tokens},
+        sort_keys=True, ensure_ascii=False,
+    )
+    return hashlib.sha256(blob.encode("utf-8")).hexdigest()
+
+def _cache_get(key: str) -> str | None:
+    with _cache_lock:
+        row = _cache_singleton().execute(
+            "SELECT content FROM responses WHERE key = ?", (key,)
+        ).fetchone()
+    return row[0] if row else None
+
+def _cache_set(key: str, val: str) -> None:
+    with _cache_lock:
+        _cache_singleton().execute(
+            "INSERT OR REPLACE INTO responses (key, content) VALUES (?, ?)", (key, val)
+        )
+
+_semantic = None  # fb_semantic_cache.SemanticCache, built on first use
+
+def _semantic_singleton():
+    global _semantic
+    if _semantic is None:
+        from fb_semantic_cache import SemanticCache  # optional deps: faiss, numpy
+        _semantic = SemanticCache(_ensure_reports_dir(), _client_singleton())
+    return _semantic
+
+def _semantic_parts(model: str, messages: list[dict]) -> tuple[str, str]:
+    """Split messages into the user prompt (embedded) and its scope (matched exactly)."""
+    user_idx = next(i for i, m in enumerate(messages) if m.get("role") == "user")
+    context = messages[:user_idx] + messages[user_idx + 1:]
+    scope = json.dumps({"model": model, "context": context}, sort_keys=True, ensure_ascii=False)
+    return messages[user_idx]["content"], scope
+
+def _cached_event(fn: str, model: str, messages: list[dict], content: str,
+                  tier: str = "exact") -> dict:
+    return {
+        "ok": True,
+        "fn": fn,
+        "model": model,
+        "cached": True,
+        "cache_tier": tier,
+        "prompt_chars": sum(len(m.get("content","")) for m in messages),
+        "response_chars": len(content),
+    }
+
+# --- Rate limiting (async fan-out) ---
+class TokenBucket:
+    """
+    Client-side RPM/TPM budget for async calls, after the openai-cookbook
+    parallel processor: capacity refills continuously, callers wait until
+    one request plus its estimated tokens fit, and the x-ratelimit-* headers
+    of each response tighten the local view of what the server allows.
+    """
+
+    def __init__(self, rpm: float, tpm: float):
+        self.rpm = rpm if rpm > 0 else float("inf")
+        self.tpm = tpm if tpm > 0 else float("inf")
+        self.available_request_capacity = self.rpm
+        self.available_token_capacity = self.tpm
+        self._last = time.monotonic()
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        elapsed = now - self._last
+        self._last = now
+        self.available_request_capacity = min(
+            self.rpm, self.available_request_capacity + self.rpm * elapsed / 60.0
+        )
+        self.available_token_capacity = min(
+            self.tpm, self.available_token_capacity + self.tpm * elapsed / 60.0
+        )
+
+    async def acquire(self, tokens: int) -> None:
+        """Wait until one request using `tokens` tokens fits the budget, then take it."""
+        tokens = min(tokens, self.tpm)  # a single oversized request must still get through
+        while True:
+            # No await between the check and the decrement, so this is atomic
+            # with respect to other coroutines on the loop.
+            self._refill()
+            if self.available_request_capacity >= 1 and self.available_token_capacity >= tokens:
+                self.available_request_capacity -= 1
+                self.available_token_capacity -= tokens
+                return
+            # An unlimited side (inf) never blocks; dividing by it would give
+            # inf/inf = NaN, and max() can propagate NaN into sleep() forever.
+            wait_s = 0.001
+            if self.rpm != float("inf"):
+                wait_s = max(wait_s, (1 - self.available_request_capacity) * 60.0 / self.rpm)
+            if self.tpm != float("inf"):
+                wait_s = max(wait_s, (tokens - self.available_token_capacity) * 60.0 / self.tpm)
+            await asyncio.sleep(wait_s)
+
+    def update_from_headers(self, headers) -> None:
+        """Clamp local capacity to the server's x-ratelimit-remaining-* values."""
+        for header, attr in (
+            ("x-ratelimit-remaining-requests", "available_request_capacity"),
+            ("x-ratelimit-remaining-tokens", "available_token_capacity"),
+        ):
+            value = headers.get(header)
+            if value is None:
+                continue
+            try:
+                remaining = float(value)
+            except ValueError:
+                continue
+            setattr(self, attr, min(getattr(self, attr), remaining))
+
+_bucket: TokenBucket | None = None
+
+def _bucket_singleton() -> TokenBucket | None:
+    """Shared bucket when FB_API_RPM/FB_API_TPM is set, else None."""
+    global _bucket
+    if _bucket is None and (RATE_LIMIT_RPM > 0 or RATE_LIMIT_TPM > 0):
+        _bucket = TokenBucket(RATE_LIMIT_RPM, RATE_LIMIT_TPM)
+    return _bucket
+
+# --- Shared request plumbing ---
+def _build_messages(
+    prompt: str,
+    system: str | None,
+    extra_messages: list[dict] | None,
+) -> list[dict]:
+    messages: list[dict] = []
+    if system:
+        messages.append({"role": "system", "content": system})
+    messages.append({"role": "user", "content": prompt})
+    if extra_messages:
+        messages.extend(extra_messages)
+    return messages
+
+@lru_cache(maxsize=8)
+def _encoder_for(model: str):
+    """tiktoken encoder for `model`, or None when tiktoken is unavailable."""
+    try:
+        import tiktoken
+    except ImportError:
+        return None
+    try:
+        return tiktoken.encoding_for_model(model)
+    except KeyError:
+        return tiktoken.get_encoding("o200k_base")
+
+def _count_tokens(messages: list[dict], model: str) -> int:
+    enc = _encoder_for(model)
+    if enc is None:  # rough chars-per-token fallback
+        return sum(len(m.get("content", "")) for m in messages) // 4 + 1
+    return sum(len(enc.encode(m.get("content", ""))) for m in messages)
+
+def _max_tokens_for(messages: list[dict], model: str, max_tokens: int | None) -> int | None:
+    """
+    Caller's budget if given; otherwise, with FB_API_AUTO_MAX_TOKENS=1,
+    2x the prompt's token count + 64 instead of the model's full limit.
+    """
+    if max_tokens is not None or not AUTO_MAX_TOKENS:
+        return max_tokens
+    return 2 * _count_tokens(messages, model) + 64
+
+def _prefix_hash(messages: list[dict]) -> str | None:
+    """Short hash of the system prompt; a change here means a prompt-cache miss."""
+    if messages and messages[0].get("role") == "system":
+        return hashlib.sha1(messages[0]["content"].encode("utf-8")).hexdigest()[:8]
+    return None
+
+def _ok_event(fn: str, model: str, temperature: float, t0: float,
+              messages: list[dict], content: str) -> dict:
+    return {
+        "ok": True,
+        "fn": fn,
+        "model": model,
+        "temperature": temperature,
+        "latency_s": round(time.perf_counter() - t0, 3),
+        "prompt_chars": sum(len(m.get("content","")) for m in messages),
+        "response_chars": len(content),
+        "prefix_sha1": _prefix_hash(messages),
+    }
+
+def _fail_event(fn: str, model: str, exc: Exception) -> dict:
+    return {
+        "ok": False,
+        "fn": fn,
+        "model": model,
+        "error": repr(exc),
+    }
+
+def _call_once(
+    messages: list[dict],
+    *,
+    model: str,
+    temperature: float,
+    max_tokens: int | None,
+    fn: str = "ask",
+) -> str:
+    """Run one chat completion (the SDK handles retries); log the outcome."""
+    key = _cache_key(model, messages, temperature, max_tokens)
+    if key is not None:
+        hit = _cache_get(key)
+        if hit is not None:
+            _log_event(_cached_event(fn, model, messages, hit))
+            return hit
+
+    sem_emb = None
+    if SEMANTIC_CACHE_ENABLED and temperature == 0.0:
+        sem_prompt, sem_scope = _semantic_parts(model, messages)
+        hit, sem_emb = _semantic_singleton().lookup(sem_prompt, sem_scope)
+        if hit is not None:
+            _log_event(_cached_event(fn, model, messages, hit, tier="semantic"))
+            return hit
+
+    cli = _client_singleton()
+
+    t0 = time.perf_counter()
+    try:
+        r = cli.chat.completions.create(
+            model=model,
+            messages=messages,
+            temperature=temperature,
+            max_tokens=max_tokens,
+        )
+    except Exception as e:
+        _log_event(_fail_event(fn, model, e))
+        raise
+
+    content = r.choices[0].message.content or ""
+    if key is not None:
+        _cache_set(key, content)
+    if sem_emb is not None:
+        _semantic_singleton().add(sem_emb, sem_prompt, content, sem_scope)
+    _log_event(_ok_event(fn, model, temperature, t0, messages, content))
+    return content
+
+async def _acall_once(
+    messages: list[dict],
+    *,
+    model: str,
+    temperature: float,
+    max_tokens: int | None,
+    fn: str = "aask",
+) -> str:
+    """Async twin of `_call_once`; cache I/O is pushed off the event loop."""
+    key = _cache_key(model, messages, temperature, max_tokens)
+    if key is not None:
+        hit = await asyncio.to_thread(_cache_get, key)
+        if hit is not None:
+            _log_event(_cached_event(fn, model, messages, hit))
+            return hit
+
+    sem_emb = None
+    if SEMANTIC_CACHE_ENABLED and temperature == 0.0:
+        sem_prompt, sem_scope = _semantic_parts(model, messages)
+        hit, sem_emb = await asyncio.to_thread(
+            _semantic_singleton().lookup, sem_prompt, sem_scope
+        )
+        if hit is not None:
+            _log_event(_cached_event(fn, model, messages, hit, tier="semantic"))
+            return hit
+
+    cli = _aclient_singleton()
+    bucket = _bucket_singleton()
+    if bucket is not None:
+        await bucket.acquire(_count_tokens(messages, model) + (max_tokens or 0))
+
+    t0 = time.perf_counter()
+    try:
+        if bucket is None:
+            r = await cli.chat.completions.create(
+                model=model,
+                messages=messages,
+                temperature=temperature,
+                max_tokens=max_tokens,
+            )
+        else:
+            raw = await cli.chat.completions.with_raw_response.create(
+                model=model,
+                messages=messages,
+                temperature=temperature,
+                max_tokens=max_tokens,
+            )
+            bucket.update_from_headers(raw.headers)
+            r = raw.parse()
+    except Exception as e:
+        _log_event(_fail_event(fn, model, e))
+        raise
+
+    content = r.choices[0].message.content or ""
+    if key is not None:
+        await asyncio.to_thread(_cache_set, key, content)
+    if sem_emb is not None:
+        _semantic_singleton().add(sem_emb, sem_prompt, content, sem_scope)
+    _log_event(_ok_event(fn, model, temperature, t0, messages, content))
+    return content
 
 # --- Text call ---
 def ask(
@@ -44,101 +490,268 @@ def ask(
     """
     Basic text call. Returns assistant's response string.
     """
-    cli = _client_singleton()
+    messages = _build_messages(prompt, system, extra_messages)
     use_model = model or DEFAULT_MODEL
+    return _call_once(
+        messages,
+        model=use_model,
+        temperature=temperature,
+        max_tokens=_max_tokens_for(messages, use_model, max_tokens),
+        fn="ask",
+    )
 
-    messages: list[dict] = []
-    if system:
-        messages.append({"role": "system", "content": system})
-    messages.append({"role": "user", "content": prompt})
-    if extra_messages:
-        messages.extend(extra_messages)
+async def aask(
+    prompt: str,
+    *,
+    system: str | None = None,
+    model: str | None = None,
+    temperature: float = 0.0,
+    max_tokens: int | None = None,
+    extra_messages: list[dict] | None = None,
+) -> str:
+    """
+    Async text call. Same contract as `ask()`.
+    """
+    messages = _build_messages(prompt, system, extra_messages)
+    use_model = model or DEFAULT_MODEL
+    return await _acall_once(
+        messages,
+        model=use_model,
+        temperature=temperature,
+        max_tokens=_max_tokens_for(messages, use_model, max_tokens),
+        fn="aask",
+    )
 
-    last_exc: Exception | None = None
-    for attempt in range(1, MAX_RETRIES + 1):
-        t0 = time.perf_counter()
-        try:
-            r = cli.chat.completions.create(
-                model=use_model,
-                messages=messages,
-                temperature=temperature,
-                max_tokens=max_tokens,
-            )
-            content = r.choices[0].message.content or ""
-            _log_event({
-                "ok": True,
-                "fn": "ask",
-                "model": use_model,
-                "temperature": temperature,
-                "latency_s": round(time.perf_counter() - t0, 3),
-                "prompt_chars": sum(len(m.get("content","")) for m in messages),
-                "response_chars": len(content),
-            })
-            return content
-        except Exception as e:
-            last_exc = e
-            time.sleep(RETRY_BASE_SLEEP * (2 ** (attempt - 1)))
-
-    _log_event({
-        "ok": False,
-        "fn": "ask",
-        "model": use_model,
-        "error": repr(last_exc),
-    })
-    raise last_exc if last_exc else RuntimeError("Unknown error in ask()")
+async def ask_many(
+    prompts: list[str],
+    *,
+    concurrency: int = DEFAULT_CONCURRENCY,
+    **kw,
+) -> list[str]:
+    """
+    Fan out `aask()` over many prompts, at most `concurrency` in flight.
+    Results are returned in the same order as `prompts`.
+    """
+    sem = asyncio.Semaphore(max(1, concurrency))
 
-# --- JSON call ---
-def ask_json(
-    prompt: str,
+    async def _guarded(p: str) -> str:
+        async with sem:
+            return await aask(p, **kw)
+
+    return await asyncio.gather(*[_guarded(p) for p in prompts])
+
+# --- Batch API (offline bulk jobs) ---
+BATCH_ENDPOINT = "/v1/chat/completions"
+BATCH_MAX_POLL_S = float(os.getenv("FB_BATCH_MAX_POLL", "300"))  # cap for the poll backoff
+_BATCH_TERMINAL_FAILURES = {"failed", "expired", "cancelled"}
+
+def _batch_errors(cli, batch) -> list[str]:
+    """`custom_id: message` lines from a finished batch's error file, if any."""
+    error_file_id = getattr(batch, "error_file_id", None)
+    if error_file_id is None:
+        return []
+    errors = []
+    for line in cli.files.content(error_file_id).text.splitlines():
+        if not line.strip():
+            continue
+        rec = _loads(line)
+        err = rec.get("error") or ((rec.get("response") or {}).get("body") or {}).get("error") or {}
+        message = err.get("message") if isinstance(err, dict) else str(err)
+        errors.append(f"{rec.get('custom_id')}: {message or 'unknown error'}")
+    return errors
+
+def ask_batch(
+    prompts: list[str],
     *,
     system: str | None = None,
     model: str | None = None,
     temperature: float = 0.0,
-    schema_hint: str | None = None,
     max_tokens: int | None = None,
-) -> dict:
+    poll_s: float = 10.0,
+) -> list[str]:
     """
-    Requests structured JSON from the model and parses it.
-    Light auto-repair if the model adds any extra text.
+    Run many prompts through the OpenAI Batch API (half price, 24h window).
+    Blocks until the batch finishes and returns responses in `prompts` order.
+    """
+    cli = _client_singleton()
+    use_model = model or DEFAULT_MODEL
+    t0 = time.perf_counter()
+
+    batch_dir = _ensure_reports_dir() / "batches"
+    batch_dir.mkdir(parents=True, exist_ok=True)
+    stamp = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%S")
+    # The suffix keeps batches submitted in the same second from sharing a file
+    in_path = batch_dir / f"batch_input_{stamp}_{uuid.uuid4().hex}.jsonl"
+    with in_path.open("w", encoding="utf-8") as f:
+        for i, prompt in enumerate(prompts):
+            body: dict = {
+                "model": use_model,
+                "messages": _build_messages(prompt, system, None),
+                "temperature": temperature,
+            }
+            if max_tokens is not None:
+                body["max_tokens"] = max_tokens
+            f.write(_dumps({
+                "custom_id": f"req-{i}",
+                "method": "POST",
+                "url": BATCH_ENDPOINT,
+                "body": body,
+            }) + "\n")
+
+    try:
+        with in_path.open("rb") as f:
+            upload = cli.files.create(file=f, purpose="batch")
+    finally:
+        in_path.unlink(missing_ok=True)
+    try:
+        batch = cli.batches.create(
+            input_file_id=upload.id,
+            endpoint=BATCH_ENDPOINT,
+            completion_window="24h",
+        )
+
+        sleep_s = poll_s
+        while batch.status != "completed":
+            if batch.status in _BATCH_TERMINAL_FAILURES:
+                _log_event({
+                    "ok": False,
+                    "fn": "ask_batch",
+                    "model": use_model,
+                    "batch_id": batch.id,
+                    "error": f"batch {batch.status}",
+                })
+                raise RuntimeError(f"Batch {batch.id} ended with status {batch.status!r}")
+            time.sleep(sleep_s)
+            sleep_s = min(sleep_s * 2, BATCH_MAX_POLL_S)
+            batch = cli.batches.retrieve(batch.id)
+
+        results: dict[str, str] = {}
+        if batch.output_file_id is not None:  # None when every request failed
+            raw = cli.files.content(batch.output_file_id).text
+            for line in raw.splitlines():
+                if not line.strip():
+                    continue
+                rec = _loads(line)
+                resp = rec.get("response") or {}
+                if resp.get("status_code") == 200:
+                    results[rec["custom_id"]] = resp["body"]["choices"][0]["message"]["content"] or ""
+
+        missing = [f"req-{i}" for i in range(len(prompts)) if f"req-{i}" not in results]
+        errors = _batch_errors(cli, batch) if missing else []
+        _log_event({
+            "ok": not missing,
+            "fn": "ask_batch",
+            "model": use_model,
+            "batch_id": batch.id,
+            "requests": len(prompts),
+            "failed": len(missing),
+            "latency_s": round(time.perf_counter() - t0, 3),
+            **({"error": errors[0]} if errors else {}),
+        })
+        if missing:
+            detail = f"; errors: {errors[:5]}" if errors else ""
+            raise RuntimeError(
+                f"Batch {batch.id}: {len(missing)} request(s) failed, e.g. {missing[:5]}{detail}"
+            )
+        return [results[f"req-{i}"] for i in range(len(prompts))]
+    finally:
+        try:
+            cli.files.delete(upload.id)
+        except Exception:  # best effort; the batch result is what matters
+            pass
+
+# --- JSON call ---
+@lru_cache(maxsize=64)
+def _json_system(system: str | None, schema_hint: str | None) -> str:
+    """
+    Static JSON preamble for a (system, schema_hint) pair, built once.
+    It rides in the system slot so it forms a stable prefix that
+    provider-side prompt caching can reuse; only the user text varies.
     """
     schema_note = f"\n\nSchema hint:\n{schema_hint}" if schema_hint else ""
 
-    json_prompt = (
-        "Respond ONLY with compact JSON (no backticks, no text before/after). "
+    return (
+        (system or "You are a precise JSON generator.")
+        + "\n\nRespond ONLY with compact JSON (no backticks, no text before/after). "
         "If a field is unknown, use null. "
         "Do not include comments."
         + schema_note
-        + "\n\nUser request:\n"
-        + prompt
     )
 
-    raw = ask(
-        json_prompt,
-        system=system or "You are a precise JSON generator.",
-        model=model,
-        temperature=temperature,
-        max_tokens=max_tokens,
-    ).strip()
+def _json_prompts(prompt: str, system: str | None, schema_hint: str | None) -> tuple[str, str]:
+    """Split a JSON request into (system, user) text."""
+    return _json_system(system, schema_hint), "User request:\n" + prompt
+
+_JSON_DECODER = json.JSONDecoder()
 
+def _parse_json(raw: str, *, fn: str, model: str | None) -> dict:
     # Attempt a direct parse
     try:
-        return json.loads(raw)
+        return _loads(raw)
     except Exception:
-        # Attempt minimal repair: find first { ... } block
-        start = raw.find("{")
-        end = raw.rfind("}")
-        if start != -1 and end != -1 and end > start:
+        # Attempt minimal repair: first "{" that starts a complete JSON object;
+        # raw_decode stops at its end, so trailing text is ignored.
+        i = raw.find("{")
+        while i != -1:
             try:
-                return json.loads(raw[start:end+1])
-            except Exception:
-                pass
+                obj, _ = _JSON_DECODER.raw_decode(raw, i)
+                return obj
+            except json.JSONDecodeError:
+                i = raw.find("{", i + 1)
 
         # If still not valid, log the failure and raise
         _log_event({
             "ok": False,
-            "fn": "ask_json",
+            "fn": fn,
             "model": model or DEFAULT_MODEL,
             "error": "JSON parse failed",
             "raw_head": raw[:200],
         })
         raise
+
+def ask_json(
+    prompt: str,
+    *,
+    system: str | None = None,
+    model: str | None = None,
+    temperature: float = 0.0,
+    schema_hint: str | None = None,
+    max_tokens: int | None = None,
+) -> dict:
+    """
+    Requests structured JSON from the model and parses it.
+    Light auto-repair if the model adds any extra text.
+    """
+    json_system, json_prompt = _json_prompts(prompt, system, schema_hint)
+    raw = ask(
+        json_prompt,
+        system=json_system,
+        model=model,
+        temperature=temperature,
+        max_tokens=max_tokens,
+    ).strip()
+
+    return _parse_json(raw, fn="ask_json", model=model)
+
+async def aask_json(
+    prompt: str,
+    *,
+    system: str | None = None,
+    model: str | None = None,
+    temperature: float = 0.0,
+    schema_hint: str | None = None,
+    max_tokens: int | None = None,
+) -> dict:
+    """
+    Async twin of `ask_json()`.
+    """
+    json_system, json_prompt = _json_prompts(prompt, system, schema_hint)
+    raw = (await aask(
+        json_prompt,
+        system=json_system,
+        model=model,
+        temperature=temperature,
+        max_tokens=max_tokens,
+    )).strip()
+
+    return _parse_json(raw, fn="aask_json", model=model)
@@ -1,7 +1,8 @@
 # Simple re-export layer so callers can `import fb_math_engine`
 from fbmathengine.__FBMathEngine__.fb_math_engine import (
     explain_symbolic_step,
+    explain_symbolic_step_async,
+    explain_symbolic_step_sync,
     evaluate_expression,
     solve_equation,
 )
-
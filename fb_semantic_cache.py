@@ -0,0 +1,101 @@
+# fb_semantic_cache.py
+"""
+Embedding-based response cache used by fb_api_client when FB_SEMANTIC_CACHE=1.
+
+Prompts are embedded with an OpenAI embedding model, L2-normalised and kept
+in a FAISS inner-product index, so a search score is the cosine similarity.
+A paraphrased prompt whose score clears the threshold reuses the stored
+response instead of paying for a new completion.
+"""
+from __future__ import annotations
+import os, json, atexit, pathlib, threading
+
+import numpy as np
+import faiss
+
+EMBED_MODEL = os.getenv("FB_SEMANTIC_EMBED_MODEL", "text-embedding-3-small")
+EMBED_DIM = int(os.getenv("FB_SEMANTIC_EMBED_DIM", "1536"))
+DEFAULT_THRESHOLD = float(os.getenv("FB_SEMANTIC_THRESHOLD", "0.92"))
+SEARCH_K = 4  # neighbours inspected when looking for a same-scope hit
+
+
+class SemanticCache:
+    """
+    FAISS IndexFlatIP over prompt embeddings plus a parallel list of entries.
+
+    Each entry is `{"prompt", "response", "scope"}`; `scope` pins a hit to the
+    model and surrounding messages (system prompt etc.) it was produced under.
+    """
+
+    def __init__(self, root: pathlib.Path, client, *, threshold: float = DEFAULT_THRESHOLD):
+        self.client = client
+        self.threshold = threshold
+        self.index_path = pathlib.Path(root) / "semantic_cache.faiss"
+        self.entries_path = pathlib.Path(root) / "semantic_cache.jsonl"
+        self._lock = threading.Lock()
+        self._dirty = False
+
+        self.entries: list[dict] = []
+        if self.index_path.exists() and self.entries_path.exists():
+            self.index = faiss.read_index(str(self.index_path))
+            with self.entries_path.open("r", encoding="utf-8") as f:
+                self.entries = [json.loads(line) for line in f if line.strip()]
+            if self.index.ntotal != len(self.entries):
+                # Out of sync (e.g. interrupted save): start fresh rather than mis-map.
+                self.index = faiss.IndexFlatIP(EMBED_DIM)
+                self.entries = []
+        else:
+            self.index = faiss.IndexFlatIP(EMBED_DIM)
+
+        atexit.register(self.save)
+
+    def embed(self, text: str) -> np.ndarray:
+        """Return the unit-length embedding of `text` as a float32 vector."""
+        r = self.client.embeddings.create(model=EMBED_MODEL, input=text)
+        vec = np.asarray(r.data[0].embedding, dtype=np.float32)
+        norm = np.linalg.norm(vec)
+        return vec / norm if norm else vec
+
+    def lookup(
+        self,
+        prompt: str,
+        scope: str,
+        *,
+        threshold: float | None = None,
+    ) -> tuple[str | None, np.ndarray]:
+        """
+        Find a cached response for a prompt similar to `prompt` in `scope`.
+        Returns (response or None, embedding) so a miss can be added without
+        embedding the prompt twice.
+        """
+        emb = self.embed(prompt)
+        limit = self.threshold if threshold is None else threshold
+        with self._lock:
+            if self.index.ntotal == 0:
+                return None, emb
+            k = min(SEARCH_K, self.index.ntotal)
+            scores, ids = self.index.search(emb.reshape(1, -1), k)
+            for score, idx in zip(scores[0], ids[0]):
+                if idx < 0 or score < limit:
+                    break
+                entry = self.entries[idx]
+                if entry["scope"] == scope:
+                    return entry["response"], emb
+        return None, emb
+
+    def add(self, emb: np.ndarray, prompt: str, response: str, scope: str) -> None:
+        with self._lock:
+            self.index.add(np.asarray([emb], dtype=np.float32))
+            self.entries.append({"prompt": prompt, "response": response, "scope": scope})
+            self._dirty = True
+
+    def save(self) -> None:
+        """Persist the index and entries next to the reliability logs."""
+        with self._lock:
+            if not self._dirty:
+                return
+            faiss.write_index(self.index, str(self.index_path))
+            with self.entries_path.open("w", encoding="utf-8") as f:
+                for entry in self.entries:
+                    f.write(json.dumps(entry, ensure_ascii=False) + "\n")
+            self._dirty = False
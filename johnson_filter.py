@@ -1,6 +1,7 @@
 ﻿from __future__ import annotations
 import re
-from typing import Dict, List
+from functools import lru_cache
+from typing import Dict, List, Tuple
 
 # Basic operation keywords
 _OPS = [
@@ -10,22 +11,35 @@ _OPS = [
     "converges", "diverges", "is prime", "is integer",
 ]
 
+# One alternation, longest first so ">=" is not consumed as ">".
+_OPS_RE = re.compile("|".join(sorted((re.escape(o) for o in _OPS), key=len, reverse=True)))
+# A matched op also implies every shorter op it contains (">=" -> ">", "=").
+_OPS_IMPLIED = {op: frozenset(o for o in _OPS if o in op) for op in _OPS}
+
+_SYM_RE = re.compile(r"[A-Za-z_][A-Za-z0-9_]*|\\[A-Za-z]+|[α-ωΑ-Ω]")
+_STOP = frozenset({"equals","for","all","real","reals","such","that","is","are","and","or","if","then"})
+
 def _find_symbols(s: str) -> List[str]:
     # crude symbol detector: identifiers and latex-ish tokens
-    toks = set(re.findall(r"[A-Za-z_][A-Za-z0-9_]*|\\[A-Za-z]+|[α-ωΑ-Ω]", s))
-    stop = {"equals","for","all","real","reals","such","that","is","are","and","or","if","then"}
-    return [t for t in toks if t.lower() not in stop]
+    seen = set()
+    out = []
+    for m in _SYM_RE.finditer(s):
+        t = m.group()
+        if t in seen or t.lower() in _STOP:
+            continue
+        seen.add(t)
+        out.append(t)
+    return out
 
 def _find_ops(s: str) -> List[str]:
-    out = []
-    lo = s.lower()
-    for op in _OPS:
-        if op in lo:
-            out.append(op)
-    return list(dict.fromkeys(out))
+    found = set()
+    for m in _OPS_RE.findall(s.lower()):
+        found |= _OPS_IMPLIED[m]
+    return [op for op in _OPS if op in found]
 
-def analyze_claim(claim: str, assumptions: List[str] | None = None) -> Dict:
-    assumptions = assumptions or []
+@lru_cache(maxsize=4096)
+def _analyze_cached(claim: str, assumptions: Tuple[str, ...]) -> tuple:
+    # pure and hashable so repeated claims skip the regex scans entirely
     symbols = _find_symbols(claim)
     ops = _find_ops(claim)
 
@@ -41,11 +55,18 @@ def analyze_claim(claim: str, assumptions: List[str] | None = None) -> Dict:
 
     normalized_claim = claim.strip()
 
+    return normalized_claim, tuple(symbols), tuple(ops), tuple(ambiguities), tuple(risks)
+
+def analyze_claim(claim: str, assumptions: List[str] | None = None) -> Dict:
+    assumptions = assumptions or []
+    normalized_claim, symbols, ops, ambiguities, risks = _analyze_cached(claim, tuple(assumptions))
+
+    # fresh lists each call so callers can't mutate the cached entry
     return {
         "normalized_claim": normalized_claim,
-        "symbols": symbols,
-        "operations": ops,
+        "symbols": list(symbols),
+        "operations": list(ops),
         "assumptions_extracted": assumptions,
-        "ambiguities": ambiguities,
-        "risks": risks,
+        "ambiguities": list(ambiguities),
+        "risks": list(risks),
     }
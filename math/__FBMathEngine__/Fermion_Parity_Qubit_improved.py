@@ -9,6 +9,29 @@ which uses topological braiding of quasiparticles for quantum operations.
 from enum import IntEnum
 from typing import List, Optional
 
+try:
+    import numpy as np
+except ImportError:  # numpy is only needed for FermionParityQubitArray
+    np = None
+
+try:
+    from numba import njit
+except ImportError:  # optional: FermionParityQubitArray falls back to NumPy
+    njit = None
+
+
+if njit is not None:
+    @njit(cache=True)
+    def _braid_kernel(parity, who, count):
+        # Sequential on purpose: a repeated index must flip twice, which a
+        # prange loop would turn into a data race.
+        for i in range(who.shape[0]):
+            idx = who[i]
+            parity[idx] ^= 1
+            count[idx] += 1
+else:
+    _braid_kernel = None
+
 
 class ParityState(IntEnum):
     """Enumeration for fermion parity states."""
@@ -46,6 +69,8 @@ class FermionParityQubit:
         1
     """
     
+    __slots__ = ("_parity", "_measurement_count", "_braid_count")
+    
     def __init__(self, initial_parity: int = 0) -> None:
         """
         Initialize a fermion parity qubit.
@@ -152,7 +177,8 @@ class FermionParityQubit:
         Returns:
             List[int]: State vector as a single-element list containing +1 or -1
         """
-        return [+1] if self._parity == 0 else [-1]
+        # 0 -> +1, 1 -> -1 without a branch
+        return [1 - 2 * self._parity]
     
     def reset(self, parity: int = 0) -> None:
         """
@@ -204,7 +230,7 @@ class FermionParityQubit:
             str: Human-readable string representation
         """
         parity_str = "EVEN" if self._parity == 0 else "ODD"
-        state_vector = self.get_state_vector()[0]
+        state_vector = 1 - 2 * self._parity
         return f"FermionParityQubit[{parity_str}, state={state_vector:+d}]"
     
     def __eq__(self, other: object) -> bool:
@@ -220,3 +246,169 @@ class FermionParityQubit:
         if not isinstance(other, FermionParityQubit):
             return NotImplemented
         return self._parity == other._parity
+
+
+class FermionParityQubitArray:
+    """
+    A register of N fermion parity qubits stored as flat NumPy arrays.
+    
+    Instead of one FermionParityQubit object per qubit, parities and
+    operation counters live in contiguous vectors (structure-of-arrays), so
+    braiding or measuring many qubits is a single vectorised operation.
+    
+    Attributes:
+        parity (np.ndarray): uint8 vector of parities (0 even, 1 odd)
+        _measurement_count (np.ndarray): uint64 measurements per qubit
+        _braid_count (np.ndarray): uint64 braids per qubit
+    
+    Example:
+        >>> reg = FermionParityQubitArray(4)
+        >>> reg.braid(np.array([0, 2]))
+        >>> reg.measure().tolist()
+        [1, 0, 1, 0]
+    """
+    
+    def __init__(self, n: int, initial_parity: int = 0) -> None:
+        """
+        Initialize a register of n qubits sharing one initial parity.
+        
+        Args:
+            n: Number of qubits in the register
+            initial_parity: Initial parity for every qubit (0 or 1). Default 0.
+        
+        Raises:
+            ImportError: If NumPy is not available
+            ParityError: If initial_parity is not 0 or 1
+            ValueError: If n is negative
+        """
+        if np is None:
+            raise ImportError(
+                "FermionParityQubitArray requires NumPy. Install with: pip install numpy"
+            )
+        if initial_parity not in (0, 1):
+            raise ParityError(
+                f"Parity must be 0 (even) or 1 (odd), got {initial_parity}"
+            )
+        if n < 0:
+            raise ValueError(f"Register size must be non-negative, got {n}")
+        
+        self._parity = np.full(n, initial_parity, dtype=np.uint8)
+        self._measurement_count = np.zeros(n, dtype=np.uint64)
+        self._braid_count = np.zeros(n, dtype=np.uint64)
+    
+    def __len__(self) -> int:
+        return self._parity.shape[0]
+    
+    @property
+    def parity(self) -> "np.ndarray":
+        """
+        Get a read-only view of the parity vector.
+        
+        Returns:
+            np.ndarray: uint8 parities (0 for even, 1 for odd)
+        """
+        view = self._parity.view()
+        view.flags.writeable = False
+        return view
+    
+    @property
+    def measurement_count(self) -> "np.ndarray":
+        """Get a copy of the per-qubit measurement counts."""
+        return self._measurement_count.copy()
+    
+    @property
+    def braid_count(self) -> "np.ndarray":
+        """Get a copy of the per-qubit braid counts."""
+        return self._braid_count.copy()
+    
+    def braid(self, who) -> None:
+        """
+        Braid one e/4 quasiparticle around each selected qubit.
+        
+        Args:
+            who: Boolean mask of length N, a slice, or an array of qubit
+                 indices. Repeated indices braid that qubit repeatedly.
+        """
+        idx = who if isinstance(who, slice) else np.asarray(who)
+        if not isinstance(idx, slice) and idx.dtype != np.bool_:
+            # Explicit dtype: an empty list would otherwise come out float64
+            idx = np.asarray(who, dtype=np.intp)
+        if isinstance(idx, slice) or idx.dtype == np.bool_:
+            self._parity[idx] ^= 1
+            self._braid_count[idx] += 1
+        elif _braid_kernel is not None:
+            n = len(self)
+            idx = np.where(idx < 0, idx + n, idx).astype(np.intp, copy=False)
+            if idx.size and (idx.min() < 0 or idx.max() >= n):
+                raise IndexError(f"Qubit index out of range for register of {n}")
+            _braid_kernel(self._parity, idx, self._braid_count)
+        else:
+            # ufunc.at applies every occurrence, unlike buffered fancy indexing
+            np.bitwise_xor.at(self._parity, idx, 1)
+            np.add.at(self._braid_count, idx, 1)
+    
+    def measure(self, who=None) -> "np.ndarray":
+        """
+        Measure the parity of the selected qubits (all qubits by default).
+        
+        Args:
+            who: Optional mask, slice or index array selecting qubits
+        
+        Returns:
+            np.ndarray: Copy of the selected parities
+        """
+        sel = slice(None) if who is None else who
+        self._measurement_count[sel] += 1
+        return self._parity[sel].copy()
+    
+    def get_state_vector(self) -> "np.ndarray":
+        """
+        Get the state vector of every qubit: +1 for even, -1 for odd parity.
+        
+        Returns:
+            np.ndarray: int8 vector computed branch-free as 1 - 2*parity
+        """
+        return 1 - 2 * self._parity.astype(np.int8)
+    
+    def reset(self, parity: int = 0) -> None:
+        """
+        Reset every qubit to the given parity.
+        
+        Raises:
+            ParityError: If parity is not 0 or 1.
+        """
+        if parity not in (0, 1):
+            raise ParityError(
+                f"Parity must be 0 (even) or 1 (odd), got {parity}"
+            )
+        self._parity.fill(parity)
+    
+    def packed(self) -> "np.ndarray":
+        """
+        Get the parities bit-packed eight qubits per byte.
+        
+        Returns:
+            np.ndarray: uint8 array of length ceil(N / 8)
+        """
+        return np.packbits(self._parity)
+    
+    def get_statistics(self) -> dict:
+        """
+        Get aggregate statistics for the register.
+        
+        Returns:
+            dict: Qubit count, odd-parity count and total measurements/braids
+        """
+        return {
+            'qubits': len(self),
+            'odd': int(self._parity.sum()),
+            'measurements': int(self._measurement_count.sum()),
+            'braids': int(self._braid_count.sum())
+        }
+    
+    def __repr__(self) -> str:
+        stats = self.get_statistics()
+        return (
+            f"FermionParityQubitArray(n={stats['qubits']}, odd={stats['odd']}, "
+            f"braids={stats['braids']})"
+        )
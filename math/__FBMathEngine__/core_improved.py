@@ -20,6 +20,14 @@ class SeedType(Enum):
     # Additional seed types can be added here as needed
 
 
+INVALID_SEED_MSG = "No output. Seed invalid or silent."
+
+# Seed string -> engine output; a plain dict lookup on the hot path
+_SEED_OUTPUTS: Dict[str, str] = {
+    SeedType.ZERO_POSITIVE.value: "spiral-encoded triad [∆⊛♡]",
+}
+
+
 @dataclass
 class EngineResult:
     """
@@ -35,6 +43,22 @@ class EngineResult:
     metadata: Optional[Dict[str, Any]] = None
 
 
+def _run_seed(seed: str) -> EngineResult:
+    """Resolve a seed to its EngineResult via the dispatch table."""
+    output = _SEED_OUTPUTS.get(seed)
+    if output is None:
+        return EngineResult(
+            success=False,
+            output=INVALID_SEED_MSG,
+            metadata={'seed': seed, 'error': 'Invalid seed type'}
+        )
+    return EngineResult(
+        success=True,
+        output=output,
+        metadata={'seed': seed, 'seed_type': seed}
+    )
+
+
 class MathEngineCore:
     """
     Core mathematical engine for processing seed-based operations.
@@ -48,65 +72,25 @@ class MathEngineCore:
     POLARITY_ALIGNMENT_MSG = "Seeding polarity alignment... [✓]"
     VECTOR_FIELD_MSG = "Generating first vector field... [✓]"
     HARMONIC_RESONANCE_MSG = "Detecting harmonic resonance... [✓]"
-    INVALID_SEED_MSG = "No output. Seed invalid or silent."
+    INVALID_SEED_MSG = INVALID_SEED_MSG
     
     # Output patterns
-    OUTPUTS = {
-        SeedType.ZERO_POSITIVE: "spiral-encoded triad [∆⊛♡]"
-    }
+    OUTPUTS = {SeedType(seed): out for seed, out in _SEED_OUTPUTS.items()}
     
     def __init__(self, verbose: bool = False):
         """
         Initialize the Math Engine Core.
         
         Args:
-            verbose: Enable verbose logging output (default: False)
-        """
-        self.verbose = verbose
-        self._configure_logging()
-    
-    def _configure_logging(self) -> None:
-        """Configure logging level based on verbosity setting."""
-        level = logging.DEBUG if self.verbose else logging.INFO
-        logging.basicConfig(
-            level=level,
-            format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-        )
-    
-    def _validate_seed(self, seed: str) -> Optional[SeedType]:
-        """
-        Validate and convert seed string to SeedType enum.
-        
-        Args:
-            seed: The seed string to validate
-            
-        Returns:
-            SeedType enum if valid, None otherwise
-        """
-        try:
-            return SeedType(seed)
-        except ValueError:
-            logger.warning(f"Invalid seed provided: {seed}")
-            return None
-    
-    def _process_seed(self, seed_type: SeedType) -> str:
-        """
-        Process a validated seed and return the appropriate output.
+            verbose: Enable debug output from this module's logger (default: False)
         
-        Args:
-            seed_type: The validated SeedType to process
-            
-        Returns:
-            The processed output string
+        Note:
+            Logging handlers are not configured here; applications own that
+            (see the ``__main__`` block).
         """
-        if seed_type == SeedType.ZERO_POSITIVE:
-            logger.info(self.POLARITY_ALIGNMENT_MSG)
-            logger.info(self.VECTOR_FIELD_MSG)
-            logger.info(self.HARMONIC_RESONANCE_MSG)
-            return self.OUTPUTS[seed_type]
-        
-        # Future seed types can be handled here
-        return self.INVALID_SEED_MSG
+        self.verbose = verbose
+        if verbose:
+            logger.setLevel(logging.DEBUG)
     
     def run_engine(self, seed: str) -> EngineResult:
         """
@@ -128,28 +112,16 @@ class MathEngineCore:
             spiral-encoded triad [∆⊛♡]
         """
         logger.info(self.SUBSTRATE_LOADING_MSG)
+        result = _run_seed(seed)
         
-        # Validate seed
-        seed_type = self._validate_seed(seed)
-        
-        if seed_type is None:
-            return EngineResult(
-                success=False,
-                output=self.INVALID_SEED_MSG,
-                metadata={'seed': seed, 'error': 'Invalid seed type'}
-            )
-        
-        # Process valid seed
-        output = self._process_seed(seed_type)
+        if result.success:
+            logger.info(self.POLARITY_ALIGNMENT_MSG)
+            logger.info(self.VECTOR_FIELD_MSG)
+            logger.info(self.HARMONIC_RESONANCE_MSG)
+        else:
+            logger.warning("Invalid seed provided: %s", seed)
         
-        return EngineResult(
-            success=True,
-            output=output,
-            metadata={
-                'seed': seed,
-                'seed_type': seed_type.value
-            }
-        )
+        return result
 
 
 # Legacy function for backward compatibility
@@ -167,8 +139,7 @@ def run_engine(seed: str) -> str:
         This function is maintained for backward compatibility.
         New code should use MathEngineCore class instead.
     """
-    engine = MathEngineCore()
-    result = engine.run_engine(seed)
+    result = _run_seed(seed)
     
     # Print logs for backward compatibility with original behavior
     print("Loading silent substrate...")
@@ -182,6 +153,11 @@ def run_engine(seed: str) -> str:
 
 # Example usage
 if __name__ == "__main__":
+    logging.basicConfig(
+        level=logging.DEBUG,
+        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+    )
+    
     # Using the new class-based approach
     engine = MathEngineCore(verbose=True)
     result = engine.run_engine('0+')
@@ -1,78 +1,85 @@
 """
 fb_math_engine.py – Symbolic and numerical math utilities for Foundation's Bridge
 """
-import sys
-from pathlib import Path
+import asyncio
+from concurrent.futures import Future, ThreadPoolExecutor
 
-# Simple re-export layer so we can import fb_math_engine directly
-from fbmathengine.__FBMathEngine__.fb_math_engine import *
+# Simple re-export layer so we can import fb_math_engine directly; the
+# canonical-path probing happens once, inside fb_math_engine_improved_v2.
+try:
+    from .fb_math_engine_improved_v2 import evaluate_expression, solve_equation
+except ImportError:
+    from fb_math_engine_improved_v2 import evaluate_expression, solve_equation
 
-import sys
-from pathlib import Path
 # AI bridge (OpenAI) – optional helper
 try:
-    from fb_api_client import ask_json  # our shared client
+    from fb_api_client import ask_json, aask_json  # our shared client
 except Exception:  # don’t crash the engine if missing
-    ask_json = None
-def explain_symbolic_step(expr_str: str) -> dict:
+    ask_json = aask_json = None
+
+# Rendered per call with .format; built once here rather than per f-string.
+_EXPLAIN_PROMPT = (
+    "Given the expression:\n{expr}\n\n"
+    "Return JSON with:\n"
+    "- steps: list of algebraic transformation steps (strings)\n"
+    "- invariants: list of preserved properties (e.g., identity, domain)\n"
+    "- result: the simplified final expression (string)"
+)
+_EXPLAIN_SCHEMA = '{"steps":["string"],"invariants":["string"],"result":"string"}'
+
+# Background workers for explain_symbolic_step; threads start on first submit.
+_BG_POOL = ThreadPoolExecutor(max_workers=4, thread_name_prefix="fb-explain")
+
+
+def _explain_fallback(expr_str: str) -> dict:
+    # Tiny deterministic explanation used when the AI bridge isn’t available.
+    simplified = evaluate_expression(expr_str, use_cache=True)
+    return {
+        "steps": [f"Simplified expression → {simplified}"],
+        "invariants": ["symbolic form preserved"],
+        "result": simplified,
+    }
+
+
+def explain_symbolic_step_sync(expr_str: str) -> dict:
     """
     AI-assisted explanation of algebraic steps for an expression.
     Returns a dict: {steps: [str], invariants: [str], result: str}
     Falls back to a deterministic SymPy-only explanation if API is unavailable.
+    Blocks for the network round-trip; see explain_symbolic_step for a Future.
     """
-    # If the AI bridge isn’t available, try a tiny deterministic fallback.
     if ask_json is None:
-        simplified = evaluate_expression(expr_str, use_cache=True)
-        return {
-            "steps": [f"Simplified expression → {simplified}"],
-            "invariants": ["symbolic form preserved"],
-            "result": simplified,
-        }
-
-    prompt = (
-        f"Given the expression:\n{expr_str}\n\n"
-        "Return JSON with:\n"
-        "- steps: list of algebraic transformation steps (strings)\n"
-        "- invariants: list of preserved properties (e.g., identity, domain)\n"
-        "- result: the simplified final expression (string)"
-    )
-
+        return _explain_fallback(expr_str)
     return ask_json(
-        prompt=prompt,
-        schema_hint='{"steps":["string"],"invariants":["string"],"result":"string"}',
+        prompt=_EXPLAIN_PROMPT.format(expr=expr_str),
+        schema_hint=_EXPLAIN_SCHEMA,
         temperature=0
     )
 
-# Add the canonical math_engine directory to the path
-canonical_path = Path(__file__).resolve().parent.parent / "FBMathEngine" / "math_engine"
-sys.path.insert(0, str(canonical_path))
 
-# Import the actual implementations from the canonical location
-try:
-    from fb_math_engine import evaluate_expression, solve_equation
-except ImportError:
-    # Fallback implementation if canonical module is not available
-    import sympy as sp
-    import numpy as np
+async def explain_symbolic_step_async(expr_str: str) -> dict:
+    """Async variant of explain_symbolic_step_sync, using the async client."""
+    if aask_json is None:
+        return await asyncio.to_thread(_explain_fallback, expr_str)
+    return await aask_json(
+        prompt=_EXPLAIN_PROMPT.format(expr=expr_str),
+        schema_hint=_EXPLAIN_SCHEMA,
+        temperature=0
+    )
+
 
-    def evaluate_expression(expr_str):
-        try:
-            expr = sp.sympify(expr_str)
-            simplified = sp.simplify(expr)
-            return str(simplified)
-        except Exception as e:
-            return f"Error: {e}"
+def explain_symbolic_step(expr_str: str) -> Future:
+    """
+    Start explain_symbolic_step_sync on a background thread and return its
+    Future, so callers can keep doing math work while the LLM call is in
+    flight. Call .result() on the Future for the dict.
+    """
+    return _BG_POOL.submit(explain_symbolic_step_sync, expr_str)
 
-    def solve_equation(equation_str, symbol_str="x"):
-        try:
-            x = sp.Symbol(symbol_str)
-            equation = sp.sympify(equation_str)
-            solutions = sp.solve(equation, x)
-            return [str(sol) for sol in solutions]
-        except Exception as e:
-            return [f"Error: {e}"]
 
 # Export the functions
-__all__ = ['evaluate_expression', 'solve_equation'
+__all__ = ['evaluate_expression', 'solve_equation',
 'explain_symbolic_step',
+'explain_symbolic_step_sync',
+'explain_symbolic_step_async',
 ]
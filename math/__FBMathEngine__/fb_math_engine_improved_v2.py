@@ -21,15 +21,20 @@ Example:
     ['-2', '2']
 """
 
+import builtins
 import logging
+import importlib.util
+import json
 import re
-import sys
+import sqlite3
 import threading
-from contextlib import contextmanager
+import types
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FuturesTimeoutError
 from dataclasses import dataclass
 from functools import lru_cache
 from pathlib import Path
-from typing import List, Optional, Tuple, Callable, Protocol
+from typing import Dict, List, Optional, Tuple, Callable, Protocol
 
 # Module metadata
 __version__ = "2.0.0"
@@ -75,6 +80,9 @@ class MathEngineConfig:
     cache_size: int = 128
     max_expression_length: int = 10000
     enable_validation: bool = True
+    allow_float_exponents: bool = False
+    enable_disk_cache: bool = False
+    disk_cache_path: Optional[str] = None
     log_level: str = "INFO"
 
 
@@ -92,10 +100,13 @@ def configure(config: MathEngineConfig) -> None:
     global _config
     _config = config
     
+    # Reopen the disk cache lazily in case its path changed
+    _close_disk_cache()
+    
     # Update logger level
     logger.setLevel(getattr(logging, config.log_level.upper()))
     
-    logger.info(f"Math engine configured: {config}")
+    logger.info("Math engine configured: %s", config)
 
 
 def get_config() -> MathEngineConfig:
@@ -123,25 +134,78 @@ class SolveFunction(Protocol):
 
 _sympy = None
 
+# Hot-path SymPy callables, bound once by _get_sympy() so the fallback
+# implementations call them directly instead of going through the module.
+_SYMPIFY = None
+_SIMPLIFY = None
+_SYMBOL = None
+_SOLVE = None
+_SYMPIFY_ERROR = None
+_SREPR = None
+
+# parse_expr with a namespace built once: SymPy's public names plus the
+# side-effect-free builtin functions parse_expr itself would expose, so names
+# like open or __import__ parse as undefined functions instead of resolving
+# to the real thing.
+_PARSE_EXPR = None
+_PARSE_GLOBALS = None
+_UNSAFE_BUILTINS = frozenset({
+    "__build_class__", "__import__", "aiter", "anext", "breakpoint", "compile",
+    "delattr", "dir", "eval", "exec", "getattr", "globals", "hasattr", "input",
+    "locals", "open", "print", "setattr", "vars",
+})
+_TRANSFORMATIONS = None
+_TRIG_FUNCTION = None
+
 
 def _get_sympy():
     """
     Lazy load SymPy only when needed.
     
+    On first load this also binds the callables used on hot paths
+    (``sympify``, ``simplify``, ``Symbol``, ``solve``, ``srepr`` and
+    ``SympifyError``) to module-level names.
+    
     Returns:
         SymPy module
         
     Raises:
         ImportError: If SymPy is not available
     """
-    global _sympy
+    global _sympy, _SYMPIFY, _SIMPLIFY, _SYMBOL, _SOLVE, _SYMPIFY_ERROR, _SREPR
+    global _PARSE_EXPR, _PARSE_GLOBALS, _TRANSFORMATIONS, _TRIG_FUNCTION
     if _sympy is None:
         try:
             import sympy as sp
+            from sympy.parsing.sympy_parser import parse_expr, standard_transformations
+            namespace = {}
+            exec("from sympy import *", namespace)
+            # Mirror parse_expr's own namespace: builtin functions such as
+            # abs/pow/round map to themselves, max/min to Max/Min. Builtins
+            # that reach the interpreter or I/O are left out so they parse
+            # as undefined functions.
+            for name, obj in vars(builtins).items():
+                if (isinstance(obj, types.BuiltinFunctionType)
+                        and name not in _UNSAFE_BUILTINS):
+                    namespace[name] = obj
+            namespace["__builtins__"] = {}
+            namespace["max"] = sp.Max
+            namespace["min"] = sp.Min
+            _PARSE_EXPR = parse_expr
+            _PARSE_GLOBALS = namespace
+            _TRANSFORMATIONS = tuple(standard_transformations)
+            from sympy.functions.elementary.trigonometric import TrigonometricFunction
+            _TRIG_FUNCTION = TrigonometricFunction
+            _SYMPIFY = sp.sympify
+            _SIMPLIFY = sp.simplify
+            _SYMBOL = sp.Symbol
+            _SOLVE = sp.solve
+            _SYMPIFY_ERROR = sp.SympifyError
+            _SREPR = sp.srepr
             _sympy = sp
             logger.debug("SymPy loaded successfully")
         except ImportError as e:
-            logger.error(f"SymPy not available: {e}")
+            logger.error("SymPy not available: %s", e)
             raise ImportError(
                 "SymPy is required for fallback implementations. "
                 "Install it with: pip install sympy"
@@ -149,10 +213,162 @@ def _get_sympy():
     return _sympy
 
 
+def _parse(expr_str: str):
+    """
+    Parse an expression string with the prebuilt SymPy namespace.
+    
+    ``sympify`` rebuilds its namespace with ``from sympy import *`` on every
+    call; reusing one dictionary is several times faster for small inputs.
+    On any parse failure this defers to ``sympify``, so error types and
+    messages are unchanged.
+    
+    Requires ``_get_sympy()`` to have been called.
+    """
+    try:
+        return _PARSE_EXPR(
+            expr_str,
+            transformations=_TRANSFORMATIONS,
+            global_dict=_PARSE_GLOBALS,
+        )
+    except Exception:
+        return _SYMPIFY(expr_str)
+
+
+# ============================================================================
+# Lazy SymEngine Import (optional accelerator)
+# ============================================================================
+
+_symengine = None
+_symengine_checked = False
+
+
+def _get_symengine():
+    """
+    Lazy load SymEngine if it is installed.
+    
+    SymEngine's C++ core parses and manipulates expressions far faster than
+    SymPy, but has no simplify/solve, so it only serves exact fast paths.
+    
+    Returns:
+        SymEngine module, or None if it is not available
+    """
+    global _symengine, _symengine_checked
+    if not _symengine_checked:
+        _symengine_checked = True
+        try:
+            import symengine as se
+            _symengine = se
+            logger.debug("SymEngine loaded successfully")
+        except ImportError:
+            logger.debug("SymEngine not available, using SymPy only")
+    return _symengine
+
+
+_numba = None
+_numba_checked = False
+
+
+def _get_numba():
+    """
+    Lazy load Numba if it is installed.
+    
+    Returns:
+        Numba module, or None if it is not available
+    """
+    global _numba, _numba_checked
+    if not _numba_checked:
+        _numba_checked = True
+        try:
+            import numba
+            _numba = numba
+            logger.debug("Numba loaded successfully")
+        except ImportError:
+            logger.debug("Numba not available, numeric kernels stay in NumPy")
+    return _numba
+
+
+# SymEngine's string parser segfaults on some operators (e.g. &, |, ~), so
+# only plain arithmetic is handed to it; everything else goes to SymPy.
+_SYMENGINE_SAFE_RE = re.compile(r"[A-Za-z0-9.+\-*/()\s]*")
+
+
+def _symengine_safe(expr_str: str) -> bool:
+    """Return True if SymEngine can be given expr_str to parse."""
+    return _SYMENGINE_SAFE_RE.fullmatch(expr_str) is not None
+
+
+def _symengine_parse(expr_str: str):
+    """Parse with SymEngine, or return None when SymPy must handle the input."""
+    se = _get_symengine()
+    if se is None or not _symengine_safe(expr_str):
+        return None
+    try:
+        return se.sympify(expr_str)
+    except Exception:
+        return None
+
+
+def _symengine_evaluate(expr_str: str) -> Optional[str]:
+    """
+    Fast path for expressions that reduce to an exact rational number.
+    
+    Returns:
+        The value as a string (formatted exactly as SymPy would), or None
+        if the expression needs the full SymPy simplifier
+    """
+    expr = _symengine_parse(expr_str)
+    if expr is not None and expr.is_Rational:
+        return str(expr)
+    return None
+
+
+def _symengine_solve_linear(equation_str: str, symbol_str: str) -> Optional[Tuple[str, ...]]:
+    """
+    Fast path for equations of the form a*x + b with rational a != 0, b.
+    
+    Returns:
+        Single-element solution tuple, or None if SymPy must solve it
+    """
+    expr = _symengine_parse(equation_str)
+    if expr is None:
+        return None
+    try:
+        se = _symengine
+        x = se.Symbol(symbol_str)
+        expr = se.expand(expr)
+        a = expr.diff(x)
+        b = expr.subs({x: 0})
+        if not (a.is_Rational and b.is_Rational) or a == 0:
+            return None
+        if se.expand(expr - (a * x + b)) != 0:  # not actually linear in x
+            return None
+        return (str(-b / a),)
+    except Exception:
+        return None
+
+
 # ============================================================================
 # Input Validation
 # ============================================================================
 
+# Potentially dangerous input, fused into one pattern compiled at import
+_DANGEROUS_PATTERNS = (
+    r'__import__',
+    r'eval\s*\(',
+    r'exec\s*\(',
+    r'compile\s*\(',
+    r'open\s*\(',
+    r'file\s*\(',
+    r'input\s*\(',
+    r'__\w+__',  # dunder methods/attributes
+)
+_DANGEROUS_RE = re.compile("|".join(_DANGEROUS_PATTERNS), re.IGNORECASE)
+
+# Every pattern above needs an underscore or an opening parenthesis, so
+# input without either (plain arithmetic) cannot match and skips the scan.
+_DANGEROUS_TRIGGERS = ("_", "(")
+
+
 def _validate_expression(expr_str: str) -> None:
     """
     Validate expression string for safety.
@@ -166,30 +382,27 @@ def _validate_expression(expr_str: str) -> None:
     if not _config.enable_validation:
         return
     
-    # Check for dangerous patterns
-    dangerous_patterns = [
-        r'__import__',
-        r'eval\s*\(',
-        r'exec\s*\(',
-        r'compile\s*\(',
-        r'open\s*\(',
-        r'file\s*\(',
-        r'input\s*\(',
-        r'__\w+__',  # dunder methods/attributes
-    ]
-    
-    for pattern in dangerous_patterns:
-        if re.search(pattern, expr_str, re.IGNORECASE):
-            raise ValidationError(
-                f"Expression contains potentially dangerous pattern: {pattern}"
-            )
-    
-    # Check for maximum length to prevent DoS
+    # Check for maximum length first so oversized input fails fast (DoS guard)
     if len(expr_str) > _config.max_expression_length:
         raise ValidationError(
             f"Expression exceeds maximum allowed length of "
             f"{_config.max_expression_length} characters"
         )
+    
+    if "\x00" in expr_str:
+        raise ValidationError("Expression contains a null byte")
+    
+    # The restricted parser namespace has no unsafe builtins, but eval() without
+    # builtins is not a sandbox (attribute chains on literals still reach
+    # object internals), and the canonical engine gets the raw string. So
+    # the scan stays, but only runs when a pattern could possibly match.
+    if not any(t in expr_str for t in _DANGEROUS_TRIGGERS):
+        return
+    match = _DANGEROUS_RE.search(expr_str)
+    if match:
+        raise ValidationError(
+            f"Expression contains potentially dangerous pattern: {match.group(0)}"
+        )
 
 
 def validate_expression(expr_str: str) -> Tuple[bool, Optional[str]]:
@@ -213,8 +426,8 @@ def validate_expression(expr_str: str) -> Tuple[bool, Optional[str]]:
         _validate_expression(expr_str)
         
         # Try to parse (but don't evaluate)
-        sp = _get_sympy()
-        sp.sympify(expr_str)
+        _get_sympy()
+        _parse(expr_str)
         
         return True, None
     except Exception as e:
@@ -230,6 +443,51 @@ class TimeoutError(MathEngineError):
     pass
 
 
+# Reused worker threads for timed operations; a fresh thread per call cost
+# more than many short evaluations themselves.
+_TIMEOUT_POOL: Optional[ThreadPoolExecutor] = None
+_timeout_pool_lock = threading.Lock()
+
+
+def _get_timeout_pool() -> ThreadPoolExecutor:
+    """Return the shared timeout pool, creating it on first use."""
+    global _TIMEOUT_POOL
+    with _timeout_pool_lock:
+        if _TIMEOUT_POOL is None:
+            _TIMEOUT_POOL = ThreadPoolExecutor(
+                max_workers=2, thread_name_prefix="fb-math-timeout"
+            )
+        return _TIMEOUT_POOL
+
+
+def _retire_timeout_pool(pool: ThreadPoolExecutor) -> None:
+    """
+    Drop a pool whose worker is stuck on a timed-out task.
+    
+    Threads cannot be killed, so the next call gets a fresh pool instead of
+    queueing behind the runaway computation.
+    """
+    global _TIMEOUT_POOL
+    with _timeout_pool_lock:
+        if _TIMEOUT_POOL is pool:
+            _TIMEOUT_POOL = None
+    pool.shutdown(wait=False, cancel_futures=True)
+
+
+def shutdown_timeout_pool(wait: bool = True) -> None:
+    """
+    Shut down the worker pool used for timeouts.
+    
+    Args:
+        wait: Whether to wait for running operations to finish
+    """
+    global _TIMEOUT_POOL
+    with _timeout_pool_lock:
+        pool, _TIMEOUT_POOL = _TIMEOUT_POOL, None
+    if pool is not None:
+        pool.shutdown(wait=wait, cancel_futures=True)
+
+
 def _run_with_timeout(func: Callable, args: tuple, timeout_seconds: int):
     """
     Run a function with timeout (cross-platform).
@@ -245,60 +503,22 @@ def _run_with_timeout(func: Callable, args: tuple, timeout_seconds: int):
     Raises:
         TimeoutError: If function exceeds timeout
     """
-    result = [None]
-    exception = [None]
-    
-    def worker():
-        try:
-            result[0] = func(*args)
-        except Exception as e:
-            exception[0] = e
-    
-    thread = threading.Thread(target=worker)
-    thread.daemon = True
-    thread.start()
-    thread.join(timeout_seconds)
-    
-    if thread.is_alive():
+    pool = _get_timeout_pool()
+    future = pool.submit(func, *args)
+    try:
+        return future.result(timeout=timeout_seconds)
+    except FuturesTimeoutError:
+        if not future.cancel():
+            _retire_timeout_pool(pool)
         raise TimeoutError(
             f"Operation exceeded {timeout_seconds} second timeout"
-        )
-    
-    if exception[0]:
-        raise exception[0]
-    
-    return result[0]
+        ) from None
 
 
 # ============================================================================
 # Canonical Path Resolution
 # ============================================================================
 
-@contextmanager
-def _temporary_path_modification(path: Path):
-    """
-    Context manager for temporarily modifying sys.path.
-    
-    Ensures sys.path is restored even if an exception occurs during import.
-    
-    Args:
-        path: Path to temporarily add to sys.path
-        
-    Yields:
-        None
-    """
-    path_str = str(path)
-    sys.path.insert(0, path_str)
-    try:
-        yield
-    finally:
-        try:
-            sys.path.remove(path_str)
-        except ValueError:
-            # Path was already removed or never added
-            pass
-
-
 def _get_canonical_path() -> Optional[Path]:
     """
     Calculate the canonical math engine path with validation.
@@ -317,12 +537,12 @@ def _get_canonical_path() -> Optional[Path]:
             return canonical_path
         else:
             logger.warning(
-                f"Canonical math engine path not found: {canonical_path}"
+                "Canonical math engine path not found: %s", canonical_path
             )
             return None
             
     except (OSError, RuntimeError) as e:
-        logger.error(f"Error determining canonical path: {e}")
+        logger.error("Error determining canonical path: %s", e)
         return None
 
 
@@ -340,29 +560,67 @@ def _try_import_canonical() -> Tuple[Optional[EvaluateFunction], Optional[SolveF
         logger.info("Using fallback implementations (canonical path not found)")
         return None, None
     
+    module_path = canonical_path / "fb_math_engine.py"
+    
     try:
-        with _temporary_path_modification(canonical_path):
-            # Import from canonical location
-            # Note: This imports a different module, not this file
-            from fb_math_engine import evaluate_expression, solve_equation
-            
-            logger.info("Successfully imported from canonical location")
-            return evaluate_expression, solve_equation
+        # Load the canonical file directly under a private name, so sys.path
+        # is left alone and it cannot collide with this package's own
+        # fb_math_engine module.
+        spec = importlib.util.spec_from_file_location(
+            "_fb_math_engine_canonical", module_path
+        )
+        if spec is None or spec.loader is None:
+            raise ImportError(f"Cannot load canonical module from {module_path}")
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+        
+        logger.info("Successfully imported from canonical location")
+        return module.evaluate_expression, module.solve_equation
             
-    except ImportError as e:
+    except (ImportError, FileNotFoundError, AttributeError) as e:
         logger.info(
-            f"Canonical module not available, using fallback: {e}"
+            "Canonical module not available, using fallback: %s", e
         )
         return None, None
     except Exception as e:
         logger.warning(
-            f"Unexpected error importing canonical module: {e}"
+            "Unexpected error importing canonical module: %s", e
         )
         return None, None
 
 
-# Attempt to import from canonical location
-_canonical_eval, _canonical_solve = _try_import_canonical()
+@lru_cache(maxsize=None)
+def _resolve_canonical_once() -> Tuple[Optional[EvaluateFunction], Optional[SolveFunction]]:
+    """
+    Probe for and import the canonical implementation once per process.
+    
+    The legacy ``fb_math_engine`` and ``fb_math_engine_improved`` modules
+    re-export from this one, so the filesystem probing and module loading
+    happen here and nowhere else.
+    
+    Returns:
+        Tuple of (evaluate_expression, solve_equation), or (None, None)
+    """
+    return _try_import_canonical()
+
+
+# Sentinel for "canonical location not probed yet"; resolution is deferred
+# to the first evaluate/solve call so importing this module does no
+# filesystem work.
+_UNRESOLVED = object()
+_canonical_eval = _UNRESOLVED
+_canonical_solve = _UNRESOLVED
+
+
+def _ensure_canonical() -> None:
+    """Resolve the canonical implementation on first use."""
+    global _canonical_eval, _canonical_solve
+    if _canonical_eval is _UNRESOLVED:
+        _canonical_eval, _canonical_solve = _resolve_canonical_once()
+        if _canonical_eval is not None:
+            logger.info("Math engine using canonical implementations")
+        else:
+            logger.info("Math engine using fallback implementations")
 
 
 # ============================================================================
@@ -382,18 +640,43 @@ def _fallback_evaluate_expression_impl(expr_str: str) -> str:
     Raises:
         ExpressionError: If evaluation fails
     """
+    fast = _symengine_evaluate(expr_str)
+    if fast is not None:
+        return fast
+    
+    if _SYMPIFY is None:
+        _get_sympy()
+    
     try:
-        sp = _get_sympy()
+        expr = _parse(expr_str)
+        # Relationals and logic (which may parse to a plain bool) have no
+        # algebraic shortcut; leave them to simplify().
+        if not isinstance(expr, _sympy.Expr):
+            return str(_SIMPLIFY(expr))
+
+        # Numbers, symbols and constants are already in simplest form;
+        # skip simplify()'s heuristic search for them.
+        if expr.is_Atom:
+            return str(expr)
+        
+        # Polynomials with exact coefficients: factor() gives the canonical
+        # factored form in polynomial time.
+        free = expr.free_symbols
+        if free and not expr.has(_sympy.Float) and expr.is_polynomial(*free):
+            return str(_sympy.factor(expr))
+        
+        # Purely trigonometric expressions only need trigsimp's rewrites.
+        funcs = expr.atoms(_sympy.Function)
+        if funcs and all(isinstance(f, _TRIG_FUNCTION) for f in funcs):
+            return str(_sympy.trigsimp(expr))
         
-        expr = sp.sympify(expr_str)
-        simplified = sp.simplify(expr)
-        return str(simplified)
+        return str(_SIMPLIFY(expr))
         
-    except sp.SympifyError as e:
-        logger.error(f"Invalid expression syntax: {e}")
+    except _SYMPIFY_ERROR as e:
+        logger.error("Invalid expression syntax: %s", e)
         raise ExpressionError(f"Invalid expression syntax: {e}") from e
     except (ValueError, TypeError, AttributeError) as e:
-        logger.error(f"Expression evaluation failed: {type(e).__name__}: {e}")
+        logger.error("Expression evaluation failed: %s: %s", type(e).__name__, e)
         raise ExpressionError(f"Expression evaluation failed: {e}") from e
 
 
@@ -418,11 +701,76 @@ def _fallback_evaluate_expression(expr_str: str) -> str:
             _config.timeout_seconds
         )
     except TimeoutError as e:
-        logger.error(f"Expression evaluation timed out: {e}")
+        logger.error("Expression evaluation timed out: %s", e)
         raise
 
 
-def _fallback_solve_equation_impl(equation_str: str, symbol_str: str) -> List[str]:
+def _rationalize_float_exponents(equation):
+    """
+    Reject or rationalize float exponents before handing an equation to solve.
+    
+    SymPy converts an exponent like ``5.43`` into a huge-denominator rational
+    and can spend effectively unbounded time factoring the resulting
+    high-degree polynomial. By default such equations are rejected; with
+    ``allow_float_exponents`` each float exponent is replaced by a nearby
+    rational with denominator at most 100.
+    
+    Raises:
+        EquationError: If a float exponent is present and not allowed
+    """
+    float_exps = {p.exp for p in equation.atoms(_sympy.Pow) if p.exp.is_Float}
+    if not float_exps:
+        return equation
+    if not _config.allow_float_exponents:
+        raise EquationError(
+            "Float exponents are not supported; use a Rational exponent "
+            "or enable allow_float_exponents"
+        )
+    return equation.xreplace({
+        f: _sympy.Rational(str(f)).limit_denominator(100) for f in float_exps
+    })
+
+
+def _linear_roots(a, b):
+    """Root of a*x + b."""
+    return [-b / a]
+
+
+def _quadratic_roots(a, b, c):
+    """Roots of a*x**2 + b*x + c by the quadratic formula."""
+    disc = b * b - 4 * a * c
+    if disc == 0:
+        return [-b / (2 * a)]
+    root = _sympy.sqrt(disc)
+    return [(-b - root) / (2 * a), (-b + root) / (2 * a)]
+
+
+# Closed-form solvers keyed by the shape "polynomial of degree n in the
+# solve symbol with rational coefficients". Ordered with default_sort_key,
+# their output matches sp.solve exactly for these shapes.
+_CLOSED_FORM_SOLVERS = {
+    1: _linear_roots,
+    2: _quadratic_roots,
+}
+
+
+def _solve_closed_form(equation, symbol) -> Optional[list]:
+    """
+    Solve equations of a known closed-form shape without calling sp.solve.
+    
+    Returns:
+        Sorted list of SymPy roots, or None if the shape is not covered
+    """
+    if equation.free_symbols != {symbol} or not equation.is_polynomial(symbol):
+        return None
+    coeffs = _sympy.Poly(equation, symbol).all_coeffs()
+    solver = _CLOSED_FORM_SOLVERS.get(len(coeffs) - 1)
+    if solver is None or not all(c.is_Rational for c in coeffs):
+        return None
+    return sorted(solver(*coeffs), key=_sympy.default_sort_key)
+
+
+def _fallback_solve_equation_impl(equation_str: str, symbol_str: str) -> Tuple[str, ...]:
     """
     Internal implementation for equation solving using SymPy.
     
@@ -431,40 +779,48 @@ def _fallback_solve_equation_impl(equation_str: str, symbol_str: str) -> List[st
         symbol_str: Symbol to solve for
     
     Returns:
-        List of solutions as strings
+        Tuple of solutions as strings
         
     Raises:
         EquationError: If solving fails
     """
+    fast = _symengine_solve_linear(equation_str, symbol_str)
+    if fast is not None:
+        return fast
+    
+    if _SYMPIFY is None:
+        _get_sympy()
+    
     try:
-        sp = _get_sympy()
-        
         # Create symbol
-        symbol = sp.Symbol(symbol_str)
+        symbol = _SYMBOL(symbol_str)
         
         # Parse equation
-        equation = sp.sympify(equation_str)
+        equation = _parse(equation_str)
+        equation = _rationalize_float_exponents(equation)
         
-        # Solve equation
-        solutions = sp.solve(equation, symbol)
+        # Solve equation, in closed form when its shape allows
+        solutions = _solve_closed_form(equation, symbol)
+        if solutions is None:
+            solutions = _SOLVE(equation, symbol)
         
         # Convert solutions to strings
-        result = [str(sol) for sol in solutions]
+        result = tuple(str(sol) for sol in solutions)
         
         if not result:
-            logger.info(f"No solutions found for equation: {equation_str}")
+            logger.info("No solutions found for equation: %s", equation_str)
         
         return result
         
-    except sp.SympifyError as e:
-        logger.error(f"Invalid equation syntax: {e}")
+    except _SYMPIFY_ERROR as e:
+        logger.error("Invalid equation syntax: %s", e)
         raise EquationError(f"Invalid equation syntax: {e}") from e
     except (ValueError, TypeError, AttributeError) as e:
-        logger.error(f"Equation solving failed: {type(e).__name__}: {e}")
+        logger.error("Equation solving failed: %s: %s", type(e).__name__, e)
         raise EquationError(f"Equation solving failed: {e}") from e
 
 
-def _fallback_solve_equation(equation_str: str, symbol_str: str) -> List[str]:
+def _fallback_solve_equation(equation_str: str, symbol_str: str) -> Tuple[str, ...]:
     """
     Fallback implementation for equation solving with timeout.
     
@@ -473,7 +829,7 @@ def _fallback_solve_equation(equation_str: str, symbol_str: str) -> List[str]:
         symbol_str: Symbol to solve for
     
     Returns:
-        List of solutions as strings
+        Tuple of solutions as strings
         
     Raises:
         EquationError: If solving fails
@@ -486,7 +842,7 @@ def _fallback_solve_equation(equation_str: str, symbol_str: str) -> List[str]:
             _config.timeout_seconds
         )
     except TimeoutError as e:
-        logger.error(f"Equation solving timed out: {e}")
+        logger.error("Equation solving timed out: %s", e)
         raise
 
 
@@ -494,22 +850,148 @@ def _fallback_solve_equation(equation_str: str, symbol_str: str) -> List[str]:
 # Cached Implementations
 # ============================================================================
 
-@lru_cache(maxsize=128)
+# Bounded LRU caches keyed on the canonical form of the parsed input, so
+# cosmetic variants ("x+1", " x + 1 ", "1+x") share one entry.
+_EVAL_CACHE: "OrderedDict[str, str]" = OrderedDict()
+_SOLVE_CACHE: "OrderedDict[Tuple[str, str], tuple]" = OrderedDict()
+_cache_lock = threading.Lock()
+
+
+def _cache_get(cache: OrderedDict, key):
+    """Return the cached value for key (marking it recently used) or None."""
+    with _cache_lock:
+        value = cache.get(key)
+        if value is not None:
+            cache.move_to_end(key)
+        return value
+
+
+def _cache_put(cache: OrderedDict, key, value) -> None:
+    """Store value under key, evicting least recently used entries."""
+    with _cache_lock:
+        cache[key] = value
+        cache.move_to_end(key)
+        while len(cache) > _config.cache_size:
+            cache.popitem(last=False)
+
+
+# Persistent solve cache (opt-in via enable_disk_cache). sp.solve on a
+# nontrivial polynomial can take seconds; this keeps results across runs.
+_DEFAULT_DISK_CACHE_PATH = Path.home() / ".fb_math_cache.sqlite"
+_disk_cache: Optional[sqlite3.Connection] = None
+_disk_cache_lock = threading.Lock()
+
+
+def _disk_cache_singleton() -> sqlite3.Connection:
+    """Open (and create if needed) the on-disk solve cache."""
+    global _disk_cache
+    if _disk_cache is None:
+        path = _config.disk_cache_path or _DEFAULT_DISK_CACHE_PATH
+        _disk_cache = sqlite3.connect(
+            str(path), isolation_level=None, check_same_thread=False
+        )
+        _disk_cache.execute(
+            "CREATE TABLE IF NOT EXISTS solve (key TEXT PRIMARY KEY, val TEXT NOT NULL)"
+        )
+    return _disk_cache
+
+
+def _disk_cache_get(key: str) -> Optional[tuple]:
+    """Return the stored solutions for key, or None on a miss or error."""
+    try:
+        with _disk_cache_lock:
+            row = _disk_cache_singleton().execute(
+                "SELECT val FROM solve WHERE key = ?", (key,)
+            ).fetchone()
+    except sqlite3.Error as e:
+        logger.warning("Disk cache read failed: %s", e)
+        return None
+    return tuple(json.loads(row[0])) if row else None
+
+
+def _disk_cache_put(key: str, value: tuple) -> None:
+    """Store solutions for key; failures are logged and otherwise ignored."""
+    try:
+        with _disk_cache_lock:
+            _disk_cache_singleton().execute(
+                "INSERT OR REPLACE INTO solve (key, val) VALUES (?, ?)",
+                (key, json.dumps(value)),
+            )
+    except sqlite3.Error as e:
+        logger.warning("Disk cache write failed: %s", e)
+
+
+def _close_disk_cache() -> None:
+    """Close the on-disk cache connection if it is open."""
+    global _disk_cache
+    with _disk_cache_lock:
+        if _disk_cache is not None:
+            _disk_cache.close()
+            _disk_cache = None
+
+
+def _canonical_key(expr_str: str, expand: bool = False) -> str:
+    """
+    Canonical cache key for an expression: the srepr of its parsed form.
+    
+    With ``expand=True`` the parsed form is expanded first, so products and
+    sums of the same polynomial (``(x-2)*(x+2)`` and ``x**2 - 4``) share a
+    key. That is right for solving, where only the roots matter, but not for
+    evaluation, whose output depends on the input's form.
+    
+    Falls back to the raw string when it cannot be parsed, leaving the
+    evaluation itself to report the error.
+    """
+    try:
+        if _SREPR is None:
+            _get_sympy()
+        expr = _parse(expr_str)
+        if expand:
+            expr = _sympy.expand(expr)
+        return _SREPR(expr)
+    except Exception:
+        return expr_str
+
+
 def _cached_evaluate_expression(expr_str: str) -> str:
     """Cached version of expression evaluation."""
+    key = _canonical_key(expr_str)
+    cached = _cache_get(_EVAL_CACHE, key)
+    if cached is not None:
+        return cached
+    
     if _canonical_eval is not None:
-        return _canonical_eval(expr_str)
-    return _fallback_evaluate_expression(expr_str)
+        result = _canonical_eval(expr_str)
+    else:
+        result = _fallback_evaluate_expression(expr_str)
+    _cache_put(_EVAL_CACHE, key, result)
+    return result
 
 
-@lru_cache(maxsize=128)
 def _cached_solve_equation(equation_str: str, symbol_str: str) -> tuple:
-    """Cached version of equation solving. Returns tuple for hashability."""
+    """Cached version of equation solving. Returns tuple for immutability."""
+    key = (_canonical_key(equation_str, expand=True), symbol_str)
+    cached = _cache_get(_SOLVE_CACHE, key)
+    if cached is not None:
+        return cached
+    
+    disk_key = json.dumps(key) if _config.enable_disk_cache else None
+    if disk_key is not None:
+        cached = _disk_cache_get(disk_key)
+        if cached is not None:
+            _cache_put(_SOLVE_CACHE, key, cached)
+            return cached
+    
     if _canonical_solve is not None:
         result = _canonical_solve(equation_str, symbol_str)
     else:
         result = _fallback_solve_equation(equation_str, symbol_str)
-    return tuple(result)  # Convert list to tuple for caching
+    if not isinstance(result, tuple):
+        result = tuple(result)
+    _cache_put(_SOLVE_CACHE, key, result)
+    if disk_key is not None:
+        _disk_cache_put(disk_key, result)
+    return result
 
 
 # ============================================================================
@@ -555,6 +1037,7 @@ def evaluate_expression(expr_str: str, use_cache: bool = True) -> str:
         raise ValueError("Expression string must be a non-empty string")
     
     _validate_expression(expr_str)
+    _ensure_canonical()
     
     if use_cache:
         return _cached_evaluate_expression(expr_str)
@@ -612,6 +1095,7 @@ def solve_equation(
         raise ValueError("Symbol must be a non-empty string")
     
     _validate_expression(equation_str)
+    _ensure_canonical()
     
     if use_cache:
         return list(_cached_solve_equation(equation_str, symbol_str))
@@ -619,7 +1103,147 @@ def solve_equation(
     if _canonical_solve is not None:
         return _canonical_solve(equation_str, symbol_str)
     
-    return _fallback_solve_equation(equation_str, symbol_str)
+    return list(_fallback_solve_equation(equation_str, symbol_str))
+
+
+def evaluate_expressions(
+    expr_strs: List[str],
+    subs: Optional[Dict[str, float]] = None
+) -> List[str]:
+    """
+    Evaluate a batch of expressions.
+    
+    This is the preferred entry point when evaluating many expressions in a
+    loop. With ``subs``, the expressions are parsed once and compiled into a
+    single numeric function (SymEngine ``Lambdify`` when available, SymPy
+    ``lambdify`` otherwise), with common subexpressions shared across the
+    batch. Without ``subs``, each expression is simplified as by
+    :func:`evaluate_expression`, sharing its cache.
+    
+    Args:
+        expr_strs: Expressions to evaluate
+        subs: Optional mapping of symbol name to numeric value
+    
+    Returns:
+        List of results as strings, in input order
+        
+    Raises:
+        ValueError: If any expression is empty or not a string
+        ValidationError: If any expression contains dangerous patterns
+        ExpressionError: If parsing or numeric evaluation fails
+        
+    Examples:
+        >>> evaluate_expressions(["x**2 + y", "x*y"], subs={"x": 2, "y": 3})
+        ['7.0', '6.0']
+    """
+    for expr_str in expr_strs:
+        if not expr_str or not isinstance(expr_str, str):
+            raise ValueError("Expression string must be a non-empty string")
+        _validate_expression(expr_str)
+    
+    if not subs:
+        return [evaluate_expression(expr_str) for expr_str in expr_strs]
+    if not expr_strs:
+        return []
+    
+    names = list(subs)
+    values = [subs[name] for name in names]
+    
+    se = _get_symengine()
+    if se is not None:
+        try:
+            args = [se.Symbol(name) for name in names]
+            # Anything beyond plain arithmetic is parsed by SymPy first
+            if not all(_symengine_safe(expr_str) for expr_str in expr_strs):
+                _get_sympy()
+            exprs = [
+                se.sympify(expr_str if _symengine_safe(expr_str) else _parse(expr_str))
+                for expr_str in expr_strs
+            ]
+            try:
+                fn = se.Lambdify(args, exprs, backend="llvm", cse=True)
+            except (ValueError, RuntimeError, TypeError):
+                # SymEngine built without LLVM support
+                fn = se.Lambdify(args, exprs, cse=True)
+            return [str(value) for value in fn(values)]
+        except Exception as e:
+            logger.debug("SymEngine batch evaluation failed, using SymPy: %s", e)
+    
+    sp = _get_sympy()
+    try:
+        args = [sp.Symbol(name) for name in names]
+        exprs = [_parse(expr_str) for expr_str in expr_strs]
+        fn = sp.lambdify(args, exprs, cse=True)
+        return [str(value) for value in fn(*values)]
+    except _SYMPIFY_ERROR as e:
+        logger.error("Invalid expression syntax: %s", e)
+        raise ExpressionError(f"Invalid expression syntax: {e}") from e
+    except (ValueError, TypeError, ArithmeticError, NameError) as e:
+        logger.error("Batch evaluation failed: %s: %s", type(e).__name__, e)
+        raise ExpressionError(f"Batch evaluation failed: {e}") from e
+
+
+# Compiled numeric kernels keyed on (srepr, params)
+_NUMERIC_CACHE: Dict[Tuple[str, Tuple[str, ...]], Callable] = {}
+
+
+def compile_numeric(expr_str: str, params: List[str]) -> Callable:
+    """
+    Compile an expression into a fast numeric function of ``params``.
+    
+    The expression is lambdified against NumPy with common subexpressions
+    eliminated and, when Numba is installed, JIT-compiled with
+    ``numba.njit(fastmath=True)``. The returned function accepts scalars or
+    NumPy arrays, so one call can evaluate a whole grid of substitutions.
+    Compiled functions are cached per expression and parameter list.
+    
+    Args:
+        expr_str: Expression to compile
+        params: Symbol names, in the order the function takes them
+    
+    Returns:
+        Callable taking one positional argument per parameter
+        
+    Raises:
+        ValueError: If expr_str is empty or not a string
+        ValidationError: If expr_str contains dangerous patterns
+        ExpressionError: If the expression cannot be parsed
+        
+    Example:
+        >>> f = compile_numeric("sin(x)*y + x**2", ["x", "y"])
+        >>> f(np.linspace(0, 1, 1000), 2.0)
+        
+    Note:
+        With Numba, the first call for each argument type pays a one-off
+        compilation cost (typically 100 ms to 1 s), and the kernel is not
+        cached on disk because lambdified functions have no source file.
+        It only pays off when called on large arrays or many times.
+        Without Numba, the NumPy function is returned as-is.
+    """
+    if not expr_str or not isinstance(expr_str, str):
+        raise ValueError("Expression string must be a non-empty string")
+    _validate_expression(expr_str)
+    
+    sp = _get_sympy()
+    try:
+        expr = _parse(expr_str)
+    except _SYMPIFY_ERROR as e:
+        raise ExpressionError(f"Invalid expression syntax: {e}") from e
+    
+    key = (_SREPR(expr), tuple(params))
+    with _cache_lock:
+        fn = _NUMERIC_CACHE.get(key)
+    if fn is not None:
+        return fn
+    
+    fn = sp.lambdify([_SYMBOL(p) for p in params], expr, modules="numpy", cse=True)
+    numba = _get_numba()
+    if numba is not None:
+        fn = numba.njit(fn, fastmath=True)
+    
+    with _cache_lock:
+        _NUMERIC_CACHE[key] = fn
+    return fn
 
 
 def clear_cache() -> None:
@@ -628,8 +1252,10 @@ def clear_cache() -> None:
     
     Use this to free memory or ensure fresh evaluations.
     """
-    _cached_evaluate_expression.cache_clear()
-    _cached_solve_equation.cache_clear()
+    with _cache_lock:
+        _EVAL_CACHE.clear()
+        _SOLVE_CACHE.clear()
+        _NUMERIC_CACHE.clear()
     logger.info("Caches cleared")
 
 
@@ -639,11 +1265,21 @@ def clear_cache() -> None:
 
 def _reset_module_state():
     """Reset module state for testing purposes."""
-    global _canonical_eval, _canonical_solve, _sympy, _config
+    global _canonical_eval, _canonical_solve, _sympy, _symengine, _symengine_checked, _config
+    global _numba, _numba_checked
+    global _SYMPIFY, _SIMPLIFY, _SYMBOL, _SOLVE, _SYMPIFY_ERROR, _SREPR
+    global _PARSE_EXPR, _PARSE_GLOBALS, _TRANSFORMATIONS, _TRIG_FUNCTION
     _canonical_eval = None
     _canonical_solve = None
     _sympy = None
+    _SYMPIFY = _SIMPLIFY = _SYMBOL = _SOLVE = _SYMPIFY_ERROR = _SREPR = None
+    _PARSE_EXPR = _PARSE_GLOBALS = _TRANSFORMATIONS = _TRIG_FUNCTION = None
+    _symengine = None
+    _symengine_checked = False
+    _numba = None
+    _numba_checked = False
     _config = MathEngineConfig()
+    _close_disk_cache()
     clear_cache()
     logger.info("Module state reset")
 
@@ -655,7 +1291,9 @@ def _reset_module_state():
 __all__ = [
     # Main functions
     'evaluate_expression',
+    'evaluate_expressions',
     'solve_equation',
+    'compile_numeric',
     
     # Validation
     'validate_expression',
@@ -668,6 +1306,9 @@ __all__ = [
     # Cache management
     'clear_cache',
     
+    # Resource management
+    'shutdown_timeout_pool',
+    
     # Exceptions
     'MathEngineError',
     'ExpressionError',
@@ -688,11 +1329,4 @@ if __debug__:
 # Module Initialization
 # ============================================================================
 
-if _canonical_eval is not None:
-    logger.info(
-        f"Math engine v{__version__} initialized with canonical implementations"
-    )
-else:
-    logger.info(
-        f"Math engine v{__version__} initialized with fallback implementations"
-    )
+logger.debug("Math engine v%s loaded", __version__)
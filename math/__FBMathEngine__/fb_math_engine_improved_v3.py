@@ -23,19 +23,25 @@ Example:
     ['-2', '2']
 """
 
+import os
 import sys
+import ast
+import atexit
 import logging
+import json
+import multiprocessing
 import re
 import time
-import signal
+import threading
+from array import array
 from pathlib import Path
 from typing import List, Optional, Tuple, Callable, Protocol
 from contextlib import contextmanager
 from functools import lru_cache
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
 from enum import Enum
-from collections import deque
-from concurrent.futures import ThreadPoolExecutor
+from fractions import Fraction
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FuturesTimeoutError
 
 # Module version and metadata
 __version__ = "2.0.0"
@@ -104,11 +110,30 @@ class MathEngineConfig:
     rate_limit_time_window: int = 60  # seconds
     log_level: str = "INFO"
     default_simplification: SimplificationLevel = SimplificationLevel.FULL
+    persist_cache: bool = False
+    persist_cache_path: Optional[str] = None  # default: ~/.cache/fb_math_engine/cache.json
 
 
 # Global config instance
 _config = MathEngineConfig()
 
+
+def _snapshot(config: MathEngineConfig) -> tuple:
+    """Flatten the settings read on every call into a tuple for unpacking."""
+    return (
+        config.enable_rate_limiting,
+        config.enable_validation,
+        config.max_expression_length,
+        config.default_simplification,
+        config.timeout_seconds,
+    )
+
+
+# Hot-path settings, refreshed whenever _config is replaced (configure(),
+# batch worker start-up, _reset_module_state()). Functions unpack it once
+# at entry instead of chasing attributes on the dataclass.
+_CONFIG_SNAPSHOT = _snapshot(_config)
+
 # Lazy-loaded SymPy reference
 _sympy = None
 
@@ -132,28 +157,50 @@ class SolveFunction(Protocol):
 # ============================================================================
 
 class RateLimiter:
-    """Rate limiter to prevent abuse."""
+    """
+    Sliding-window rate limiter to prevent abuse.
+    
+    The timestamps of the last ``max_calls`` admitted calls live in a
+    fixed-size ring buffer. A call is allowed while the buffer has free slots
+    or its oldest timestamp has left the window, so each check is O(1) with
+    no allocation. Uses the monotonic clock, which wall-clock adjustments
+    cannot move.
+    
+    The step is deliberately left in Python: with no eviction loop left to
+    compile, a Numba kernel over a NumPy buffer measured within ~15% of this
+    (call overhead dominates) and would still need the lock around it.
+    """
     
     def __init__(self, max_calls: int, time_window: int):
         self.max_calls = max_calls
         self.time_window = time_window
-        self.calls = deque()
+        self._buf = array('d', [0.0] * max(max_calls, 0))
+        self._head = 0   # slot of the oldest admitted call
+        self._count = 0  # occupied slots
+        self._lock = threading.Lock()
     
     def allow(self) -> bool:
         """Check if a call is allowed within rate limits."""
-        now = time.time()
-        # Remove old calls outside time window
-        while self.calls and self.calls[0] < now - self.time_window:
-            self.calls.popleft()
-        
-        if len(self.calls) < self.max_calls:
-            self.calls.append(now)
-            return True
-        return False
+        if self.max_calls <= 0:
+            return False
+        now = time.monotonic()
+        with self._lock:
+            if self._count < self.max_calls:
+                self._buf[(self._head + self._count) % self.max_calls] = now
+                self._count += 1
+                return True
+            # Full: reuse the oldest slot once it is outside the window
+            if self._buf[self._head] < now - self.time_window:
+                self._buf[self._head] = now
+                self._head = (self._head + 1) % self.max_calls
+                return True
+            return False
     
     def reset(self):
         """Reset the rate limiter."""
-        self.calls.clear()
+        with self._lock:
+            self._head = 0
+            self._count = 0
 
 
 _rate_limiter = RateLimiter(
@@ -173,8 +220,11 @@ def configure(config: MathEngineConfig) -> None:
     Args:
         config: Configuration object with desired settings
     """
-    global _config, _rate_limiter
+    global _config, _CONFIG_SNAPSHOT, _rate_limiter
+    # Write back under the old settings before the path or flag can change
+    _close_persisted()
     _config = config
+    _CONFIG_SNAPSHOT = _snapshot(config)
     
     # Update logger level
     logger.setLevel(getattr(logging, config.log_level.upper()))
@@ -182,16 +232,27 @@ def configure(config: MathEngineConfig) -> None:
     # Clear caches if cache size changed
     _cached_evaluate_expression.cache_clear()
     _cached_solve_equation.cache_clear()
+    _parse.cache_clear()
+    _simplify_srepr.cache_clear()
+    _norm.cache_clear()
     
     # Update rate limiter
     _rate_limiter = RateLimiter(
         max_calls=config.rate_limit_max_calls,
         time_window=config.rate_limit_time_window
     )
+    
+    # Batch workers were started with the old settings
+    shutdown_process_pool(wait=False)
 
 
 def get_config() -> MathEngineConfig:
-    """Get current configuration."""
+    """
+    Get current configuration.
+    
+    Changes take effect through configure(); mutating the returned object
+    in place does not refresh the settings read on the hot path.
+    """
     return _config
 
 
@@ -224,37 +285,80 @@ def _temporary_path_modification(path: Path):
             pass
 
 
-@contextmanager
-def timeout(seconds: int):
+# ============================================================================
+# Timeout Support (Cross-platform)
+# ============================================================================
+
+# Reused worker threads for timed operations. Unlike SIGALRM this needs no
+# syscalls per call, works off the main thread and works on Windows.
+_TIMEOUT_POOL: Optional[ThreadPoolExecutor] = None
+_timeout_pool_lock = threading.Lock()
+
+
+def _get_timeout_pool() -> ThreadPoolExecutor:
+    """Return the shared timeout pool, creating it on first use."""
+    global _TIMEOUT_POOL
+    with _timeout_pool_lock:
+        if _TIMEOUT_POOL is None:
+            _TIMEOUT_POOL = ThreadPoolExecutor(
+                max_workers=2, thread_name_prefix="fb-math-timeout"
+            )
+        return _TIMEOUT_POOL
+
+
+def _retire_timeout_pool(pool: ThreadPoolExecutor) -> None:
     """
-    Context manager to timeout long-running operations.
+    Drop a pool whose worker is stuck on a timed-out task.
+    
+    Threads cannot be killed, so the next call gets a fresh pool instead of
+    queueing behind the runaway computation.
+    """
+    global _TIMEOUT_POOL
+    with _timeout_pool_lock:
+        if _TIMEOUT_POOL is pool:
+            _TIMEOUT_POOL = None
+    pool.shutdown(wait=False, cancel_futures=True)
+
+
+def shutdown_timeout_pool(wait: bool = True) -> None:
+    """
+    Shut down the worker pool used for timeouts.
+    
+    Args:
+        wait: Whether to wait for running operations to finish
+    """
+    global _TIMEOUT_POOL
+    with _timeout_pool_lock:
+        pool, _TIMEOUT_POOL = _TIMEOUT_POOL, None
+    if pool is not None:
+        pool.shutdown(wait=wait, cancel_futures=True)
+
+
+def _run_with_timeout(func: Callable, args: tuple, timeout_seconds: int):
+    """
+    Run a function with timeout (cross-platform).
     
     Args:
-        seconds: Timeout duration in seconds
+        func: Function to run
+        args: Arguments to pass to function
+        timeout_seconds: Timeout in seconds
         
-    Raises:
-        TimeoutError: If operation exceeds timeout
+    Returns:
+        Function result
         
-    Note:
-        This uses SIGALRM and only works on Unix-like systems.
-        On Windows, this will not raise timeout errors.
+    Raises:
+        TimeoutError: If function exceeds timeout
     """
-    def timeout_handler(signum, frame):
-        raise TimeoutError(f"Operation exceeded {seconds} second timeout")
-    
-    # Only set alarm on Unix-like systems
-    if hasattr(signal, 'SIGALRM'):
-        old_handler = signal.signal(signal.SIGALRM, timeout_handler)
-        signal.alarm(seconds)
-        try:
-            yield
-        finally:
-            signal.alarm(0)
-            signal.signal(signal.SIGALRM, old_handler)
-    else:
-        # On Windows, just yield without timeout
-        logger.warning("Timeout protection not available on this platform")
-        yield
+    pool = _get_timeout_pool()
+    future = pool.submit(func, *args)
+    try:
+        return future.result(timeout=timeout_seconds)
+    except FuturesTimeoutError:
+        if not future.cancel():
+            _retire_timeout_pool(pool)
+        raise TimeoutError(
+            f"Operation exceeded {timeout_seconds} second timeout"
+        ) from None
 
 
 # ============================================================================
@@ -286,10 +390,126 @@ def _get_sympy():
     return _sympy
 
 
+# Integer arithmetic that Python and SymPy agree on exactly. True division
+# is excluded (Python gives a float, SymPy a Rational) and so is ^, which
+# SymPy reads as a power.
+_FOLDABLE_OPS = {
+    ast.Add: lambda a, b: a + b,
+    ast.Sub: lambda a, b: a - b,
+    ast.Mult: lambda a, b: a * b,
+    ast.Pow: lambda a, b: a ** b,
+}
+_MAX_FOLDED_POW_BITS = 4096
+
+
+def _is_int_constant(node: ast.AST) -> bool:
+    return isinstance(node, ast.Constant) and type(node.value) is int
+
+
+class _ConstantFolder(ast.NodeTransformer):
+    """Collapse integer-only sub-expressions such as ``2*3`` into one literal."""
+    
+    def __init__(self):
+        self.folded = False
+    
+    def visit_UnaryOp(self, node: ast.UnaryOp) -> ast.AST:
+        self.generic_visit(node)
+        if isinstance(node.op, ast.USub) and _is_int_constant(node.operand):
+            self.folded = True
+            return ast.copy_location(ast.Constant(-node.operand.value), node)
+        return node
+    
+    def visit_BinOp(self, node: ast.BinOp) -> ast.AST:
+        self.generic_visit(node)
+        fold = _FOLDABLE_OPS.get(type(node.op))
+        if fold is None or not (_is_int_constant(node.left) and _is_int_constant(node.right)):
+            return node
+        left, right = node.left.value, node.right.value
+        if isinstance(node.op, ast.Pow):
+            # Negative exponents give floats; huge results are left to SymPy
+            if right < 0 or left.bit_length() * right > _MAX_FOLDED_POW_BITS:
+                return node
+        self.folded = True
+        return ast.copy_location(ast.Constant(fold(left, right)), node)
+
+
+def _fold_constants(expr_str: str) -> str:
+    """
+    Pre-reduce integer constant sub-expressions before SymPy sees them.
+    
+    ``"x + 2*3 + 4"`` becomes ``"x + 6 + 4"``, so SymPy builds a smaller
+    tree. Anything the folder cannot handle exactly is returned unchanged:
+    input that is not Python syntax, float or complex literals whose text
+    ``ast.unparse`` would round, and ``^``, which Python parses as XOR
+    (binding looser than ``*``) but SymPy reads as a power.
+    """
+    if "^" in expr_str:
+        return expr_str
+    try:
+        tree = ast.parse(expr_str, mode="eval")
+        for node in ast.walk(tree):
+            if isinstance(node, ast.Constant) and isinstance(node.value, (float, complex)):
+                return expr_str
+        folder = _ConstantFolder()
+        tree = folder.visit(tree)
+        if not folder.folded:
+            return expr_str
+        folded = ast.unparse(tree)
+        # ast.unparse does not parenthesize negative constants, so a folded
+        # power base like (-2)**x would come back as -2**x; only keep text
+        # that parses back to the same tree.
+        check = _ConstantFolder().visit(ast.parse(folded, mode="eval"))
+        return folded if ast.dump(check) == ast.dump(tree) else expr_str
+    except (SyntaxError, ValueError, RecursionError, MemoryError):
+        return expr_str
+
+
+@lru_cache(maxsize=_config.cache_size)
+def _parse(expr_str: str):
+    """
+    Parse an expression with SymPy, sharing results across callers.
+    
+    SymPy expressions are immutable, so evaluate-then-solve workloads reuse
+    one parse of the same string. Integer constant sub-expressions are
+    folded first (see ``_fold_constants``).
+    """
+    return _get_sympy().sympify(_fold_constants(expr_str))
+
+
 # ============================================================================
 # Validation
 # ============================================================================
 
+# Potentially dangerous input, fused into one pattern compiled at import
+_DANGEROUS_PATTERNS = (
+    r'__import__',
+    r'eval\s*\(',
+    r'exec\s*\(',
+    r'compile\s*\(',
+    r'open\s*\(',
+    r'__\w+__',  # dunder methods
+)
+_DANGEROUS_RE = re.compile("|".join(_DANGEROUS_PATTERNS), re.IGNORECASE)
+
+
+def _check_length(expr_str: str) -> None:
+    """
+    Reject input longer than the configured maximum.
+    
+    Cheap enough to run before normalization and the cache lookup, so
+    oversized input never reaches the regex passes in ``_norm``.
+    
+    Raises:
+        ValidationError: If validation is enabled and the input is too long
+    """
+    _, validation, max_length, _, _ = _CONFIG_SNAPSHOT
+    if validation and len(expr_str) > max_length:
+        raise ValidationError(
+            f"Expression exceeds maximum allowed length of "
+            f"{max_length} characters"
+        )
+
+
 def _validate_expression(expr_str: str) -> None:
     """
     Validate expression string for safety.
@@ -300,30 +520,20 @@ def _validate_expression(expr_str: str) -> None:
     Raises:
         ValidationError: If expression contains potentially dangerous patterns
     """
-    if not _config.enable_validation:
+    if not _CONFIG_SNAPSHOT[1]:
         return
     
-    # Check for dangerous patterns
-    dangerous_patterns = [
-        r'__import__',
-        r'eval\s*\(',
-        r'exec\s*\(',
-        r'compile\s*\(',
-        r'open\s*\(',
-        r'__\w+__',  # dunder methods
-    ]
-    
-    for pattern in dangerous_patterns:
-        if re.search(pattern, expr_str, re.IGNORECASE):
-            raise ValidationError(
-                f"Expression contains potentially dangerous pattern: {pattern}"
-            )
+    # Check for maximum length first so oversized input fails fast (DoS guard)
+    _check_length(expr_str)
     
-    # Check for maximum length to prevent DoS
-    if len(expr_str) > _config.max_expression_length:
+    # Every pattern needs "__" or "(", so most plain math skips the scan
+    if "__" not in expr_str and "(" not in expr_str:
+        return
+    
+    match = _DANGEROUS_RE.search(expr_str)
+    if match:
         raise ValidationError(
-            f"Expression exceeds maximum allowed length of "
-            f"{_config.max_expression_length} characters"
+            f"Expression contains potentially dangerous pattern: {match.group(0)}"
         )
 
 
@@ -422,14 +632,114 @@ def _try_import_canonical() -> Tuple[Optional[EvaluateFunction], Optional[SolveF
         return None, None
 
 
-# Attempt to import from canonical location
-_canonical_eval, _canonical_solve = _try_import_canonical()
+# (evaluate, solve) from the canonical location, resolved on first use so
+# importing this module does no filesystem work; None until then.
+_CANONICAL: Optional[Tuple[Optional[EvaluateFunction], Optional[SolveFunction]]] = None
+
+
+def _canonical_impls() -> Tuple[Optional[EvaluateFunction], Optional[SolveFunction]]:
+    """Return the canonical (evaluate, solve) pair, importing it on first call."""
+    global _CANONICAL
+    if _CANONICAL is None:
+        _CANONICAL = _try_import_canonical()
+        impl = "canonical" if _CANONICAL[0] is not None else "fallback"
+        logger.info(f"Math Engine v{__version__} using {impl} implementations")
+    return _CANONICAL
 
 
 # ============================================================================
 # Fallback Implementations
 # ============================================================================
 
+# Fast paths for inputs whose answer needs no SymPy: integer and rational
+# literals, and linear equations a*x + b with integer coefficients in a
+# single-letter symbol (every lowercase letter parses as a plain Symbol).
+# Integers are written without leading zeros, which Python syntax rejects.
+_INT = r"(?:0|[1-9]\d*)"
+_NUMERIC_RE = re.compile(rf"^-?{_INT}(?:/{_INT})?$")
+_LINEAR_RE = re.compile(rf"^([+-]?)(?:({_INT})\*)?([a-z])(?:([+-])({_INT}))?$")
+
+
+def _numeric_literal(expr_str: str) -> Optional[str]:
+    """Return the reduced form of an integer/rational literal, else None."""
+    if not _NUMERIC_RE.match(expr_str):
+        return None
+    try:
+        return str(Fraction(expr_str))
+    except ZeroDivisionError:
+        return None  # SymPy gives zoo
+
+
+def _solve_linear_literal(equation_str: str, symbol_str: str) -> Optional[List[str]]:
+    """Solve a*x + b = 0 directly for integer a != 0 and b, else None."""
+    match = _LINEAR_RE.match(equation_str)
+    if match is None:
+        return None
+    sign, a_str, name, b_sign, b_str = match.groups()
+    if name != symbol_str:
+        return None
+    a = int(a_str or 1) * (-1 if sign == "-" else 1)
+    b = int(b_str or 0) * (-1 if b_sign == "-" else 1)
+    if a == 0:
+        return None
+    return [str(Fraction(-b, a))]
+
+
+class _SreprKey(str):
+    """
+    ``srepr`` of a parsed expression, carrying the expression itself.
+    
+    Hashes and compares as the plain string, so ``_simplify_srepr`` is keyed
+    on the canonical tree while still receiving the object to simplify.
+    """
+
+
+@lru_cache(maxsize=_config.cache_size)
+def _simplify_srepr(key: _SreprKey, simplification_value: str) -> str:
+    """
+    Simplify the expression behind ``key``, memoised on its ``srepr``.
+    
+    Inputs that differ as strings but parse to the same tree (``"x+x+1"``
+    and ``"2*x+1"``) share one simplification.
+    """
+    sp = _get_sympy()
+    expr = key.expr
+    simplification = SimplificationLevel(simplification_value)
+    
+    # Apply appropriate simplification
+    if simplification == SimplificationLevel.BASIC:
+        simplified = sp.simplify(expr, ratio=1.0)
+    elif simplification == SimplificationLevel.FULL:
+        simplified = sp.simplify(expr)
+    elif simplification == SimplificationLevel.AGGRESSIVE:
+        simplified = sp.simplify(expr, ratio=2.0)
+    else:
+        simplified = sp.simplify(expr)
+    
+    return str(simplified)
+
+
+def _evaluate_with_sympy(expr_str: str, simplification: SimplificationLevel) -> str:
+    """Parse and simplify with SymPy; runs on the timeout pool."""
+    sp = _get_sympy()
+    expr = _parse(expr_str)
+    if simplification == SimplificationLevel.NONE:
+        return str(expr)
+    
+    key = _SreprKey(sp.srepr(expr))
+    key.expr = expr
+    return _simplify_srepr(key, simplification.value)
+
+
+def _solve_with_sympy(equation_str: str, symbol_str: str) -> List[str]:
+    """Parse and solve with SymPy; runs on the timeout pool."""
+    sp = _get_sympy()
+    symbol = sp.Symbol(symbol_str)
+    equation = _parse(equation_str)
+    solutions = sp.solve(equation, symbol)
+    return [str(sol) for sol in solutions]
+
+
 def _fallback_evaluate_expression(
     expr_str: str,
     simplification: SimplificationLevel = None
@@ -449,27 +759,20 @@ def _fallback_evaluate_expression(
         TimeoutError: If evaluation exceeds timeout
     """
     if simplification is None:
-        simplification = _config.default_simplification
+        simplification = _CONFIG_SNAPSHOT[3]
+    
+    literal = _numeric_literal(expr_str)
+    if literal is not None:
+        return literal
     
     try:
         sp = _get_sympy()
         
-        with timeout(_config.timeout_seconds):
-            expr = sp.sympify(expr_str)
-            
-            # Apply appropriate simplification
-            if simplification == SimplificationLevel.NONE:
-                simplified = expr
-            elif simplification == SimplificationLevel.BASIC:
-                simplified = sp.simplify(expr, ratio=1.0)
-            elif simplification == SimplificationLevel.FULL:
-                simplified = sp.simplify(expr)
-            elif simplification == SimplificationLevel.AGGRESSIVE:
-                simplified = sp.simplify(expr, ratio=2.0)
-            else:
-                simplified = sp.simplify(expr)
-            
-            return str(simplified)
+        return _run_with_timeout(
+            _evaluate_with_sympy,
+            (expr_str, simplification),
+            _CONFIG_SNAPSHOT[4]
+        )
         
     except sp.SympifyError as e:
         logger.error(f"Invalid expression syntax: {e}")
@@ -500,26 +803,23 @@ def _fallback_solve_equation(
         EquationError: If equation solving fails
         TimeoutError: If solving exceeds timeout
     """
+    linear = _solve_linear_literal(equation_str, symbol_str)
+    if linear is not None:
+        return linear
+    
     try:
         sp = _get_sympy()
         
-        with timeout(_config.timeout_seconds):
-            # Create symbol
-            symbol = sp.Symbol(symbol_str)
-            
-            # Parse equation
-            equation = sp.sympify(equation_str)
-            
-            # Solve equation
-            solutions = sp.solve(equation, symbol)
-            
-            # Convert solutions to strings
-            result = [str(sol) for sol in solutions]
-            
-            if not result:
-                logger.info(f"No solutions found for equation: {equation_str}")
-            
-            return result
+        result = _run_with_timeout(
+            _solve_with_sympy,
+            (equation_str, symbol_str),
+            _CONFIG_SNAPSHOT[4]
+        )
+        
+        if not result:
+            logger.info(f"No solutions found for equation: {equation_str}")
+        
+        return result
         
     except sp.SympifyError as e:
         logger.error(f"Invalid equation syntax: {e}")
@@ -536,23 +836,179 @@ def _fallback_solve_equation(
 # Caching Layer
 # ============================================================================
 
+_WS_RE = re.compile(r"\s+")
+_OP_WS_RE = re.compile(r"\s*([^\w\s.])\s*")
+
+
+@lru_cache(maxsize=_config.cache_size)
+def _norm(expr_str: str) -> str:
+    """
+    Normalize whitespace so cosmetic variants share a cache entry.
+    
+    Whitespace next to operators and brackets is dropped and other runs are
+    collapsed to one space, so "x**2+1", "x ** 2 + 1" and " x**2 + 1 " map
+    to the same key. Spaces between two identifiers or numbers are kept, so
+    an invalid "x y" does not turn into the symbol "xy".
+    
+    Memoised: the two regex substitutions cost far more than the result-cache
+    probe they key, so a repeated input would otherwise spend most of a warm
+    call here.
+    """
+    return _OP_WS_RE.sub(r"\1", _WS_RE.sub(" ", expr_str.strip()))
+
+
+# Persistent result cache (opt-in via persist_cache). It is loaded on the
+# first cache miss and written back at exit, so a CLI run starts from the
+# results of earlier runs instead of paying for SymPy again. The file is
+# JSON, a list of [kind, expr, arg, result] rows in LRU order, so reading a
+# cache file someone else can write never executes code.
+_DEFAULT_PERSIST_CACHE_PATH = Path.home() / ".cache" / "fb_math_engine" / "cache.json"
+_persisted: Optional[dict] = None
+_persisted_dirty = False
+_persist_lock = threading.Lock()
+
+
+def _persist_cache_path() -> Path:
+    """Location of the persistent cache file for the current config."""
+    if _config.persist_cache_path:
+        return Path(_config.persist_cache_path)
+    return _DEFAULT_PERSIST_CACHE_PATH
+
+
+def _persisted_from_rows(rows) -> dict:
+    """Rebuild the cache dict from JSON rows, dropping malformed ones."""
+    store = {}
+    if not isinstance(rows, list):
+        return store
+    for row in rows:
+        if not (isinstance(row, list) and len(row) == 4
+                and all(isinstance(part, str) for part in row[:3])):
+            continue
+        kind, expr, arg, result = row
+        if kind == "evaluate" and isinstance(result, str):
+            store[(kind, expr, arg)] = result
+        elif (kind == "solve" and isinstance(result, list)
+              and all(isinstance(item, str) for item in result)):
+            store[(kind, expr, arg)] = tuple(result)
+    return store
+
+
+def _load_persisted() -> dict:
+    """Return the persistent cache, reading it on first use (holds _persist_lock)."""
+    global _persisted
+    if _persisted is None:
+        try:
+            with open(_persist_cache_path(), "rb") as f:
+                _persisted = _persisted_from_rows(json.load(f))
+        except FileNotFoundError:
+            _persisted = {}
+        except Exception as e:
+            logger.warning("Persistent cache unreadable, starting empty: %s", e)
+            _persisted = {}
+    return _persisted
+
+
+def _persisted_get(key: tuple):
+    """Return the stored result for key, or None on a miss."""
+    with _persist_lock:
+        store = _load_persisted()
+        value = store.pop(key, None)
+        if value is not None:
+            store[key] = value  # re-insert as most recently used
+        return value
+
+
+def _persisted_put(key: tuple, value) -> None:
+    """Store a result, evicting the least recently used past cache_size."""
+    global _persisted_dirty
+    with _persist_lock:
+        store = _load_persisted()
+        store[key] = value
+        while len(store) > _config.cache_size:
+            del store[next(iter(store))]
+        _persisted_dirty = True
+
+
+def _flush_persisted() -> None:
+    """Write the persistent cache to disk if it changed since the last write."""
+    global _persisted_dirty
+    with _persist_lock:
+        if _persisted is None or not _persisted_dirty:
+            return
+        path = _persist_cache_path()
+        tmp_path = path.with_name(path.name + ".tmp")
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            rows = [[*key, list(value) if isinstance(value, tuple) else value]
+                    for key, value in _persisted.items()]
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(rows, f, ensure_ascii=False)
+            os.replace(tmp_path, path)
+            _persisted_dirty = False
+        except OSError as e:
+            logger.warning("Persistent cache write failed: %s", e)
+
+
+def _close_persisted() -> None:
+    """Flush the persistent cache and drop it from memory."""
+    global _persisted, _persisted_dirty
+    _flush_persisted()
+    with _persist_lock:
+        _persisted, _persisted_dirty = None, False
+
+
+atexit.register(_flush_persisted)
+
+
+# These caches are deliberately not sharded. CPython's lru_cache is the C
+# implementation, which takes no Python-level lock: a hit is one dict probe
+# under the GIL, and threads serialize on the GIL whether or not the cache is
+# split. Batch workers are separate processes with their own caches. Sharding
+# would only add a hash and an index per call, and spread cache_size thinner.
 @lru_cache(maxsize=128)
 def _cached_evaluate_expression(expr_str: str, simplification_value: str) -> str:
-    """Cached version of expression evaluation."""
+    """Cached version of expression evaluation; validates on a miss."""
+    _validate_expression(expr_str)
+    persist = _config.persist_cache
+    if persist:
+        key = ("evaluate", expr_str, simplification_value)
+        stored = _persisted_get(key)
+        if stored is not None:
+            return stored
+    
     simplification = SimplificationLevel(simplification_value)
-    if _canonical_eval is not None:
-        return _canonical_eval(expr_str)
-    return _fallback_evaluate_expression(expr_str, simplification)
+    canonical_eval = _canonical_impls()[0]
+    if canonical_eval is not None:
+        result = canonical_eval(expr_str)
+    else:
+        result = _fallback_evaluate_expression(expr_str, simplification)
+    
+    if persist:
+        _persisted_put(key, result)
+    return result
 
 
 @lru_cache(maxsize=128)
 def _cached_solve_equation(equation_str: str, symbol_str: str) -> Tuple[str, ...]:
     """Cached version of equation solving. Returns tuple for hashability."""
-    if _canonical_solve is not None:
-        result = _canonical_solve(equation_str, symbol_str)
+    _validate_expression(equation_str)
+    persist = _config.persist_cache
+    if persist:
+        key = ("solve", equation_str, symbol_str)
+        stored = _persisted_get(key)
+        if stored is not None:
+            return stored
+    
+    canonical_solve = _canonical_impls()[1]
+    if canonical_solve is not None:
+        result = canonical_solve(equation_str, symbol_str)
     else:
         result = _fallback_solve_equation(equation_str, symbol_str)
-    return tuple(result)  # Convert list to tuple for caching
+    result = tuple(result)  # Convert list to tuple for caching
+    
+    if persist:
+        _persisted_put(key, result)
+    return result
 
 
 # ============================================================================
@@ -599,45 +1055,58 @@ def evaluate_expression(
         - Maximum expression length is 10000 characters
         - Evaluation timeout is 30 seconds by default
     """
-    start_time = time.time()
+    # Only time the call when the info record will actually be emitted
+    log_info = logger.isEnabledFor(logging.INFO)
+    if log_info:
+        start_ns = time.perf_counter_ns()
     
     # Input validation
     if not expr_str or not isinstance(expr_str, str):
         raise ValueError("Expression string must be a non-empty string")
     
+    rate_limited, _, _, default_simplification, _ = _CONFIG_SNAPSHOT
+    
     # Rate limiting check
-    if _config.enable_rate_limiting and not _rate_limiter.allow():
+    if rate_limited and not _rate_limiter.allow():
         raise RateLimitError("Rate limit exceeded. Try again later.")
     
-    # Security validation
-    _validate_expression(expr_str)
+    # Security validation. With the cache on, only the length check runs
+    # here (before _norm touches the input); the pattern scan runs on a miss
+    # inside _cached_evaluate_expression, as cached keys were validated then.
+    if use_cache:
+        _check_length(expr_str)
+    else:
+        _validate_expression(expr_str)
     
     if simplification is None:
-        simplification = _config.default_simplification
+        simplification = default_simplification
     
     try:
         if use_cache:
-            result = _cached_evaluate_expression(expr_str, simplification.value)
+            result = _cached_evaluate_expression(_norm(expr_str), simplification.value)
         else:
-            if _canonical_eval is not None:
-                result = _canonical_eval(expr_str)
+            canonical_eval = _canonical_impls()[0]
+            if canonical_eval is not None:
+                result = canonical_eval(expr_str)
             else:
                 result = _fallback_evaluate_expression(expr_str, simplification)
         
         # Structured logging
-        elapsed = time.time() - start_time
-        logger.info(
-            "Expression evaluated",
-            extra={
-                'expr_length': len(expr_str),
-                'used_cache': use_cache,
-                'elapsed_ms': elapsed * 1000,
-                'impl_type': 'canonical' if _canonical_eval else 'fallback'
-            }
-        )
+        if log_info:
+            logger.info(
+                "Expression evaluated",
+                extra={
+                    'expr_length': len(expr_str),
+                    'used_cache': use_cache,
+                    'elapsed_ms': (time.perf_counter_ns() - start_ns) / 1_000_000,
+                    'impl_type': 'canonical' if _canonical_impls()[0] else 'fallback'
+                }
+            )
         
         return result
         
+    except ValidationError:
+        raise
     except Exception as e:
         logger.error(
             "Expression evaluation failed",
@@ -690,7 +1159,9 @@ def solve_equation(
         - Maximum equation length is 10000 characters
         - Solving timeout is 30 seconds by default
     """
-    start_time = time.time()
+    log_info = logger.isEnabledFor(logging.INFO)
+    if log_info:
+        start_ns = time.perf_counter_ns()
     
     # Input validation
     if not equation_str or not isinstance(equation_str, str):
@@ -700,37 +1171,43 @@ def solve_equation(
         raise ValueError("Symbol must be a non-empty string")
     
     # Rate limiting check
-    if _config.enable_rate_limiting and not _rate_limiter.allow():
+    if _CONFIG_SNAPSHOT[0] and not _rate_limiter.allow():
         raise RateLimitError("Rate limit exceeded. Try again later.")
     
-    # Security validation
-    _validate_expression(equation_str)
+    # Security validation (cache misses validate in _cached_solve_equation)
+    if use_cache:
+        _check_length(equation_str)
+    else:
+        _validate_expression(equation_str)
     
     try:
         if use_cache:
-            result = list(_cached_solve_equation(equation_str, symbol_str))
+            result = list(_cached_solve_equation(_norm(equation_str), symbol_str))
         else:
-            if _canonical_solve is not None:
-                result = _canonical_solve(equation_str, symbol_str)
+            canonical_solve = _canonical_impls()[1]
+            if canonical_solve is not None:
+                result = canonical_solve(equation_str, symbol_str)
             else:
                 result = _fallback_solve_equation(equation_str, symbol_str)
         
         # Structured logging
-        elapsed = time.time() - start_time
-        logger.info(
-            "Equation solved",
-            extra={
-                'equation_length': len(equation_str),
-                'symbol': symbol_str,
-                'num_solutions': len(result),
-                'used_cache': use_cache,
-                'elapsed_ms': elapsed * 1000,
-                'impl_type': 'canonical' if _canonical_solve else 'fallback'
-            }
-        )
+        if log_info:
+            logger.info(
+                "Equation solved",
+                extra={
+                    'equation_length': len(equation_str),
+                    'symbol': symbol_str,
+                    'num_solutions': len(result),
+                    'used_cache': use_cache,
+                    'elapsed_ms': (time.perf_counter_ns() - start_ns) / 1_000_000,
+                    'impl_type': 'canonical' if _canonical_impls()[1] else 'fallback'
+                }
+            )
         
         return result
         
+    except ValidationError:
+        raise
     except Exception as e:
         logger.error(
             "Equation solving failed",
@@ -748,60 +1225,193 @@ def solve_equation(
 # Batch Processing
 # ============================================================================
 
+# SymPy work holds the GIL, so batches run in worker processes. The pool is
+# created on first use and kept for later batches; configure() retires it so
+# workers pick up the new settings.
+# Workers are not forked from the caller: a process that has run a parallel
+# Numba kernel (e.g. geometry's batch path on the TBB layer) is not fork-safe.
+_BATCH_START_METHOD = (
+    "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+)
+_PROCESS_POOL: Optional["multiprocessing.pool.Pool"] = None
+_PROCESS_POOL_WORKERS = 0
+# Workers are recycled after this many chunks so SymPy's internal caches
+# cannot grow without bound in a long-lived pool
+_BATCH_MAX_TASKS_PER_CHILD = 100
+_process_pool_lock = threading.Lock()
+
+
+def _init_batch_worker(config: MathEngineConfig) -> None:
+    """Apply the parent's configuration inside a batch worker process."""
+    global _config, _CONFIG_SNAPSHOT, _PROCESS_POOL, _PROCESS_POOL_WORKERS, _TIMEOUT_POOL
+    # A forked worker inherits the parent's pool handles; it must not use them
+    _PROCESS_POOL, _PROCESS_POOL_WORKERS = None, 0
+    _TIMEOUT_POOL = None
+    # The parent charges the rate limiter for every job before dispatch
+    _config = replace(config, enable_rate_limiting=False)
+    _CONFIG_SNAPSHOT = _snapshot(_config)
+    logger.setLevel(getattr(logging, config.log_level.upper()))
+
+
+def _get_process_pool(max_workers: int) -> "multiprocessing.pool.Pool":
+    """Return the shared batch pool, (re)creating it for max_workers."""
+    global _PROCESS_POOL, _PROCESS_POOL_WORKERS
+    with _process_pool_lock:
+        if _PROCESS_POOL is None or _PROCESS_POOL_WORKERS != max_workers:
+            if _PROCESS_POOL is not None:
+                _PROCESS_POOL.close()
+            _PROCESS_POOL = multiprocessing.get_context(_BATCH_START_METHOD).Pool(
+                processes=max_workers,
+                initializer=_init_batch_worker,
+                initargs=(_config,),
+                maxtasksperchild=_BATCH_MAX_TASKS_PER_CHILD,
+            )
+            _PROCESS_POOL_WORKERS = max_workers
+        return _PROCESS_POOL
+
+
+def shutdown_process_pool(wait: bool = True) -> None:
+    """
+    Shut down the worker processes used by the batch functions.
+    
+    A new pool is created automatically by the next batch call.
+    
+    Args:
+        wait: Whether to block until running tasks finish
+    """
+    global _PROCESS_POOL, _PROCESS_POOL_WORKERS
+    with _process_pool_lock:
+        pool, _PROCESS_POOL, _PROCESS_POOL_WORKERS = _PROCESS_POOL, None, 0
+    if pool is not None:
+        pool.close()
+        if wait:
+            pool.join()
+
+
+def _charge_rate_limiter(count: int) -> None:
+    """Count a batch of calls against the rate limiter."""
+    if _CONFIG_SNAPSHOT[0]:
+        for _ in range(count):
+            if not _rate_limiter.allow():
+                raise RateLimitError("Rate limit exceeded. Try again later.")
+
+
+def _eval_worker_indexed(args: Tuple[int, str, bool]) -> Tuple[int, str]:
+    """Batch worker: evaluate one expression, tagged with its position."""
+    i, expr, use_cache = args
+    return i, evaluate_expression(expr, use_cache=use_cache)
+
+
+def _solve_worker_indexed(args: Tuple[int, str, str, bool]) -> Tuple[int, List[str]]:
+    """Batch worker: solve one equation, tagged with its position."""
+    i, equation, symbol, use_cache = args
+    return i, solve_equation(equation, symbol, use_cache=use_cache)
+
+
+def _batch_chunksize(n_items: int, max_workers: int) -> int:
+    """Items per IPC round-trip: about four chunks per worker."""
+    return max(1, n_items // (max_workers * 4))
+
+
 def evaluate_expressions_batch(
     expressions: List[str],
-    max_workers: int = 4,
+    max_workers: Optional[int] = None,
     use_cache: bool = True
 ) -> List[str]:
     """
-    Evaluate multiple expressions in parallel.
+    Evaluate multiple expressions in parallel worker processes.
     
     Args:
         expressions: List of expression strings
-        max_workers: Maximum number of parallel workers
+        max_workers: Number of worker processes (default: CPU count)
         use_cache: Whether to use caching for each expression
         
     Returns:
         List of simplified expressions (same order as input)
         
+    Raises:
+        RateLimitError: If the batch's distinct jobs would exceed the rate limit
+        
     Example:
         >>> expressions = ["x**2 + 1", "sin(x) + cos(x)", "y**3 - 8"]
         >>> evaluate_expressions_batch(expressions)
         ['x**2 + 1', 'sin(x) + cos(x)', '(y - 2)*(y**2 + 2*y + 4)']
     """
-    with ThreadPoolExecutor(max_workers=max_workers) as executor:
-        return list(executor.map(
-            lambda expr: evaluate_expression(expr, use_cache=use_cache),
-            expressions
-        ))
+    if not expressions:
+        return []
+    for expr in expressions:
+        if not expr or not isinstance(expr, str):
+            raise ValueError("Expression string must be a non-empty string")
+        _check_length(expr)
+    max_workers = max_workers or os.cpu_count() or 1
+    
+    # Dispatch each distinct (normalized) expression once, then scatter
+    keys = [_norm(expr) for expr in expressions]
+    unique = list(dict.fromkeys(keys))
+    _charge_rate_limiter(len(unique))
+    pool = _get_process_pool(max_workers)
+    # Collect in completion order so one slow simplify does not hold back
+    # results that are already done
+    results: List[Optional[str]] = [None] * len(unique)
+    for i, result in pool.imap_unordered(
+        _eval_worker_indexed,
+        [(i, expr, use_cache) for i, expr in enumerate(unique)],
+        chunksize=_batch_chunksize(len(unique), max_workers),
+    ):
+        results[i] = result
+    result_map = dict(zip(unique, results))
+    return [result_map[key] for key in keys]
 
 
 def solve_equations_batch(
     equations: List[Tuple[str, str]],
-    max_workers: int = 4,
+    max_workers: Optional[int] = None,
     use_cache: bool = True
 ) -> List[List[str]]:
     """
-    Solve multiple equations in parallel.
+    Solve multiple equations in parallel worker processes.
     
     Args:
         equations: List of (equation_str, symbol_str) tuples
-        max_workers: Maximum number of parallel workers
+        max_workers: Number of worker processes (default: CPU count)
         use_cache: Whether to use caching for each equation
         
     Returns:
         List of solution lists (same order as input)
         
+    Raises:
+        RateLimitError: If the batch's distinct jobs would exceed the rate limit
+        
     Example:
         >>> equations = [("x**2 - 4", "x"), ("y + 5", "y")]
         >>> solve_equations_batch(equations)
         [['-2', '2'], ['-5']]
     """
-    with ThreadPoolExecutor(max_workers=max_workers) as executor:
-        return list(executor.map(
-            lambda eq: solve_equation(eq[0], eq[1], use_cache=use_cache),
-            equations
-        ))
+    if not equations:
+        return []
+    for eq, sym in equations:
+        if not eq or not isinstance(eq, str):
+            raise ValueError("Equation string must be a non-empty string")
+        if not sym or not isinstance(sym, str):
+            raise ValueError("Symbol must be a non-empty string")
+        _check_length(eq)
+    max_workers = max_workers or os.cpu_count() or 1
+    
+    # Dispatch each distinct (normalized) equation/symbol pair once
+    keys = [(_norm(eq), sym) for eq, sym in equations]
+    unique = list(dict.fromkeys(keys))
+    _charge_rate_limiter(len(unique))
+    pool = _get_process_pool(max_workers)
+    results: List[Optional[List[str]]] = [None] * len(unique)
+    for i, result in pool.imap_unordered(
+        _solve_worker_indexed,
+        [(i, eq, sym, use_cache) for i, (eq, sym) in enumerate(unique)],
+        chunksize=_batch_chunksize(len(unique), max_workers),
+    ):
+        results[i] = result
+    result_map = dict(zip(unique, results))
+    # Fresh lists so duplicates do not alias one another
+    return [list(result_map[key]) for key in keys]
 
 
 # ============================================================================
@@ -815,17 +1425,25 @@ def _reset_module_state():
     This function clears all caches and resets configuration to defaults.
     Should only be used in testing scenarios.
     """
-    global _canonical_eval, _canonical_solve, _sympy, _config, _rate_limiter
-    _canonical_eval = None
-    _canonical_solve = None
+    global _CANONICAL, _sympy, _config, _CONFIG_SNAPSHOT, _rate_limiter
+    global _persisted, _persisted_dirty
+    _CANONICAL = (None, None)
+    with _persist_lock:
+        _persisted, _persisted_dirty = None, False
     _sympy = None
     _config = MathEngineConfig()
+    _CONFIG_SNAPSHOT = _snapshot(_config)
     _rate_limiter = RateLimiter(
         max_calls=_config.rate_limit_max_calls,
         time_window=_config.rate_limit_time_window
     )
     _cached_evaluate_expression.cache_clear()
     _cached_solve_equation.cache_clear()
+    _parse.cache_clear()
+    _simplify_srepr.cache_clear()
+    _norm.cache_clear()
+    shutdown_process_pool(wait=False)
+    shutdown_timeout_pool(wait=False)
 
 
 def get_cache_info() -> dict:
@@ -833,7 +1451,7 @@ def get_cache_info() -> dict:
     Get cache statistics.
     
     Returns:
-        Dictionary with cache information for both functions
+        Dictionary with cache information for each cache
     """
     return {
         'evaluate_expression': {
@@ -847,14 +1465,37 @@ def get_cache_info() -> dict:
             'misses': _cached_solve_equation.cache_info().misses,
             'size': _cached_solve_equation.cache_info().currsize,
             'maxsize': _cached_solve_equation.cache_info().maxsize
+        },
+        'parse': {
+            'hits': _parse.cache_info().hits,
+            'misses': _parse.cache_info().misses,
+            'size': _parse.cache_info().currsize,
+            'maxsize': _parse.cache_info().maxsize
+        },
+        'simplify': {
+            'hits': _simplify_srepr.cache_info().hits,
+            'misses': _simplify_srepr.cache_info().misses,
+            'size': _simplify_srepr.cache_info().currsize,
+            'maxsize': _simplify_srepr.cache_info().maxsize
+        },
+        'persistent': {
+            'size': len(_persisted) if _persisted is not None else 0,
+            'maxsize': _config.cache_size
         }
     }
 
 
 def clear_cache():
-    """Clear all cached results."""
+    """Clear all cached results, including the persistent cache if enabled."""
+    global _persisted, _persisted_dirty
+    if _config.persist_cache:
+        with _persist_lock:
+            _persisted, _persisted_dirty = {}, True
     _cached_evaluate_expression.cache_clear()
     _cached_solve_equation.cache_clear()
+    _parse.cache_clear()
+    _simplify_srepr.cache_clear()
+    _norm.cache_clear()
     logger.info("Cache cleared")
 
 
@@ -869,6 +1510,8 @@ __all__ = [
     # Batch operations
     'evaluate_expressions_batch',
     'solve_equations_batch',
+    'shutdown_process_pool',
+    'shutdown_timeout_pool',
     # Configuration
     'configure',
     'get_config',
@@ -899,12 +1542,6 @@ if __debug__:
 # Module Initialization
 # ============================================================================
 
-# Module initialization logging
-if _canonical_eval is not None:
-    logger.info(
-        f"Math Engine v{__version__} initialized with canonical implementations"
-    )
-else:
-    logger.info(
-        f"Math Engine v{__version__} initialized with fallback implementations"
-    )
+# Canonical resolution and its log record happen on first use; see
+# _canonical_impls().
+logger.debug(f"Math Engine v{__version__} loaded")
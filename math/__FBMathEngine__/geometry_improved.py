@@ -10,6 +10,11 @@ from dataclasses import dataclass
 from enum import Enum
 import math
 
+try:
+    import numpy as np
+except ImportError:  # numpy is only needed for the batch helpers
+    np = None
+
 
 class VectorType(Enum):
     """Enumeration of supported vector types."""
@@ -20,15 +25,29 @@ class VectorType(Enum):
     CYLINDRICAL = "cylindrical"
 
 
-@dataclass
+# Number of components each coordinate system requires
+_EXPECTED_DIMS = {
+    VectorType.CARTESIAN_2D: 2,
+    VectorType.CARTESIAN_3D: 3,
+    VectorType.POLAR: 2,
+    VectorType.SPHERICAL: 3,
+    VectorType.CYLINDRICAL: 3
+}
+
+
+@dataclass(slots=True, frozen=True)
 class GeometryConfig:
-    """Configuration for geometry generation."""
+    """Configuration for geometry generation (immutable; use dataclasses.replace)."""
     precision: int = 6
     normalize: bool = False
     validate_input: bool = True
     output_format: str = "dict"
 
 
+# Shared by every generator created without a config (safe because frozen)
+_DEFAULT_GEOMETRY_CONFIG = GeometryConfig()
+
+
 class GeometryError(Exception):
     """Custom exception for geometry-related errors."""
     pass
@@ -38,11 +57,16 @@ class Vector:
     """
     Represents a mathematical vector with various coordinate systems.
     
+    Vectors are treated as immutable: the magnitude is computed once and
+    memoised, so components must not be reassigned after construction.
+    
     Attributes:
         components: The vector components
         vector_type: The coordinate system type
     """
     
+    __slots__ = ("components", "vector_type", "_magnitude")
+    
     def __init__(
         self,
         components: Union[List[float], Tuple[float, ...], 'Vector'],
@@ -52,19 +76,42 @@ class Vector:
         Initialize a Vector.
         
         Args:
-            components: Vector components (list, tuple, or Vector)
+            components: Vector components (list, tuple, 1-D ndarray, or Vector)
             vector_type: The coordinate system type
             
         Raises:
             GeometryError: If components are invalid
         """
+        if np is not None and isinstance(components, np.ndarray):
+            # tolist() unboxes in C instead of one float() call per element
+            components = components.tolist()
         if isinstance(components, Vector):
             self.components = components.components
             self.vector_type = components.vector_type
+            self._magnitude = components._magnitude
         else:
             self._validate_components(components, vector_type)
-            self.components = tuple(float(c) for c in components)
+            # Converting is the numeric check: one pass, no trial list
+            try:
+                self.components = tuple(map(float, components))
+            except (TypeError, ValueError) as e:
+                raise GeometryError(f"Invalid numeric components: {e}") from e
             self.vector_type = vector_type
+            self._magnitude = None
+    
+    @classmethod
+    def _from_floats(
+        cls,
+        components: Tuple[float, ...],
+        vector_type: VectorType,
+        magnitude: Optional[float] = None
+    ) -> 'Vector':
+        """Build a Vector from already-validated float components."""
+        vec = cls.__new__(cls)
+        vec.components = components
+        vec.vector_type = vector_type
+        vec._magnitude = magnitude
+        return vec
     
     @staticmethod
     def _validate_components(
@@ -72,7 +119,10 @@ class Vector:
         vector_type: VectorType
     ) -> None:
         """
-        Validate vector components based on type.
+        Validate the number of vector components for the type.
+        
+        Numeric conversion is checked by ``__init__`` while it builds the
+        component tuple.
         
         Args:
             components: Vector components to validate
@@ -84,25 +134,12 @@ class Vector:
         if not components:
             raise GeometryError("Vector components cannot be empty")
         
-        expected_dims = {
-            VectorType.CARTESIAN_2D: 2,
-            VectorType.CARTESIAN_3D: 3,
-            VectorType.POLAR: 2,
-            VectorType.SPHERICAL: 3,
-            VectorType.CYLINDRICAL: 3
-        }
-        
-        expected = expected_dims.get(vector_type)
+        expected = _EXPECTED_DIMS.get(vector_type)
         if expected and len(components) != expected:
             raise GeometryError(
                 f"{vector_type.value} requires {expected} components, "
                 f"got {len(components)}"
             )
-        
-        try:
-            [float(c) for c in components]
-        except (TypeError, ValueError) as e:
-            raise GeometryError(f"Invalid numeric components: {e}")
     
     def magnitude(self) -> float:
         """
@@ -111,7 +148,32 @@ class Vector:
         Returns:
             The magnitude of the vector
         """
-        return math.sqrt(sum(c ** 2 for c in self.components))
+        if self._magnitude is None:
+            # hypot takes any number of arguments (3.8+), loops in C and
+            # avoids intermediate overflow/underflow
+            self._magnitude = math.hypot(*self.components)
+        return self._magnitude
+    
+    @staticmethod
+    def magnitude_batch(vectors: "np.ndarray") -> "np.ndarray":
+        """
+        Calculate the magnitudes of many vectors at once.
+        
+        Args:
+            vectors: 2-D array with one vector per row
+            
+        Returns:
+            1-D array of row magnitudes
+            
+        Raises:
+            GeometryError: If NumPy is unavailable or the input is not 2-D
+        """
+        if np is None:
+            raise GeometryError("magnitude_batch requires NumPy")
+        arr = np.asarray(vectors, dtype=np.float64)
+        if arr.ndim != 2:
+            raise GeometryError(f"Expected a 2-D array, got {arr.ndim}-D")
+        return np.sqrt(np.einsum("ij,ij->i", arr, arr))
     
     def normalize(self) -> 'Vector':
         """
@@ -128,18 +190,46 @@ class Vector:
             raise GeometryError("Cannot normalize zero vector")
         
         normalized = tuple(c / mag for c in self.components)
-        return Vector(normalized, self.vector_type)
+        return Vector._from_floats(normalized, self.vector_type, 1.0)
+    
+    def convert_to(self, target_type: VectorType) -> 'Vector':
+        """
+        Express this vector in another coordinate system.
+        
+        Conventions: polar is (r, phi); spherical is (r, theta, phi) with
+        theta the polar angle from +z and phi the azimuth; cylindrical is
+        (rho, phi, z). Angles are in radians.
+        
+        Args:
+            target_type: Coordinate system to convert to
+            
+        Returns:
+            A new Vector in target_type (self if the type already matches)
+            
+        Raises:
+            GeometryError: If the systems have different dimensions
+        """
+        if target_type is self.vector_type:
+            return self
+        convert = _CONVERSIONS.get((self.vector_type, target_type))
+        if convert is None:
+            raise GeometryError(
+                f"Cannot convert {self.vector_type.value} to {target_type.value}"
+            )
+        return Vector._from_floats(convert(*self.components), target_type)
     
     def to_dict(self) -> Dict[str, Any]:
         """
         Convert vector to dictionary representation.
         
         Returns:
-            Dictionary with vector data
+            Dictionary with vector data. ``components`` is the vector's own
+            (immutable) tuple rather than a fresh list; JSON encoders write
+            it as an array. Call ``list()`` on it if a mutable copy is needed.
         """
         return {
             "type": self.vector_type.value,
-            "components": list(self.components),
+            "components": self.components,
             "magnitude": self.magnitude(),
             "dimension": len(self.components)
         }
@@ -155,6 +245,236 @@ class Vector:
         return f"{self.vector_type.value}({components_str})"
 
 
+# ----------------------------------------------------------------------------
+# Coordinate conversions
+# ----------------------------------------------------------------------------
+# Scalar forms use math (cheaper than NumPy for one vector); the public
+# *_to_* functions below are the same closed forms as NumPy ufunc calls for
+# whole arrays of coordinates.
+
+def _polar_to_cartesian(r: float, phi: float) -> Tuple[float, float]:
+    return (r * math.cos(phi), r * math.sin(phi))
+
+
+def _cartesian_to_polar(x: float, y: float) -> Tuple[float, float]:
+    return (math.hypot(x, y), math.atan2(y, x))
+
+
+def _spherical_to_cartesian(r: float, theta: float, phi: float) -> Tuple[float, float, float]:
+    sin_t = math.sin(theta)
+    return (r * sin_t * math.cos(phi), r * sin_t * math.sin(phi), r * math.cos(theta))
+
+
+def _cartesian_to_spherical(x: float, y: float, z: float) -> Tuple[float, float, float]:
+    rho = math.hypot(x, y)
+    # atan2(rho, z) rather than acos(z / r): defined at the origin
+    return (math.hypot(rho, z), math.atan2(rho, z), math.atan2(y, x))
+
+
+def _cylindrical_to_cartesian(rho: float, phi: float, z: float) -> Tuple[float, float, float]:
+    return (rho * math.cos(phi), rho * math.sin(phi), z)
+
+
+def _cartesian_to_cylindrical(x: float, y: float, z: float) -> Tuple[float, float, float]:
+    return (math.hypot(x, y), math.atan2(y, x), z)
+
+
+# system -> (to cartesian, from cartesian, cartesian system of that dimension)
+_COORDINATE_SYSTEMS = {
+    VectorType.POLAR: (
+        _polar_to_cartesian, _cartesian_to_polar, VectorType.CARTESIAN_2D
+    ),
+    VectorType.SPHERICAL: (
+        _spherical_to_cartesian, _cartesian_to_spherical, VectorType.CARTESIAN_3D
+    ),
+    VectorType.CYLINDRICAL: (
+        _cylindrical_to_cartesian, _cartesian_to_cylindrical, VectorType.CARTESIAN_3D
+    ),
+}
+
+
+def _build_conversions() -> Dict[Tuple[VectorType, VectorType], Any]:
+    """Map (source, target) to a function of the source components."""
+    conversions = {}
+    for kind, (to_cart, from_cart, cart) in _COORDINATE_SYSTEMS.items():
+        conversions[(kind, cart)] = to_cart
+        conversions[(cart, kind)] = from_cart
+    for src, (to_cart, _, src_cart) in _COORDINATE_SYSTEMS.items():
+        for dst, (_, from_cart, dst_cart) in _COORDINATE_SYSTEMS.items():
+            if src is not dst and src_cart is dst_cart:
+                conversions[(src, dst)] = (
+                    lambda *c, to_cart=to_cart, from_cart=from_cart:
+                    from_cart(*to_cart(*c))
+                )
+    return conversions
+
+
+_CONVERSIONS = _build_conversions()
+
+
+def _require_numpy(name: str) -> None:
+    if np is None:
+        raise GeometryError(f"{name} requires NumPy")
+
+
+def polar_to_cartesian(r, phi) -> Tuple["np.ndarray", "np.ndarray"]:
+    """Convert arrays of polar (r, phi) coordinates to (x, y)."""
+    _require_numpy("polar_to_cartesian")
+    r, phi = np.asarray(r, dtype=np.float64), np.asarray(phi, dtype=np.float64)
+    return r * np.cos(phi), r * np.sin(phi)
+
+
+def cartesian_to_polar(x, y) -> Tuple["np.ndarray", "np.ndarray"]:
+    """Convert arrays of (x, y) coordinates to polar (r, phi)."""
+    _require_numpy("cartesian_to_polar")
+    x, y = np.asarray(x, dtype=np.float64), np.asarray(y, dtype=np.float64)
+    return np.hypot(x, y), np.arctan2(y, x)
+
+
+def spherical_to_cartesian(r, theta, phi) -> Tuple["np.ndarray", "np.ndarray", "np.ndarray"]:
+    """Convert arrays of spherical (r, theta, phi) coordinates to (x, y, z)."""
+    _require_numpy("spherical_to_cartesian")
+    r = np.asarray(r, dtype=np.float64)
+    theta = np.asarray(theta, dtype=np.float64)
+    phi = np.asarray(phi, dtype=np.float64)
+    r_sin_t = r * np.sin(theta)
+    return r_sin_t * np.cos(phi), r_sin_t * np.sin(phi), r * np.cos(theta)
+
+
+def cartesian_to_spherical(x, y, z) -> Tuple["np.ndarray", "np.ndarray", "np.ndarray"]:
+    """Convert arrays of (x, y, z) coordinates to spherical (r, theta, phi)."""
+    _require_numpy("cartesian_to_spherical")
+    x = np.asarray(x, dtype=np.float64)
+    y = np.asarray(y, dtype=np.float64)
+    z = np.asarray(z, dtype=np.float64)
+    rho = np.hypot(x, y)
+    return np.hypot(rho, z), np.arctan2(rho, z), np.arctan2(y, x)
+
+
+def cylindrical_to_cartesian(rho, phi, z) -> Tuple["np.ndarray", "np.ndarray", "np.ndarray"]:
+    """Convert arrays of cylindrical (rho, phi, z) coordinates to (x, y, z)."""
+    _require_numpy("cylindrical_to_cartesian")
+    rho = np.asarray(rho, dtype=np.float64)
+    phi = np.asarray(phi, dtype=np.float64)
+    return rho * np.cos(phi), rho * np.sin(phi), np.asarray(z, dtype=np.float64)
+
+
+def cartesian_to_cylindrical(x, y, z) -> Tuple["np.ndarray", "np.ndarray", "np.ndarray"]:
+    """Convert arrays of (x, y, z) coordinates to cylindrical (rho, phi, z)."""
+    _require_numpy("cartesian_to_cylindrical")
+    x = np.asarray(x, dtype=np.float64)
+    y = np.asarray(y, dtype=np.float64)
+    return np.hypot(x, y), np.arctan2(y, x), np.asarray(z, dtype=np.float64)
+
+
+_batch_kernel = None
+_batch_kernel_checked = False
+
+
+def _get_batch_kernel():
+    """
+    Compile the Numba batch kernel on first use.
+    
+    Numba is imported lazily so plain geometry imports stay fast.
+    
+    Returns:
+        The compiled kernel, or None if Numba is not installed
+    """
+    global _batch_kernel, _batch_kernel_checked
+    if not _batch_kernel_checked:
+        _batch_kernel_checked = True
+        try:
+            import numba
+        except ImportError:
+            return None
+        
+        @numba.njit(
+            "Tuple((f8[:], f8[:], f8[:], f8[:], f8[:], f8[:]))(f8[:, ::1])",
+            parallel=True, fastmath=True, cache=True
+        )
+        def kernel(arr):
+            n, d = arr.shape
+            mags = np.empty(n)
+            amps = np.empty(n)
+            phases = np.empty(n)
+            xy = np.empty(n)
+            xz = np.empty(n)
+            yz = np.empty(n)
+            for i in numba.prange(n):
+                total = 0.0
+                amp = 0.0
+                for j in range(d):
+                    c = arr[i, j]
+                    total += c * c
+                    amp = max(amp, abs(c))
+                x = arr[i, 0]
+                y = arr[i, 1]
+                z = arr[i, 2]
+                mags[i] = math.sqrt(total)
+                amps[i] = amp
+                phases[i] = math.atan2(y, x)
+                xy[i] = math.sqrt(x * x + y * y)
+                xz[i] = math.sqrt(x * x + z * z)
+                yz[i] = math.sqrt(y * y + z * z)
+            return mags, amps, phases, xy, xz, yz
+        
+        _batch_kernel = kernel
+    return _batch_kernel
+
+
+def _resonance_batch(arr: "np.ndarray") -> Dict[str, "np.ndarray"]:
+    """
+    Vectorised ``_compute_resonance`` over the rows of an (N, d) array.
+    
+    Each quantity is a single NumPy ufunc/reduction over the whole batch
+    (``np.arctan2`` for the phase), with no per-vector Python calls.
+    """
+    mags = Vector.magnitude_batch(arr)
+    return {
+        "magnitude": mags,
+        "frequency": mags,
+        "amplitude": np.abs(arr).max(axis=1),
+        "phase": np.arctan2(arr[:, 1], arr[:, 0]),
+    }
+
+
+def _compute_all_batch(arr: "np.ndarray") -> Dict[str, "np.ndarray"]:
+    """
+    Compute magnitude, resonance and projection arrays for an (N, d) array.
+    
+    Uses the Numba kernel for d >= 3 when it is available, NumPy otherwise.
+    """
+    kernel = _get_batch_kernel() if arr.shape[1] >= 3 else None
+    if kernel is not None:
+        mags, amps, phases, xy, xz, yz = kernel(arr)
+        return {
+            "magnitude": mags,
+            "frequency": mags,
+            "amplitude": amps,
+            "phase": phases,
+            "xy_plane": xy,
+            "xz_plane": xz,
+            "yz_plane": yz,
+        }
+    
+    # Column views (no copies): each coordinate is read as its own array
+    x, y = arr[:, 0], arr[:, 1]
+    result = _resonance_batch(arr)
+    result["xy_plane"] = np.hypot(x, y)
+    if arr.shape[1] >= 3:
+        z = arr[:, 2]
+        result["xz_plane"] = np.hypot(x, z)
+        result["yz_plane"] = np.hypot(y, z)
+    return result
+
+
+# Arrays generate_batch returns per geometry_type (None: everything the
+# shared kernel computes; unknown types: magnitude only)
+_BATCH_KEYS = {
+    "projection": ("magnitude", "xy_plane", "xz_plane", "yz_plane"),
+}
+
+
 class GeometryGenerator:
     """
     Generates geometric structures from vector inputs.
@@ -170,7 +490,7 @@ class GeometryGenerator:
         Args:
             config: Configuration for geometry generation
         """
-        self.config = config or GeometryConfig()
+        self.config = config or _DEFAULT_GEOMETRY_CONFIG
     
     def generate(
         self,
@@ -217,6 +537,66 @@ class GeometryGenerator:
         
         return geometry
     
+    def generate_batch(
+        self,
+        vectors: "np.ndarray",
+        geometry_type: Optional[str] = None
+    ) -> Dict[str, "np.ndarray"]:
+        """
+        Compute per-vector geometry for many vectors in one call.
+        
+        The batch counterpart of ``generate``: instead of one dictionary per
+        vector it returns one array per quantity (row i describes vector i),
+        so callers can build per-row dictionaries only where they need them.
+        
+        Args:
+            vectors: Array-like of shape (N, d) with d >= 2, one vector per row
+            geometry_type: "resonance", "shape" or "projection" to return only
+                that group (plus magnitude); None returns magnitude,
+                the resonance arrays and the projections
+            
+        Returns:
+            Dictionary of length-N arrays named like the scalar results
+            ("frequency", "amplitude", "phase", "xy_plane", ...). Projections
+            onto xz/yz are only present when d >= 3; "shape" gives min, max
+            and centroid.
+            
+        Raises:
+            GeometryError: If NumPy is unavailable or the input is invalid
+        """
+        if np is None:
+            raise GeometryError("generate_batch requires NumPy")
+        arr = np.ascontiguousarray(vectors, dtype=np.float64)
+        if arr.ndim != 2 or arr.shape[1] < 2:
+            raise GeometryError(
+                f"Expected a 2-D array with at least 2 columns, got shape {arr.shape}"
+            )
+        if self.config.validate_input and not np.isfinite(arr).all():
+            raise GeometryError("Vector contains non-finite values")
+        
+        if self.config.normalize:
+            mags = Vector.magnitude_batch(arr)
+            if not mags.all():
+                raise GeometryError("Cannot normalize zero vector")
+            arr = arr / mags[:, None]
+        
+        if geometry_type == "shape":
+            return {
+                "magnitude": Vector.magnitude_batch(arr),
+                "min": arr.min(axis=1),
+                "max": arr.max(axis=1),
+                "centroid": arr.mean(axis=1),
+            }
+        
+        if geometry_type == "resonance":
+            return _resonance_batch(arr)
+        
+        result = _compute_all_batch(arr)
+        if geometry_type is None:
+            return result
+        keys = _BATCH_KEYS.get(geometry_type, ("magnitude",))
+        return {k: result[k] for k in keys if k in result}
+    
     def _parse_vector(
         self,
         vector: Union[List[float], Tuple[float, ...], Vector, Dict[str, Any]]
@@ -279,18 +659,10 @@ class GeometryGenerator:
             geometry_type: Type of geometry
             
         Returns:
-            Dictionary with geometry-specific data
+            Dictionary with geometry-specific data (empty for unknown types)
         """
-        result = {}
-        
-        if geometry_type == "resonance":
-            result["resonance"] = self._compute_resonance(vector)
-        elif geometry_type == "shape":
-            result["shape"] = self._compute_shape(vector)
-        elif geometry_type == "projection":
-            result["projection"] = self._compute_projection(vector)
-        
-        return result
+        compute = self._DISPATCH.get(geometry_type)
+        return {geometry_type: compute(self, vector)} if compute else {}
     
     def _compute_resonance(self, vector: Vector) -> Dict[str, Any]:
         """
@@ -302,12 +674,13 @@ class GeometryGenerator:
         Returns:
             Resonance properties
         """
-        magnitude = vector.magnitude()
+        comps = vector.components
         return {
-            "frequency": magnitude,
-            "amplitude": max(abs(c) for c in vector.components),
-            "phase": math.atan2(vector.components[1], vector.components[0])
-            if len(vector.components) >= 2 else 0.0
+            "frequency": vector.magnitude(),
+            # map() keeps the abs() loop in C; a generator would resume a
+            # Python frame per component
+            "amplitude": max(map(abs, comps)),
+            "phase": math.atan2(comps[1], comps[0]) if len(comps) >= 2 else 0.0
         }
     
     def _compute_shape(self, vector: Vector) -> Dict[str, Any]:
@@ -320,13 +693,23 @@ class GeometryGenerator:
         Returns:
             Shape properties
         """
+        comps = vector.components
+        # One pass for both bounds instead of separate min() and max() scans;
+        # the centroid keeps the C-level sum() (and its summation accuracy)
+        lo = hi = comps[0]
+        for c in comps:
+            if c < lo:
+                lo = c
+            elif c > hi:
+                hi = c
+        
         return {
-            "dimensionality": len(vector.components),
+            "dimensionality": len(comps),
             "bounds": {
-                "min": min(vector.components),
-                "max": max(vector.components)
+                "min": lo,
+                "max": hi
             },
-            "centroid": sum(vector.components) / len(vector.components)
+            "centroid": sum(comps) / len(comps)
         }
     
     def _compute_projection(self, vector: Vector) -> Dict[str, Any]:
@@ -340,21 +723,55 @@ class GeometryGenerator:
             Projection properties
         """
         projections = {}
+        comps = vector.components
+        n = len(comps)
         
-        if len(vector.components) >= 2:
-            projections["xy_plane"] = math.sqrt(
-                vector.components[0]**2 + vector.components[1]**2
-            )
+        # math.hypot on scalars: a NumPy round-trip costs more than three
+        # C-level hypot calls for one vector (see projection_batch for bulk)
+        if n >= 2:
+            projections["xy_plane"] = math.hypot(comps[0], comps[1])
         
-        if len(vector.components) >= 3:
-            projections["xz_plane"] = math.sqrt(
-                vector.components[0]**2 + vector.components[2]**2
-            )
-            projections["yz_plane"] = math.sqrt(
-                vector.components[1]**2 + vector.components[2]**2
-            )
+        if n >= 3:
+            projections["xz_plane"] = math.hypot(comps[0], comps[2])
+            projections["yz_plane"] = math.hypot(comps[1], comps[2])
         
         return projections
+    
+    @staticmethod
+    def projection_batch(vectors: "np.ndarray") -> "np.ndarray":
+        """
+        Compute planar projection magnitudes for many vectors at once.
+        
+        Args:
+            vectors: 2-D array with one vector per row (at least 2 columns)
+            
+        Returns:
+            Array of shape (N, 3) holding the xy, xz and yz plane magnitudes,
+            or (N, 1) with only xy for 2-component vectors
+            
+        Raises:
+            GeometryError: If NumPy is unavailable or the shape is unsupported
+        """
+        if np is None:
+            raise GeometryError("projection_batch requires NumPy")
+        arr = np.asarray(vectors, dtype=np.float64)
+        if arr.ndim != 2 or arr.shape[1] < 2:
+            raise GeometryError(
+                f"Expected a 2-D array with at least 2 columns, got shape {arr.shape}"
+            )
+        if arr.shape[1] == 2:
+            return np.hypot(arr[:, :1], arr[:, 1:2])
+        # One ufunc call over all three (first, second) component pairings
+        return np.hypot(arr[:, [0, 0, 1]], arr[:, [1, 2, 2]])
+    
+    # geometry_type -> computation, looked up by _compute_geometry_specific.
+    # Holds the plain functions, so a subclass overriding one of them must
+    # also extend this table.
+    _DISPATCH = {
+        "resonance": _compute_resonance,
+        "shape": _compute_shape,
+        "projection": _compute_projection,
+    }
 
 
 # Convenience function maintaining backward compatibility
@@ -13,35 +13,53 @@ Example:
         $ python interface_improved.py output.json --input data.json --verbose
 """
 
+import os
 import sys
 import json
+import mmap
+import shutil
+import codecs
+import time
 import logging
 import argparse
 from pathlib import Path
 from typing import Optional, Union, Dict, Any
 from dataclasses import dataclass, asdict
-from datetime import datetime
+
+try:
+    import orjson
+except ImportError:  # optional: faster encoding, stdlib json otherwise
+    orjson = None
 
 # Configure module logger
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ExportConfig:
     """Configuration for export operations.
     
+    Instances are immutable; derive variants with ``dataclasses.replace``.
+    
     Attributes:
         format_version: Version string for the canonical format
         pretty_print: Whether to format JSON with indentation
         include_metadata: Whether to include export metadata
         compression: Optional compression type ('gzip', 'bzip2', or None)
         encoding: Character encoding for text output
+        timestamp_override: Fixed export timestamp, so bulk exports can
+            share one stamp instead of reading the clock for each file
     """
     format_version: str = "1.0"
     pretty_print: bool = True
     include_metadata: bool = True
     compression: Optional[str] = None
     encoding: str = 'utf-8'
+    timestamp_override: Optional[str] = None
+
+
+# Shared by every export called without a config (safe because frozen)
+_DEFAULT_EXPORT_CONFIG = ExportConfig()
 
 
 class ExportError(Exception):
@@ -49,6 +67,21 @@ class ExportError(Exception):
     pass
 
 
+def utc_timestamp() -> str:
+    """Return the current UTC time as an ISO 8601 string.
+    
+    Same shape as ``datetime.utcnow().isoformat()`` (no offset), but always
+    with microseconds and formatted by C ``strftime`` without building a
+    datetime object.
+    
+    Returns:
+        Timestamp such as ``2024-01-31T12:00:00.000000``
+    """
+    seconds, nanos = divmod(time.time_ns(), 1_000_000_000)
+    return (time.strftime('%Y-%m-%dT%H:%M:%S', time.gmtime(seconds))
+            + f'.{nanos // 1000:06d}')
+
+
 def validate_output_path(
     output: Union[str, Path],
     overwrite: bool = False
@@ -73,7 +106,7 @@ def validate_output_path(
     
     # Check if parent directory is valid
     if output_path.parent != Path('.') and not output_path.parent.exists():
-        logger.debug(f"Creating parent directory: {output_path.parent}")
+        logger.debug("Creating parent directory: %s", output_path.parent)
         output_path.parent.mkdir(parents=True, exist_ok=True)
     
     # Check for existing file
@@ -106,7 +139,7 @@ def prepare_export_data(
     export_data = {
         "metadata": {
             "format_version": config.format_version,
-            "export_timestamp": datetime.utcnow().isoformat(),
+            "export_timestamp": config.timestamp_override or utc_timestamp(),
             "encoding": config.encoding,
         },
         "data": data
@@ -115,6 +148,88 @@ def prepare_export_data(
     return export_data
 
 
+# Bytes buffered between the streaming encoder and the output file
+_WRITE_BUFFER_SIZE = 1 << 20
+
+
+_INF = float('inf')
+
+
+def _orjson_compatible(data: Any) -> bool:
+    """Check that orjson would encode data exactly as the stdlib encoder.
+    
+    True only for dicts (with str or int keys), lists, tuples, str, int,
+    bool, None and finite floats, each of the exact builtin type. orjson
+    writes NaN/Infinity as null and natively serializes dataclasses,
+    datetimes, UUIDs and enums, all of which the stdlib encoder writes
+    differently or rejects; a container seen twice (possibly a cycle) also
+    defers to the stdlib encoder.
+    """
+    seen = set()
+    stack = [data]
+    while stack:
+        item = stack.pop()
+        kind = type(item)
+        if kind is str or kind is int or kind is bool or item is None:
+            continue
+        if kind is float:
+            if not -_INF < item < _INF:  # NaN or +/-inf
+                return False
+            continue
+        if kind is not dict and kind is not list and kind is not tuple:
+            return False
+        if id(item) in seen:
+            return False
+        seen.add(id(item))
+        if kind is dict:
+            for key in item:
+                if type(key) is not str and type(key) is not int:
+                    return False
+            stack.extend(item.values())
+        else:
+            stack.extend(item)
+    return True
+
+
+def _write_json(
+    output_path: Path,
+    export_data: Dict[str, Any],
+    config: ExportConfig
+) -> None:
+    """Serialize export data straight to the output file.
+    
+    Uses orjson for UTF-8 output when it is installed and the data holds
+    only plain JSON types (see ``_orjson_compatible``), falling back to the
+    stdlib encoder for other encodings, other data, and values orjson
+    rejects (such as integers wider than 64 bits).
+    
+    Raises:
+        TypeError: If data contains values that cannot be serialized
+        ValueError: If data cannot be serialized (e.g. circular references)
+    """
+    if (orjson is not None and codecs.lookup(config.encoding).name == 'utf-8'
+            and _orjson_compatible(export_data)):
+        option = orjson.OPT_NON_STR_KEYS
+        if config.pretty_print:
+            option |= orjson.OPT_INDENT_2
+        try:
+            payload = orjson.dumps(export_data, option=option)
+        except orjson.JSONEncodeError:
+            pass
+        else:
+            with open(output_path, 'wb') as f:
+                f.write(payload)
+            return
+    
+    # Stream the encoder's chunks through a large buffer so the document is
+    # never held in memory as one string and the file sees few large writes
+    indent = 2 if config.pretty_print else None
+    encoder = json.JSONEncoder(indent=indent, ensure_ascii=False)
+    with open(output_path, 'w', encoding=config.encoding,
+              buffering=_WRITE_BUFFER_SIZE) as f:
+        f.writelines(encoder.iterencode(export_data))
+
+
 def export_to_canon(
     output: Union[str, Path],
     data: Optional[Dict[str, Any]] = None,
@@ -148,45 +263,81 @@ def export_to_canon(
     """
     # Set defaults
     data = data if data is not None else {}
-    config = config or ExportConfig()
+    config = config or _DEFAULT_EXPORT_CONFIG
     
     try:
         # Validate output path
         output_path = validate_output_path(output, overwrite)
         
-        logger.info(f"Exporting to canonical format: {output_path}")
-        logger.debug(f"Export config: {asdict(config)}")
+        logger.info("Exporting to canonical format: %s", output_path)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Export config: %s", asdict(config))
         
         # Prepare data with metadata
         export_data = prepare_export_data(data, config)
         
-        # Validate data is JSON-serializable
+        # Write to a temporary file beside the target and move it into place
+        # only once encoding succeeded, so a failed export never truncates
+        # an existing file. Serialization errors surface during the single
+        # encoding pass instead of a separate json.dumps validation pass.
+        tmp_path = output_path.with_name(
+            f".{output_path.name}.{os.getpid()}.{os.urandom(4).hex()}.tmp"
+        )
         try:
-            json.dumps(export_data)
+            _write_json(tmp_path, export_data, config)
+            if output_path.exists():
+                shutil.copymode(output_path, tmp_path)
+            os.replace(tmp_path, output_path)
         except (TypeError, ValueError) as e:
             raise ValueError(f"Data is not JSON-serializable: {e}")
+        finally:
+            tmp_path.unlink(missing_ok=True)
         
-        # Write to file
-        indent = 2 if config.pretty_print else None
-        with open(output_path, 'w', encoding=config.encoding) as f:
-            json.dump(export_data, f, indent=indent, ensure_ascii=False)
-        
-        logger.info(f"Successfully exported {len(data)} items to {output_path}")
+        logger.info("Successfully exported %s items to %s", len(data), output_path)
         return True
         
     except (ValueError, FileExistsError) as e:
-        logger.error(f"Export validation failed: {e}")
+        logger.error("Export validation failed: %s", e)
         raise
         
     except IOError as e:
-        logger.error(f"Failed to write file: {e}")
+        logger.error("Failed to write file: %s", e)
         raise ExportError(f"File operation failed: {e}")
         
     except Exception as e:
-        logger.exception(f"Unexpected error during export: {e}")
+        logger.exception("Unexpected error during export: %s", e)
         raise ExportError(f"Export failed: {e}")
 
 
+# Inputs at least this large are memory-mapped for orjson instead of read
+_MMAP_THRESHOLD = 100 * 1024 * 1024
+
+
+def _read_json(input_path: Path) -> Any:
+    """Decode a JSON file, using orjson when it is installed.
+    
+    orjson is stricter than the stdlib decoder (no NaN/Infinity, integers
+    limited to 64 bits), so anything it rejects is re-parsed with ``json``,
+    which either accepts it or raises the usual ``JSONDecodeError``.
+    """
+    with open(input_path, 'rb') as f:
+        if orjson is not None and os.fstat(f.fileno()).st_size >= _MMAP_THRESHOLD:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm, \
+                    memoryview(mm) as view:
+                try:
+                    return orjson.loads(view)
+                except orjson.JSONDecodeError:
+                    pass
+        raw = f.read()
+    
+    if orjson is not None:
+        try:
+            return orjson.loads(raw)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(raw)
+
+
 def load_input_data(input_path: Union[str, Path]) -> Dict[str, Any]:
     """Load data from input file.
     
@@ -205,13 +356,12 @@ def load_input_data(input_path: Union[str, Path]) -> Dict[str, Any]:
     if not input_path.exists():
         raise FileNotFoundError(f"Input file not found: {input_path}")
     
-    logger.info(f"Loading input data from: {input_path}")
+    logger.info("Loading input data from: %s", input_path)
     
     try:
-        with open(input_path, 'r', encoding='utf-8') as f:
-            data = json.load(f)
+        data = _read_json(input_path)
         
-        logger.debug(f"Loaded {len(data)} items from input")
+        logger.debug("Loaded %s items from input", len(data))
         return data
         
     except json.JSONDecodeError as e:
@@ -316,7 +466,7 @@ Examples:
             logger.warning("No input file provided, using sample data")
             data = {
                 "sample": "data",
-                "timestamp": datetime.utcnow().isoformat(),
+                "timestamp": utc_timestamp(),
                 "count": 0
             }
         
@@ -343,23 +493,23 @@ Examples:
             return 1
             
     except FileNotFoundError as e:
-        logger.error(f"File not found: {e}")
+        logger.error("File not found: %s", e)
         return 2
         
     except ValueError as e:
-        logger.error(f"Invalid input: {e}")
+        logger.error("Invalid input: %s", e)
         return 3
         
     except FileExistsError as e:
-        logger.error(f"File already exists: {e}")
+        logger.error("File already exists: %s", e)
         return 4
         
     except ExportError as e:
-        logger.error(f"Export error: {e}")
+        logger.error("Export error: %s", e)
         return 5
         
     except Exception as e:
-        logger.exception(f"Unexpected error: {e}")
+        logger.exception("Unexpected error: %s", e)
         return 99
 
 
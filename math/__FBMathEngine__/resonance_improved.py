@@ -5,13 +5,37 @@ This module provides functionality to detect resonance states in signals,
 which are critical for mathematical operations in the FB Math Engine.
 """
 
+import sys
 from typing import FrozenSet
 
 # Valid resonance signal patterns
 # These patterns indicate a resonance state in the mathematical engine:
 # - "0+": Standard positive resonance state
 # - "♡0+": Heart-resonance positive state (special quantum resonance)
-RESONANCE_SIGNALS: FrozenSet[str] = frozenset(["0+", "♡0+"])
+# Interned so lookups with interned signals can match on identity first.
+RESONANCE_SIGNALS: FrozenSet[str] = frozenset(map(sys.intern, ["0+", "♡0+"]))
+
+
+def intern_signal(signal: str) -> str:
+    """
+    Intern a signal string for repeated resonance checks.
+    
+    RESONANCE_SIGNALS holds interned strings, so a lookup with an interned
+    signal matches on identity before any character comparison. Worth doing
+    for signals that are checked many times (e.g. parsed once from a stream
+    and then tested in a loop).
+    
+    Args:
+        signal: The signal string to intern.
+    
+    Returns:
+        str: The canonical interned copy of ``signal``.
+    
+    Examples:
+        >>> detect_resonance(intern_signal("0+"))
+        True
+    """
+    return sys.intern(signal)
 
 
 def detect_resonance(signal: str) -> bool:
@@ -111,9 +135,11 @@ class ResonanceDetector:
             resonance_signals: Optional list of custom resonance signal patterns.
                               If None, uses default patterns ["0+", "♡0+"].
         """
-        if resonance_signals is None:
-            resonance_signals = ["0+", "♡0+"]
-        self.resonance_signals: FrozenSet[str] = frozenset(resonance_signals)
+        # The default set is immutable, so every default detector shares it
+        self.resonance_signals: FrozenSet[str] = (
+            RESONANCE_SIGNALS if resonance_signals is None
+            else frozenset(resonance_signals)
+        )
     
     def detect(self, signal: str) -> bool:
         """
@@ -146,8 +172,9 @@ class ResonanceDetector:
             >>> new_detector.detect("custom+")
             True
         """
-        new_signals = list(self.resonance_signals) + [signal]
-        return ResonanceDetector(new_signals)
+        detector = ResonanceDetector.__new__(ResonanceDetector)
+        detector.resonance_signals = self.resonance_signals | {signal}
+        return detector
     
     def get_signals(self) -> FrozenSet[str]:
         """
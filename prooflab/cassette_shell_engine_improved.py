@@ -14,18 +14,29 @@ Improvements:
 """
 
 import os
+import mmap
 import hashlib
+import hmac
 import datetime
+import time
 import json
+import re
+import shutil
 import logging
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, List, Optional, Union, Any
+from typing import BinaryIO, Dict, Iterator, List, Optional, Tuple, Union, Any
 from dataclasses import dataclass, asdict
 from cryptography.fernet import Fernet
-from cryptography.hazmat.primitives import hashes
-from cryptography.hazmat.primitives.kdf.pbkdf2 import PBKDF2HMAC
+from cryptography.hazmat.primitives.ciphers import Cipher, algorithms, modes
 import base64
 
+try:
+    import orjson
+except ImportError:  # optional: faster (de)serialization, stdlib json otherwise
+    orjson = None
+
 
 # --- CONFIGURATION ---
 @dataclass
@@ -44,6 +55,19 @@ class CassetteConfig:
             raise ValueError("ID length must be between 8 and 32 characters")
 
 
+_SECONDS_PER_DAY = 86400
+
+# Characters not allowed in cassette names
+_INVALID_NAME_CHARS = '<>:"/\\|?*'
+_INVALID_NAME_RE = re.compile(f"[{re.escape(_INVALID_NAME_CHARS)}]")
+
+
+@lru_cache(maxsize=4)
+def _csp_date_prefix(utc_day: int) -> str:
+    """Return the MMDDYY stamp for a UTC day counted from the Unix epoch."""
+    return time.strftime('%m%d%y', time.gmtime(utc_day * _SECONDS_PER_DAY))
+
+
 @dataclass
 class CassetteMetadata:
     """Metadata structure for cassettes."""
@@ -59,7 +83,8 @@ class CassetteMetadata:
     def __post_init__(self):
         """Generate CSP tag if not provided."""
         if not self.csp_tag:
-            self.csp_tag = f"FB-CSP-HV-{datetime.datetime.utcnow().strftime('%m%d%y')}-{self.id[:6]}"
+            utc_day = int(time.time() // _SECONDS_PER_DAY)
+            self.csp_tag = f"FB-CSP-HV-{_csp_date_prefix(utc_day)}-{self.id[:6]}"
 
 
 @dataclass
@@ -72,6 +97,63 @@ class SealInfo:
     total_size: int
 
 
+# Upper bound on threads used to hash a cassette's files while sealing
+_MAX_HASH_WORKERS = 8
+
+# Fields yielded by CassetteShellEngine.iter_cassette_summaries
+_SUMMARY_FIELDS = ("name", "id", "created", "path", "sealed")
+
+# Upper bound on threads used to write a batch of payloads
+_MAX_WRITE_WORKERS = 16
+
+# Streamed payloads are read and encrypted this many bytes at a time
+_STREAM_CHUNK_SIZE = 1 << 20
+
+# Header that identifies a streamed, encrypted payload file
+_STREAM_MAGIC = b"FBCS\x01"
+
+# Fernet tokens start with version byte 0x80 and a zero-padded 64-bit timestamp,
+# so every bare token begins with "gAAAAA"; base64-wrapped ones never do
+_FERNET_TOKEN_PREFIX = b"gAAAAA"
+
+
+def _dump_json(data: Dict[str, Any]) -> bytes:
+    """Encode a metadata/seal dict as indented UTF-8 JSON bytes."""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    return json.dumps(data, indent=2, ensure_ascii=False).encode("utf-8")
+
+
+def _load_json(path: Path) -> Dict[str, Any]:
+    """Decode a JSON file written by ``_dump_json``."""
+    raw = path.read_bytes()
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+@lru_cache(maxsize=1024)
+def _load_metadata_cached(path: str, mtime_ns: int, size: int) -> Dict[str, Any]:
+    """Parse a meta.json file; keyed on mtime and size so rewrites miss."""
+    return _load_json(Path(path))
+
+
+def _read_metadata(meta_path: Path) -> Dict[str, Any]:
+    """
+    Read a cassette's meta.json, reusing the parse while the file is unchanged.
+    
+    Returns a fresh copy each time (metadata holds only scalars and lists),
+    so callers may modify it without touching the cached entry.
+    
+    Raises:
+        FileNotFoundError: If the metadata file does not exist
+    """
+    st = os.stat(meta_path)
+    metadata = _load_metadata_cached(str(meta_path), st.st_mtime_ns, st.st_size)
+    return {key: list(value) if isinstance(value, list) else value
+            for key, value in metadata.items()}
+
+
 class CassetteError(Exception):
     """Base exception for cassette operations."""
     pass
@@ -106,6 +188,7 @@ class CassetteShellEngine:
         self._setup_logging()
         self._setup_directories()
         self._encryption_key: Optional[bytes] = None
+        self._fernet: Optional[Fernet] = None
         
         self.logger.info(f"Cassette Shell Engine initialized with root: {self.config.cassette_root}")
     
@@ -139,14 +222,41 @@ class CassetteShellEngine:
         if salt is None:
             salt = os.urandom(16)
         
-        kdf = PBKDF2HMAC(
-            algorithm=hashes.SHA256(),
-            length=32,
-            salt=salt,
-            iterations=100000,
-        )
-        key = base64.urlsafe_b64encode(kdf.derive(password.encode()))
-        return key
+        # Same derivation as cryptography's PBKDF2HMAC, via OpenSSL's C loop
+        derived = hashlib.pbkdf2_hmac("sha256", password.encode(), salt, 100000, dklen=32)
+        return base64.urlsafe_b64encode(derived)
+    
+    def _load_or_create_salt(self) -> bytes:
+        """
+        Return the key-derivation salt stored in the cassette root.
+        
+        The salt is generated on first use and persisted, so the same
+        password derives the same key across sessions.
+        
+        Returns:
+            Salt bytes
+            
+        Raises:
+            CassetteEncryptionError: If the salt file cannot be read or written
+        """
+        salt_path = Path(self.config.cassette_root) / ".salt"
+        try:
+            with open(salt_path, "xb") as f:
+                salt = os.urandom(16)
+                f.write(salt)
+                return salt
+        except FileExistsError:
+            pass
+        except OSError as e:
+            raise CassetteEncryptionError(f"Failed to create salt file: {e}")
+        
+        try:
+            salt = salt_path.read_bytes()
+        except OSError as e:
+            raise CassetteEncryptionError(f"Failed to read salt file: {e}")
+        if len(salt) != 16:
+            raise CassetteEncryptionError(f"Corrupt salt file: {salt_path}")
+        return salt
     
     def set_encryption_password(self, password: str) -> None:
         """
@@ -158,7 +268,8 @@ class CassetteShellEngine:
         if not password or len(password) < 8:
             raise CassetteValidationError("Password must be at least 8 characters long")
         
-        self._encryption_key = self._generate_encryption_key(password)
+        self._encryption_key = self._generate_encryption_key(password, self._load_or_create_salt())
+        self._fernet = Fernet(self._encryption_key)
         self.logger.info("Encryption key set successfully")
     
     def _validate_name(self, name: str) -> None:
@@ -178,9 +289,8 @@ class CassetteShellEngine:
             raise CassetteValidationError("Cassette name cannot exceed 255 characters")
         
         # Check for invalid characters
-        invalid_chars = set('<>:"/\\|?*')
-        if any(char in name for char in invalid_chars):
-            raise CassetteValidationError(f"Cassette name contains invalid characters: {invalid_chars}")
+        if _INVALID_NAME_RE.search(name):
+            raise CassetteValidationError(f"Cassette name contains invalid characters: {_INVALID_NAME_CHARS}")
     
     def _generate_cassette_id(self, name: str, timestamp: str) -> str:
         """
@@ -231,8 +341,7 @@ class CassetteShellEngine:
             
             # Save metadata
             metadata_path = cassette_path / "meta.json"
-            with open(metadata_path, "w", encoding="utf-8") as f:
-                json.dump(asdict(metadata), f, indent=2, ensure_ascii=False)
+            metadata_path.write_bytes(_dump_json(asdict(metadata)))
             
             self.logger.info(f"Cassette created successfully: {cassette_id}")
             return str(cassette_path)
@@ -251,13 +360,12 @@ class CassetteShellEngine:
         Returns:
             Encrypted content or original content if encryption disabled
         """
-        if not self.config.encryption_enabled or not self._encryption_key:
+        if not self.config.encryption_enabled or self._fernet is None:
             return content
         
         try:
-            fernet = Fernet(self._encryption_key)
-            encrypted_bytes = fernet.encrypt(content.encode('utf-8'))
-            return base64.b64encode(encrypted_bytes).decode('utf-8')
+            # Fernet tokens are already URL-safe base64 text
+            return self._fernet.encrypt(content.encode('utf-8')).decode('ascii')
         except Exception as e:
             raise CassetteEncryptionError(f"Encryption failed: {e}")
     
@@ -271,13 +379,15 @@ class CassetteShellEngine:
         Returns:
             Decrypted content
         """
-        if not self._encryption_key:
+        if self._fernet is None:
             raise CassetteEncryptionError("No encryption key available for decryption")
         
         try:
-            fernet = Fernet(self._encryption_key)
-            encrypted_bytes = base64.b64decode(encrypted_content.encode('utf-8'))
-            decrypted_bytes = fernet.decrypt(encrypted_bytes)
+            token = encrypted_content.encode('ascii')
+            if not token.startswith(_FERNET_TOKEN_PREFIX):
+                # Payloads written before tokens were stored bare
+                token = base64.b64decode(token)
+            decrypted_bytes = self._fernet.decrypt(token)
             return decrypted_bytes.decode('utf-8')
         except Exception as e:
             raise CassetteEncryptionError(f"Decryption failed: {e}")
@@ -324,6 +434,189 @@ class CassetteShellEngine:
             self.logger.error(f"Failed to add payload '{filename}': {e}")
             raise CassetteError(f"Payload addition failed: {e}")
     
+    def _stream_keys(self) -> Tuple[bytes, bytes]:
+        """
+        Derive the AES and HMAC keys used for streamed payloads.
+        
+        Both are HMAC-SHA256 expansions of the Fernet key under distinct
+        labels, so streamed payloads never share a key with Fernet tokens.
+        
+        Returns:
+            Tuple of (encryption key, MAC key)
+        """
+        if self._encryption_key is None:
+            raise CassetteEncryptionError("No encryption key available")
+        master = base64.urlsafe_b64decode(self._encryption_key)
+        return (
+            hmac.new(master, b"cassette-stream-enc", hashlib.sha256).digest(),
+            hmac.new(master, b"cassette-stream-mac", hashlib.sha256).digest(),
+        )
+    
+    def add_payload_stream(self, cassette_path: str, filename: str, src: BinaryIO,
+                           encrypt: Optional[bool] = None) -> str:
+        """
+        Add a payload to a cassette by streaming it from a binary file object.
+        
+        The source is read in 1 MiB chunks, so large payloads are never held
+        in memory. Encrypted payloads are written as raw bytes to
+        ``<filename>.enc``: a header and random nonce, the AES-256-CTR
+        ciphertext, and an HMAC-SHA256 tag over everything before it.
+        
+        Args:
+            cassette_path: Path to the cassette directory
+            filename: Name of the file to create
+            src: Binary file object to read the payload from
+            encrypt: Whether to encrypt content. If None, uses config default.
+            
+        Returns:
+            Name of the file written inside the cassette
+            
+        Raises:
+            CassetteError: If payload addition fails
+        """
+        try:
+            cassette_dir = Path(cassette_path)
+            if not cassette_dir.exists():
+                raise CassetteError(f"Cassette directory does not exist: {cassette_path}")
+            
+            # Validate filename
+            if not filename or '..' in filename or filename.startswith('/'):
+                raise CassetteValidationError(f"Invalid filename: {filename}")
+            
+            should_encrypt = encrypt if encrypt is not None else self.config.encryption_enabled
+            if not (should_encrypt and self._encryption_key):
+                with open(cassette_dir / filename, "wb") as f:
+                    shutil.copyfileobj(src, f, _STREAM_CHUNK_SIZE)
+                self.logger.info(f"Payload streamed to cassette: {filename}")
+                return filename
+            
+            if not filename.endswith(".enc"):
+                filename += ".enc"
+            enc_key, mac_key = self._stream_keys()
+            nonce = os.urandom(16)
+            encryptor = Cipher(algorithms.AES(enc_key), modes.CTR(nonce)).encryptor()
+            mac = hmac.new(mac_key, _STREAM_MAGIC + nonce, hashlib.sha256)
+            
+            with open(cassette_dir / filename, "wb") as f:
+                f.write(_STREAM_MAGIC + nonce)
+                for chunk in iter(lambda: src.read(_STREAM_CHUNK_SIZE), b""):
+                    ciphertext = encryptor.update(chunk)
+                    mac.update(ciphertext)
+                    f.write(ciphertext)
+                f.write(mac.digest())
+            
+            self.logger.info(f"Encrypted payload streamed to cassette: {filename}")
+            return filename
+            
+        except Exception as e:
+            self.logger.error(f"Failed to stream payload '{filename}': {e}")
+            raise CassetteError(f"Payload addition failed: {e}")
+    
+    def read_payload_stream(self, cassette_path: str, filename: str, dest: BinaryIO) -> None:
+        """
+        Decrypt a payload written by ``add_payload_stream`` into a file object.
+        
+        The tag is checked over the whole file before any plaintext is
+        written to ``dest``.
+        
+        Args:
+            cassette_path: Path to the cassette directory
+            filename: Name of the ``.enc`` file inside the cassette
+            dest: Binary file object to write the plaintext to
+            
+        Raises:
+            CassetteEncryptionError: If the payload is malformed, tampered with,
+                or no encryption key is set
+        """
+        enc_key, mac_key = self._stream_keys()
+        header_size = len(_STREAM_MAGIC) + 16
+        tag_size = hashlib.sha256().digest_size
+        
+        try:
+            with open(Path(cassette_path) / filename, "rb") as f:
+                size = os.fstat(f.fileno()).st_size
+                header = f.read(header_size)
+                if size < header_size + tag_size or not header.startswith(_STREAM_MAGIC):
+                    raise CassetteEncryptionError(f"Not a streamed cassette payload: {filename}")
+                
+                # First pass: authenticate the ciphertext
+                body_size = size - header_size - tag_size
+                mac = hmac.new(mac_key, header, hashlib.sha256)
+                remaining = body_size
+                while remaining:
+                    chunk = f.read(min(_STREAM_CHUNK_SIZE, remaining))
+                    mac.update(chunk)
+                    remaining -= len(chunk)
+                if not hmac.compare_digest(mac.digest(), f.read(tag_size)):
+                    raise CassetteEncryptionError(f"Payload authentication failed: {filename}")
+                
+                # Second pass: decrypt
+                f.seek(header_size)
+                decryptor = Cipher(algorithms.AES(enc_key),
+                                   modes.CTR(header[len(_STREAM_MAGIC):])).decryptor()
+                remaining = body_size
+                while remaining:
+                    chunk = f.read(min(_STREAM_CHUNK_SIZE, remaining))
+                    dest.write(decryptor.update(chunk))
+                    remaining -= len(chunk)
+        except CassetteEncryptionError:
+            raise
+        except Exception as e:
+            raise CassetteEncryptionError(f"Decryption failed: {e}")
+    
+    def add_payloads_batch(self, cassette_path: str, items: List[Tuple[str, str]],
+                           encrypt: Optional[bool] = None) -> None:
+        """
+        Add several payloads to a cassette at once.
+        
+        Payloads are encrypted and written on a thread pool, so the file
+        writes (which release the GIL) overlap instead of running one after
+        another.
+        
+        Args:
+            cassette_path: Path to the cassette directory
+            items: (filename, content) pairs to add
+            encrypt: Whether to encrypt content. If None, uses config default.
+            
+        Raises:
+            CassetteError: If any payload addition fails
+        """
+        if not Path(cassette_path).exists():
+            raise CassetteError(f"Cassette directory does not exist: {cassette_path}")
+        
+        if len(items) <= 1:
+            for filename, content in items:
+                self.add_payload(cassette_path, filename, content, encrypt)
+            return
+        
+        with ThreadPoolExecutor(max_workers=min(_MAX_WRITE_WORKERS, len(items))) as executor:
+            futures = [
+                executor.submit(self.add_payload, cassette_path, filename, content, encrypt)
+                for filename, content in items
+            ]
+            for future in futures:
+                future.result()
+    
+    def _calculate_file_digest(self, file_path: Path) -> bytes:
+        """
+        Calculate the raw digest of a file.
+        
+        Args:
+            file_path: Path to the file
+            
+        Returns:
+            Digest bytes
+        """
+        with open(file_path, "rb") as f:
+            if hasattr(hashlib, "file_digest"):  # Python 3.11+
+                return hashlib.file_digest(f, self.config.hash_algorithm).digest()
+            hash_obj = hashlib.new(self.config.hash_algorithm)
+            size = os.fstat(f.fileno()).st_size
+            if size:
+                with mmap.mmap(f.fileno(), size, access=mmap.ACCESS_READ) as mm:
+                    hash_obj.update(mm)
+        return hash_obj.digest()
+    
     def _calculate_file_hash(self, file_path: Path) -> str:
         """
         Calculate hash of a file.
@@ -334,11 +627,46 @@ class CassetteShellEngine:
         Returns:
             Hexadecimal hash string
         """
-        hash_obj = hashlib.new(self.config.hash_algorithm)
-        with open(file_path, "rb") as f:
-            for chunk in iter(lambda: f.read(4096), b""):
-                hash_obj.update(chunk)
-        return hash_obj.hexdigest()
+        return self._calculate_file_digest(file_path).hex()
+    
+    def _compute_summary_hash(self, cassette_dir: Path) -> Tuple[str, int, int]:
+        """
+        Hash the sealable contents of a cassette without writing anything.
+        
+        The seal file itself is excluded so that a cassette hashes the same
+        before and after it is sealed.
+        
+        Args:
+            cassette_dir: Path to the cassette directory
+            
+        Returns:
+            Tuple of (summary hash, file count, total size in bytes)
+        """
+        # A single scandir pass; DirEntry caches the type and stat results
+        files = []
+        total_size = 0
+        with os.scandir(cassette_dir) as entries:
+            for entry in entries:
+                if (entry.name.endswith(('.json', '.txt', '.enc')) and entry.name != "seal.json"
+                        and entry.is_file()):
+                    files.append(Path(entry.path))
+                    total_size += entry.stat().st_size
+        
+        # hashlib and file reads release the GIL, so threads overlap the I/O
+        if len(files) > 1:
+            with ThreadPoolExecutor(max_workers=min(_MAX_HASH_WORKERS, len(files))) as executor:
+                digests = list(executor.map(self._calculate_file_digest, files))
+        else:
+            digests = [self._calculate_file_digest(file_path) for file_path in files]
+        
+        file_count = len(files)
+        
+        # Raw digests sort in the same order as their hex forms, and feeding
+        # the hex strings one at a time hashes exactly what their join would
+        summary_hash = hashlib.new(self.config.hash_algorithm)
+        for digest in sorted(digests):
+            summary_hash.update(digest.hex().encode())
+        return summary_hash.hexdigest(), file_count, total_size
     
     def seal_cassette(self, cassette_path: str) -> SealInfo:
         """
@@ -358,35 +686,20 @@ class CassetteShellEngine:
             if not cassette_dir.exists():
                 raise CassetteError(f"Cassette directory does not exist: {cassette_path}")
             
-            # Calculate hashes for all relevant files
-            hash_list = []
-            file_count = 0
-            total_size = 0
-            
-            for file_path in cassette_dir.iterdir():
-                if file_path.is_file() and file_path.suffix in ['.json', '.txt']:
-                    file_hash = self._calculate_file_hash(file_path)
-                    hash_list.append(file_hash)
-                    file_count += 1
-                    total_size += file_path.stat().st_size
-            
-            # Create summary hash
-            summary_hash = hashlib.new(self.config.hash_algorithm)
-            summary_hash.update("".join(sorted(hash_list)).encode())
+            summary_hash, file_count, total_size = self._compute_summary_hash(cassette_dir)
             
             # Create seal info
             seal_info = SealInfo(
                 sealed=True,
                 sealed_at=datetime.datetime.utcnow().isoformat(),
-                hash=summary_hash.hexdigest(),
+                hash=summary_hash,
                 file_count=file_count,
                 total_size=total_size
             )
             
             # Save seal
             seal_path = cassette_dir / "seal.json"
-            with open(seal_path, "w", encoding="utf-8") as f:
-                json.dump(asdict(seal_info), f, indent=2)
+            seal_path.write_bytes(_dump_json(asdict(seal_info)))
             
             self.logger.info(f"Cassette sealed successfully with hash: {seal_info.hash[:16]}...")
             return seal_info
@@ -414,18 +727,17 @@ class CassetteShellEngine:
                 return False
             
             # Load seal info
-            with open(seal_path, "r", encoding="utf-8") as f:
-                seal_data = json.load(f)
+            seal_data = _load_json(seal_path)
             
             original_hash = seal_data.get("hash")
             if not original_hash:
                 return False
             
-            # Recalculate current hash
-            current_seal = self.seal_cassette(cassette_path)
+            # Recalculate current hash without touching the seal on disk
+            current_hash, _, _ = self._compute_summary_hash(cassette_dir)
             
             # Compare hashes
-            integrity_verified = current_seal.hash == original_hash
+            integrity_verified = current_hash == original_hash
             
             if integrity_verified:
                 self.logger.info(f"Cassette integrity verified: {cassette_path}")
@@ -438,41 +750,63 @@ class CassetteShellEngine:
             self.logger.error(f"Integrity verification failed: {e}")
             return False
     
-    def list_cassettes(self) -> List[Dict[str, Any]]:
+    def iter_cassettes(self) -> Iterator[Dict[str, Any]]:
         """
-        List all cassettes in the root directory.
+        Iterate over the cassettes in the root directory in directory order.
         
-        Returns:
-            List of cassette information dictionaries
+        Each cassette's metadata is read only when the generator reaches it,
+        so callers that stop early never parse the remaining files.
+        
+        Yields:
+            Cassette information dictionaries
         """
-        cassettes = []
         root_path = Path(self.config.cassette_root)
         
         if not root_path.exists():
-            return cassettes
-        
-        for cassette_dir in root_path.iterdir():
-            if cassette_dir.is_dir():
-                meta_path = cassette_dir / "meta.json"
-                if meta_path.exists():
-                    try:
-                        with open(meta_path, "r", encoding="utf-8") as f:
-                            metadata = json.load(f)
-                        
-                        # Add path information
-                        metadata["path"] = str(cassette_dir)
-                        
-                        # Check if sealed
-                        seal_path = cassette_dir / "seal.json"
-                        metadata["sealed"] = seal_path.exists()
-                        
-                        cassettes.append(metadata)
-                        
-                    except Exception as e:
-                        self.logger.warning(f"Failed to read metadata for {cassette_dir}: {e}")
-        
-        return sorted(cassettes, key=lambda x: x.get("created", ""))
-
+            return
+        
+        with os.scandir(root_path) as entries:
+            for entry in entries:
+                if not entry.is_dir(follow_symlinks=False):
+                    continue
+                cassette_dir = root_path / entry.name
+                try:
+                    metadata = _read_metadata(cassette_dir / "meta.json")
+                except FileNotFoundError:
+                    continue
+                except Exception as e:
+                    self.logger.warning(f"Failed to read metadata for {cassette_dir}: {e}")
+                    continue
+                
+                # Add path information
+                metadata["path"] = str(cassette_dir)
+                
+                # Check if sealed
+                metadata["sealed"] = os.path.exists(cassette_dir / "seal.json")
+                
+                yield metadata
+    
+    def iter_cassette_summaries(self) -> Iterator[Dict[str, Any]]:
+        """
+        Iterate over cassettes, keeping only the fields listings display.
+        
+        Yields:
+            Dictionaries with the name, id, created, path and sealed fields
+        """
+        for metadata in self.iter_cassettes():
+            yield {key: metadata.get(key) for key in _SUMMARY_FIELDS}
+    
+    def list_cassettes(self, sort_by: str = "created") -> List[Dict[str, Any]]:
+        """
+        List all cassettes in the root directory.
+        
+        Args:
+            sort_by: Metadata field to sort the cassettes by
+            
+        Returns:
+            List of cassette information dictionaries
+        """
+        return sorted(self.iter_cassettes(), key=lambda x: x.get(sort_by, ""))
 
 def main():
     """Demonstration of the improved Cassette Shell Engine."""
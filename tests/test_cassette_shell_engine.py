@@ -0,0 +1,124 @@
+import io
+import os
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+
+import prooflab.cassette_shell_engine_improved as cse
+from prooflab.cassette_shell_engine_improved import (
+    CassetteConfig,
+    CassetteEncryptionError,
+    CassetteMetadata,
+    CassetteShellEngine,
+)
+
+PASSWORD = "correct horse battery"
+
+
+class TestPayloadStream(unittest.TestCase):
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.root = tmp.name
+        self.engine = self._engine(PASSWORD)
+        self.cassette = self.engine.create_cassette("stream-test")
+        self.payload = os.urandom(10_000)
+
+    def _engine(self, password=None, encryption_enabled=True):
+        engine = CassetteShellEngine(CassetteConfig(cassette_root=self.root,
+                                                    encryption_enabled=encryption_enabled,
+                                                    log_level="WARNING"))
+        if password:
+            engine.set_encryption_password(password)
+        return engine
+
+    def _read(self, engine, name):
+        out = io.BytesIO()
+        engine.read_payload_stream(self.cassette, name, out)
+        return out.getvalue()
+
+    def test_encrypted_round_trip(self):
+        # Small chunks exercise the multi-chunk paths in both directions
+        with mock.patch.object(cse, "_STREAM_CHUNK_SIZE", 1000):
+            name = self.engine.add_payload_stream(self.cassette, "blob.bin",
+                                                  io.BytesIO(self.payload))
+            self.assertEqual(name, "blob.bin.enc")
+            self.assertEqual(self._read(self.engine, name), self.payload)
+        raw = (Path(self.cassette) / name).read_bytes()
+        self.assertTrue(raw.startswith(cse._STREAM_MAGIC))
+        self.assertNotIn(self.payload[:64], raw)
+
+    def test_empty_payload(self):
+        name = self.engine.add_payload_stream(self.cassette, "empty", io.BytesIO())
+        self.assertEqual(self._read(self.engine, name), b"")
+
+    def test_same_password_reads_across_sessions(self):
+        name = self.engine.add_payload_stream(self.cassette, "blob", io.BytesIO(self.payload))
+        self.assertEqual(self._read(self._engine(PASSWORD), name), self.payload)
+
+    def test_wrong_password_fails(self):
+        name = self.engine.add_payload_stream(self.cassette, "blob", io.BytesIO(self.payload))
+        out = io.BytesIO()
+        with self.assertRaises(CassetteEncryptionError):
+            self._engine("not the password").read_payload_stream(self.cassette, name, out)
+        self.assertEqual(out.getvalue(), b"")
+
+    def test_tampering_is_detected(self):
+        name = self.engine.add_payload_stream(self.cassette, "blob", io.BytesIO(self.payload))
+        path = Path(self.cassette) / name
+        original = path.read_bytes()
+        header = len(cse._STREAM_MAGIC) + 16
+        for offset in (len(cse._STREAM_MAGIC), header + 100, len(original) - 1):
+            with self.subTest(offset=offset):
+                tampered = bytearray(original)
+                tampered[offset] ^= 0x01
+                path.write_bytes(bytes(tampered))
+                out = io.BytesIO()
+                with self.assertRaises(CassetteEncryptionError):
+                    self.engine.read_payload_stream(self.cassette, name, out)
+                self.assertEqual(out.getvalue(), b"")
+        path.write_bytes(original[:header + 10])
+        with self.assertRaises(CassetteEncryptionError):
+            self._read(self.engine, name)
+
+    def test_unencrypted_copy(self):
+        for engine, encrypt in ((self.engine, False), (self._engine(encryption_enabled=False), None)):
+            with self.subTest(encrypt=encrypt):
+                name = engine.add_payload_stream(self.cassette, "plain.bin",
+                                                 io.BytesIO(self.payload), encrypt=encrypt)
+                self.assertEqual(name, "plain.bin")
+                self.assertEqual((Path(self.cassette) / name).read_bytes(), self.payload)
+
+    def test_read_without_key_fails(self):
+        name = self.engine.add_payload_stream(self.cassette, "blob", io.BytesIO(self.payload))
+        with self.assertRaises(CassetteEncryptionError):
+            self._read(self._engine(), name)
+
+    def test_sealed_stream_payload_is_verified(self):
+        name = self.engine.add_payload_stream(self.cassette, "blob", io.BytesIO(self.payload))
+        self.engine.seal_cassette(self.cassette)
+        self.assertTrue(self.engine.verify_cassette_integrity(self.cassette))
+        path = Path(self.cassette) / name
+        data = path.read_bytes()
+        path.write_bytes(data[:-1] + bytes([data[-1] ^ 0x01]))
+        self.assertFalse(self.engine.verify_cassette_integrity(self.cassette))
+
+
+class TestCspTag(unittest.TestCase):
+    def test_date_prefix(self):
+        for day, want in ((0, "010170"), (19782, "022924"), (20000, "100424")):
+            with self.subTest(day=day):
+                self.assertEqual(cse._csp_date_prefix(day), want)
+
+    def test_metadata_tag_uses_today(self):
+        with mock.patch.object(cse.time, "time", return_value=20000 * 86400 + 86399.5):
+            meta = CassetteMetadata(name="n", id="abcdef123456", created="", tags=[])
+        self.assertEqual(meta.csp_tag, "FB-CSP-HV-100424-abcdef")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,158 @@
+import asyncio
+import json
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from types import SimpleNamespace
+from unittest import mock
+
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+
+import fb_api_client
+from fb_api_client import TokenBucket
+
+
+def _acquire_all(bucket, token_counts, timeout=2.0):
+    async def run():
+        for tokens in token_counts:
+            await bucket.acquire(tokens)
+    asyncio.run(asyncio.wait_for(run(), timeout))
+
+
+class TestTokenBucket(unittest.TestCase):
+    def test_tpm_only_waits_for_tokens(self):
+        bucket = TokenBucket(0, 60000)  # 1000 tokens/s refill
+        _acquire_all(bucket, [59000, 1500])
+        self.assertEqual(bucket.available_request_capacity, float("inf"))
+
+    def test_rpm_only_waits_for_requests(self):
+        bucket = TokenBucket(600, 0)  # one request every 0.1 s
+        bucket.available_request_capacity = 0.5
+        _acquire_all(bucket, [100000, 100000])
+        self.assertEqual(bucket.available_token_capacity, float("inf"))
+
+    def test_oversized_request_still_passes(self):
+        bucket = TokenBucket(0, 1000)
+        _acquire_all(bucket, [5000])
+
+    def test_headers_tighten_capacity(self):
+        bucket = TokenBucket(60, 1000)
+        bucket.update_from_headers({
+            "x-ratelimit-remaining-requests": "3",
+            "x-ratelimit-remaining-tokens": "not-a-number",
+        })
+        self.assertEqual(bucket.available_request_capacity, 3)
+        self.assertEqual(bucket.available_token_capacity, 1000)
+
+
+class TestAskMany(unittest.TestCase):
+    def test_preserves_order_and_caps_concurrency(self):
+        in_flight = 0
+        peak = 0
+
+        async def fake_aask(prompt, **kw):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01 * (5 - int(prompt)))
+            in_flight -= 1
+            return f"{prompt}:{kw['model']}"
+
+        with mock.patch.object(fb_api_client, "aask", fake_aask):
+            out = asyncio.run(fb_api_client.ask_many(
+                [str(i) for i in range(5)], concurrency=2, model="m"))
+        self.assertEqual(out, [f"{i}:m" for i in range(5)])
+        self.assertLessEqual(peak, 2)
+
+
+class _FakeFiles:
+    def __init__(self, contents):
+        self.contents = contents
+        self.deleted = []
+        self.names = []
+
+    def create(self, file, purpose):
+        self.names.append(Path(file.name).name)
+        self.uploaded = file.read()
+        return SimpleNamespace(id="file-in")
+
+    def content(self, file_id):
+        if file_id is None:
+            raise TypeError("file_id must not be None")
+        return SimpleNamespace(text=self.contents[file_id])
+
+    def delete(self, file_id):
+        self.deleted.append(file_id)
+
+
+class _FakeBatches:
+    def __init__(self, batch):
+        self.batch = batch
+
+    def create(self, **kw):
+        return self.batch
+
+
+class TestAskBatch(unittest.TestCase):
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.batch_dir = Path(tmp.name) / "batches"
+        for patcher in (
+            mock.patch.object(fb_api_client, "REPORTS_DIR", Path(tmp.name)),
+            mock.patch.object(fb_api_client, "_reports_dir_ready", False),
+            mock.patch.object(fb_api_client, "_log_event", lambda event: None),
+        ):
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def _run(self, batch, contents, prompts, files=None):
+        files = files or _FakeFiles(contents)
+        cli = SimpleNamespace(files=files, batches=_FakeBatches(batch))
+        with mock.patch.object(fb_api_client, "_client_singleton", lambda: cli):
+            try:
+                return fb_api_client.ask_batch(prompts)
+            finally:
+                self.assertEqual(files.deleted, ["file-in"])
+                self.assertEqual(list(self.batch_dir.iterdir()), [])
+
+    def test_returns_results_in_prompt_order(self):
+        lines = [
+            {"custom_id": f"req-{i}", "response": {
+                "status_code": 200,
+                "body": {"choices": [{"message": {"content": f"answer {i}"}}]},
+            }}
+            for i in (1, 0)
+        ]
+        batch = SimpleNamespace(id="b1", status="completed",
+                                output_file_id="file-out", error_file_id=None)
+        out = self._run(batch, {"file-out": "\n".join(map(json.dumps, lines))}, ["a", "b"])
+        self.assertEqual(out, ["answer 0", "answer 1"])
+
+    def test_all_failed_reports_error_file(self):
+        errors = [
+            {"custom_id": "req-0", "response": {
+                "status_code": 400,
+                "body": {"error": {"message": "bad model"}},
+            }},
+        ]
+        batch = SimpleNamespace(id="b2", status="completed",
+                                output_file_id=None, error_file_id="file-err")
+        with self.assertRaisesRegex(RuntimeError, "req-0: bad model"):
+            self._run(batch, {"file-err": "\n".join(map(json.dumps, errors))}, ["a"])
+
+    def test_batches_in_the_same_second_use_distinct_files(self):
+        batch = SimpleNamespace(id="b3", status="completed",
+                                output_file_id=None, error_file_id=None)
+        files = _FakeFiles({})
+        for prompt in ("first", "second"):
+            files.deleted = []
+            with self.assertRaises(RuntimeError):
+                self._run(batch, {}, [prompt], files)
+            self.assertIn(prompt.encode(), files.uploaded)
+        self.assertEqual(len(set(files.names)), 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,148 @@
+import math
+import subprocess
+import sys
+import textwrap
+import unittest
+from pathlib import Path
+from unittest import mock
+
+ENGINE_DIR = Path(__file__).resolve().parents[1] / "math" / "__FBMathEngine__"
+sys.path.append(str(ENGINE_DIR))
+
+import numpy as np
+import sympy
+
+import fb_math_engine_improved_v2 as engine
+
+
+def run_isolated(body):
+    """Run body in a child process with the engine imported as `engine`.
+
+    SymEngine's parser segfaults on some input, which would take the whole
+    test run down if it happened in-process.
+    """
+    script = "\n".join([
+        "import sys",
+        "sys.path.append(sys.argv[1])",
+        "import fb_math_engine_improved_v2 as engine",
+        textwrap.dedent(body),
+    ])
+    proc = subprocess.run(
+        [sys.executable, "-c", script, str(ENGINE_DIR)],
+        capture_output=True, text=True, timeout=120, cwd=Path(__file__).parent,
+    )
+    if proc.returncode:
+        raise AssertionError(f"child exited with {proc.returncode}:\n{proc.stderr}")
+    return proc.stdout.splitlines()
+
+
+class TestParse(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        engine._get_sympy()
+
+    def test_builtins_match_sympify(self):
+        for expr in ("abs(x)**2", "pow(x, 2)", "round(2.5)", "max(x, y)",
+                     "min(1, 2)", "abs(-3) + x", "pow(2, 10)*x"):
+            with self.subTest(expr=expr):
+                self.assertEqual(engine._parse(expr), sympy.sympify(expr))
+
+    def test_unsafe_builtins_stay_undefined(self):
+        for name in ("open", "eval", "__import__", "getattr"):
+            with self.subTest(name=name):
+                parsed = engine._parse(f"{name}(x)")
+                self.assertIsInstance(parsed.func, sympy.core.function.UndefinedFunction)
+
+
+class TestEvaluateExpression(unittest.TestCase):
+    def test_relational_and_logic_input(self):
+        for expr, want in (("x == 1", "False"), ("x > 1", "x > 1"),
+                           ("And(x, y)", "x & y"), ("Or(x, x)", "x")):
+            with self.subTest(expr=expr):
+                self.assertEqual(engine.evaluate_expression(expr, use_cache=False), want)
+
+
+class TestSymEngineFastPath(unittest.TestCase):
+    def test_logic_operators_do_not_reach_symengine(self):
+        out = run_isolated("""
+            for expr in ("x & y", "x | y", "~x"):
+                print(engine.evaluate_expression(expr, use_cache=False))
+            try:
+                engine.solve_equation("x | y", "x", use_cache=False)
+            except engine.EquationError:
+                print("EquationError")
+        """)
+        self.assertEqual(out, ["x & y", "x | y", "~x", "EquationError"])
+
+    def test_plain_arithmetic_uses_fast_path(self):
+        self.assertTrue(engine._symengine_safe("2*(x + 1)**2 / 3.5 - y"))
+        for expr in ("x & y", "x | y", "~x", "x ^ 2", "x == 1"):
+            with self.subTest(expr=expr):
+                self.assertFalse(engine._symengine_safe(expr))
+
+
+class TestEvaluateExpressions(unittest.TestCase):
+    EXPRS = ["x**2 + y", "x*y", "sin(x) + abs(y - 5)"]
+    SUBS = {"x": 2, "y": 3}
+    EXPECTED = [7.0, 6.0, math.sin(2) + 2]
+
+    def _check(self):
+        out = engine.evaluate_expressions(self.EXPRS, subs=self.SUBS)
+        self.assertEqual(len(out), len(self.EXPECTED))
+        for got, want in zip(out, self.EXPECTED):
+            self.assertAlmostEqual(float(got), want)
+
+    def test_numeric_batch(self):
+        self._check()
+
+    def test_numeric_batch_without_symengine(self):
+        with mock.patch.object(engine, "_get_symengine", lambda: None):
+            self._check()
+
+    def test_symbolic_batch_matches_evaluate_expression(self):
+        exprs = ["x**2 + 2*x + 1", "sin(x)**2 + cos(x)**2"]
+        self.assertEqual(engine.evaluate_expressions(exprs),
+                         [engine.evaluate_expression(e) for e in exprs])
+
+    def test_rejects_empty_expression(self):
+        with self.assertRaises(ValueError):
+            engine.evaluate_expressions(["x", ""], subs=self.SUBS)
+
+    def test_logic_operators_do_not_reach_symengine(self):
+        out = run_isolated("""
+            print(engine.evaluate_expressions(["x & y", "x + y"], subs={"x": 1, "y": 0}))
+        """)
+        self.assertEqual(out, ["['False', '1']"])
+
+
+class TestCompileNumeric(unittest.TestCase):
+    def setUp(self):
+        engine.clear_cache()
+
+    def _check(self):
+        fn = engine.compile_numeric("sin(x)*y + x**2", ["x", "y"])
+        xs = np.linspace(0.0, 1.0, 101)
+        np.testing.assert_allclose(fn(xs, 2.0), np.sin(xs) * 2.0 + xs**2)
+        self.assertAlmostEqual(float(fn(0.5, 3.0)), math.sin(0.5) * 3.0 + 0.25)
+        self.assertIs(engine.compile_numeric("sin(x)*y + x**2", ["x", "y"]), fn)
+
+    def test_compiled_kernel(self):
+        self._check()
+
+    def test_numpy_kernel_without_numba(self):
+        with mock.patch.object(engine, "_get_numba", lambda: None):
+            self._check()
+
+    def test_parameter_order_is_part_of_the_key(self):
+        f_xy = engine.compile_numeric("x - y", ["x", "y"])
+        f_yx = engine.compile_numeric("x - y", ["y", "x"])
+        self.assertEqual(float(f_xy(5.0, 2.0)), 3.0)
+        self.assertEqual(float(f_yx(5.0, 2.0)), -3.0)
+
+    def test_rejects_invalid_syntax(self):
+        with self.assertRaises(engine.ExpressionError):
+            engine.compile_numeric("x +* (", ["x"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,130 @@
+import json
+import pickle
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+sys.path.append(str(Path(__file__).resolve().parents[1] / "math" / "__FBMathEngine__"))
+
+import sympy
+
+import fb_math_engine_improved_v3 as engine
+
+
+class TestConstantFolding(unittest.TestCase):
+    def test_folds_integer_subexpressions(self):
+        self.assertEqual(engine._fold_constants("x + 2*3 + 4"), "x + 6 + 4")
+
+    def test_parse_matches_sympify(self):
+        for expr in ("2^3*4", "x^2*3", "(-2)**x", "(-1)**n", "(-3)**(1/2)",
+                     "(2-5)**x", "x + 2*3", "-2**2", "x**-2*3"):
+            with self.subTest(expr=expr):
+                self.assertEqual(engine._parse(expr), sympy.sympify(expr))
+
+    def test_caret_power_in_public_api(self):
+        self.assertEqual(engine.evaluate_expression("2^3*4", use_cache=False), "32")
+        self.assertEqual(
+            sorted(engine.solve_equation("x^2*4-16", use_cache=False)), ["-2", "2"]
+        )
+
+
+class TestLengthGuard(unittest.TestCase):
+    def setUp(self):
+        engine.clear_cache()
+        self.addCleanup(engine.clear_cache)
+
+    def test_oversized_input_rejected_before_normalization(self):
+        oversized = "x + " * 5000 + "1"
+        for call in (engine.evaluate_expression, engine.solve_equation):
+            with self.subTest(call=call.__name__):
+                with self.assertRaises(engine.ValidationError):
+                    call(oversized)
+        self.assertEqual(engine._norm.cache_info().currsize, 0)
+
+    def test_oversized_batch_rejected(self):
+        with self.assertRaises(engine.ValidationError):
+            engine.evaluate_expressions_batch(["x", "x + " * 5000 + "1"])
+
+
+class TestBatch(unittest.TestCase):
+    def setUp(self):
+        self.addCleanup(engine.shutdown_process_pool)
+
+    def test_evaluate_batch_matches_sequential_in_order(self):
+        exprs = ["x**2 + 2*x + 1", "sin(x)**2 + cos(x)**2", "2*3",
+                 "x**2+2*x+1", "(x + 1)*(x - 1)"]
+        self.assertEqual(engine.evaluate_expressions_batch(exprs, max_workers=2),
+                         [engine.evaluate_expression(e) for e in exprs])
+
+    def test_solve_batch_matches_sequential_in_order(self):
+        equations = [("x**2 - 4", "x"), ("y + 5", "y"), ("x**2 - 4", "x"), ("z**2 + 1", "z")]
+        out = engine.solve_equations_batch(equations, max_workers=2)
+        self.assertEqual(out, [engine.solve_equation(eq, sym) for eq, sym in equations])
+        self.assertIsNot(out[0], out[2])  # duplicates do not alias
+
+    def test_worker_errors_propagate(self):
+        with self.assertRaises(engine.MathEngineError):
+            engine.evaluate_expressions_batch(["x", "__import__('os')"], max_workers=2)
+
+    def test_empty_batch(self):
+        self.assertEqual(engine.evaluate_expressions_batch([]), [])
+        self.assertEqual(engine.solve_equations_batch([]), [])
+
+
+class TestPersistentCache(unittest.TestCase):
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.dir = Path(tmp.name)
+        self.path = self.dir / "cache.json"
+        self.addCleanup(engine.configure, engine.MathEngineConfig())
+        self._reopen()
+
+    def _reopen(self):
+        # configure() writes the cache back and forgets it, like a new process
+        engine.configure(engine.MathEngineConfig(persist_cache=True,
+                                                 persist_cache_path=str(self.path)))
+
+    def test_results_round_trip_as_json(self):
+        evaluated = engine.evaluate_expression("x**2+2*x+1")
+        solved = engine.solve_equation("x**2-4")
+        self._reopen()
+        rows = json.loads(self.path.read_text(encoding="utf-8"))
+        self.assertEqual(rows, [["evaluate", "x**2+2*x+1", "full", evaluated],
+                                ["solve", "x**2-4", "x", solved]])
+        with mock.patch.object(engine, "_fallback_evaluate_expression",
+                               side_effect=AssertionError("cache miss")), \
+             mock.patch.object(engine, "_fallback_solve_equation",
+                               side_effect=AssertionError("cache miss")):
+            self.assertEqual(engine.evaluate_expression("x**2+2*x+1"), evaluated)
+            self.assertEqual(engine.solve_equation("x**2-4"), solved)
+
+    def test_pickle_payload_is_not_executed(self):
+        marker = self.dir / "pwned"
+
+        class Payload:
+            def __reduce__(self):
+                return (open, (str(marker), "w"))
+
+        self.path.write_bytes(pickle.dumps({("evaluate", "x", "full"): Payload()}))
+        self._reopen()
+        self.assertEqual(engine.evaluate_expression("x + x"), "2*x")
+        self.assertFalse(marker.exists())
+
+    def test_malformed_rows_are_dropped(self):
+        self.path.write_text(json.dumps([
+            ["evaluate", "x+x", "full", "not what SymPy says"],
+            ["evaluate", "y", "full", ["wrong", "type"]],
+            ["solve", "x-1", "x", "1"],
+            "garbage",
+        ]), encoding="utf-8")
+        self._reopen()
+        self.assertEqual(engine.evaluate_expression("x + x"), "not what SymPy says")
+        self.assertEqual(engine.evaluate_expression("y"), "y")
+        self.assertEqual(engine.solve_equation("x - 1"), ["1"])
+
+
+if __name__ == "__main__":
+    unittest.main()
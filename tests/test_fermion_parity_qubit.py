@@ -0,0 +1,77 @@
+import sys
+import unittest
+from pathlib import Path
+from unittest import mock
+
+sys.path.append(str(Path(__file__).resolve().parents[1] / "math" / "__FBMathEngine__"))
+
+import numpy as np
+
+import Fermion_Parity_Qubit_improved as fpq
+from Fermion_Parity_Qubit_improved import (
+    FermionParityQubit,
+    FermionParityQubitArray,
+    ParityError,
+)
+
+
+class TestFermionParityQubitArray(unittest.TestCase):
+    def _check_against_scalar(self):
+        rng = np.random.default_rng(0)
+        reg = FermionParityQubitArray(16)
+        qubits = [FermionParityQubit() for _ in range(16)]
+        for _ in range(20):
+            who = rng.integers(-16, 16, size=10)  # repeats and negative indices
+            reg.braid(who)
+            for i in who:
+                qubits[i].braid(1)
+        mask = np.arange(16) % 3 == 0
+        reg.braid(mask)
+        reg.braid(slice(1, 5))
+        for i in [*np.flatnonzero(mask), *range(1, 5)]:
+            qubits[i].braid(1)
+
+        self.assertEqual(reg.measure().tolist(), [q.measure() for q in qubits])
+        self.assertEqual(reg.braid_count.tolist(), [q.braid_count for q in qubits])
+        self.assertEqual(reg.get_state_vector().tolist(),
+                         [q.get_state_vector()[0] for q in qubits])
+
+    def test_matches_scalar_qubits(self):
+        self._check_against_scalar()
+
+    def test_numpy_fallback_matches_scalar_qubits(self):
+        with mock.patch.object(fpq, "_braid_kernel", None):
+            self._check_against_scalar()
+
+    def test_empty_index_list_is_a_no_op(self):
+        for kernel in (fpq._braid_kernel, None):
+            with self.subTest(kernel=kernel is not None), \
+                 mock.patch.object(fpq, "_braid_kernel", kernel):
+                reg = FermionParityQubitArray(4)
+                parity_dtype = reg.parity.dtype
+                reg.braid([])
+                reg.braid(np.array([], dtype=np.int64))
+                self.assertEqual(reg.parity.dtype, parity_dtype)
+                self.assertEqual(reg.measure().tolist(), [0, 0, 0, 0])
+                self.assertEqual(reg.braid_count.tolist(), [0, 0, 0, 0])
+
+    def test_out_of_range_index(self):
+        reg = FermionParityQubitArray(4)
+        with self.assertRaises(IndexError):
+            reg.braid([4])
+
+    def test_measure_reset_and_statistics(self):
+        reg = FermionParityQubitArray(10, initial_parity=1)
+        self.assertEqual(reg.measure([0, 1]).tolist(), [1, 1])
+        self.assertEqual(reg.packed().tolist(), [0xFF, 0xC0])
+        reg.reset()
+        self.assertEqual(reg.get_statistics(),
+                         {"qubits": 10, "odd": 0, "measurements": 2, "braids": 0})
+        with self.assertRaises(ParityError):
+            reg.reset(2)
+        with self.assertRaises(ValueError):
+            reg.parity[0] = 1  # read-only view
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,118 @@
+import sys
+import unittest
+from pathlib import Path
+from unittest import mock
+
+sys.path.append(str(Path(__file__).resolve().parents[1] / "math" / "__FBMathEngine__"))
+
+import numpy as np
+
+import geometry_improved as geometry
+from geometry_improved import GeometryConfig, GeometryError, GeometryGenerator
+
+
+class TestGenerateBatch(unittest.TestCase):
+    def setUp(self):
+        rng = np.random.default_rng(0)
+        self.vectors = rng.normal(size=(32, 3))
+        self.gen = GeometryGenerator()
+
+    def _assert_matches_scalar(self, batch, geometry_type, gen=None, vectors=None):
+        gen = gen or self.gen
+        vectors = self.vectors if vectors is None else vectors
+        for i, row in enumerate(vectors):
+            scalar = gen.generate(row.tolist(), geometry_type)
+            self.assertAlmostEqual(batch["magnitude"][i], scalar["vector"]["magnitude"])
+            if geometry_type == "resonance":
+                for key, value in scalar["resonance"].items():
+                    self.assertAlmostEqual(batch[key][i], value)
+            elif geometry_type == "shape":
+                shape = scalar["shape"]
+                self.assertAlmostEqual(batch["min"][i], shape["bounds"]["min"])
+                self.assertAlmostEqual(batch["max"][i], shape["bounds"]["max"])
+                self.assertAlmostEqual(batch["centroid"][i], shape["centroid"])
+            elif geometry_type == "projection":
+                for key, value in scalar["projection"].items():
+                    self.assertAlmostEqual(batch[key][i], value)
+
+    def test_each_type_matches_generate(self):
+        for geometry_type in ("resonance", "shape", "projection"):
+            with self.subTest(geometry_type=geometry_type):
+                batch = self.gen.generate_batch(self.vectors, geometry_type)
+                self._assert_matches_scalar(batch, geometry_type)
+
+    def test_numpy_fallback_matches_kernel(self):
+        with_kernel = self.gen.generate_batch(self.vectors)
+        with mock.patch.object(geometry, "_get_batch_kernel", lambda: None):
+            without_kernel = self.gen.generate_batch(self.vectors)
+        self.assertEqual(with_kernel.keys(), without_kernel.keys())
+        for key in with_kernel:
+            np.testing.assert_allclose(with_kernel[key], without_kernel[key])
+
+    def test_two_column_input(self):
+        vectors = self.vectors[:, :2]
+        batch = self.gen.generate_batch(vectors, "projection")
+        self.assertEqual(set(batch), {"magnitude", "xy_plane"})
+        gen = GeometryGenerator()
+        for i, row in enumerate(vectors):
+            vec = geometry.Vector(row.tolist(), geometry.VectorType.CARTESIAN_2D)
+            scalar = gen.generate(vec, "projection")
+            self.assertAlmostEqual(batch["xy_plane"][i], scalar["projection"]["xy_plane"])
+
+    def test_normalize(self):
+        gen = GeometryGenerator(GeometryConfig(normalize=True))
+        batch = gen.generate_batch(self.vectors, "shape")
+        np.testing.assert_allclose(batch["magnitude"], 1.0)
+        self._assert_matches_scalar(batch, "shape", gen=gen)
+        with self.assertRaises(GeometryError):
+            gen.generate_batch(np.zeros((2, 3)))
+
+    def test_invalid_input(self):
+        with self.assertRaises(GeometryError):
+            self.gen.generate_batch(np.array([[1.0, np.nan, 0.0]]))
+        with self.assertRaises(GeometryError):
+            self.gen.generate_batch(np.ones(3))
+
+
+class TestCoordinateConversions(unittest.TestCase):
+    def test_vector_round_trips(self):
+        VT = geometry.VectorType
+        cases = [
+            (VT.CARTESIAN_2D, (3.0, -4.0), VT.POLAR),
+            (VT.CARTESIAN_3D, (1.0, -2.0, 0.5), VT.SPHERICAL),
+            (VT.CARTESIAN_3D, (1.0, -2.0, 0.5), VT.CYLINDRICAL),
+            (VT.SPHERICAL, (2.0, 0.3, -1.2), VT.CYLINDRICAL),
+        ]
+        for src, comps, dst in cases:
+            with self.subTest(src=src, dst=dst):
+                vec = geometry.Vector(comps, src)
+                back = vec.convert_to(dst).convert_to(src)
+                np.testing.assert_allclose(back.components, comps, atol=1e-12)
+
+    def test_known_values(self):
+        VT = geometry.VectorType
+        polar = geometry.Vector((3.0, 4.0), VT.CARTESIAN_2D).convert_to(VT.POLAR)
+        np.testing.assert_allclose(polar.components, (5.0, np.arctan2(4.0, 3.0)))
+        sph = geometry.Vector((0.0, 0.0, 2.0), VT.CARTESIAN_3D).convert_to(VT.SPHERICAL)
+        np.testing.assert_allclose(sph.components, (2.0, 0.0, 0.0))
+
+    def test_dimension_mismatch(self):
+        VT = geometry.VectorType
+        with self.assertRaises(GeometryError):
+            geometry.Vector((1.0, 2.0), VT.POLAR).convert_to(VT.SPHERICAL)
+
+    def test_array_functions_match_vector_conversion(self):
+        rng = np.random.default_rng(1)
+        x, y, z = rng.normal(size=(3, 50))
+        r, theta, phi = geometry.cartesian_to_spherical(x, y, z)
+        np.testing.assert_allclose(geometry.spherical_to_cartesian(r, theta, phi), (x, y, z))
+        rho, phi_c, z_c = geometry.cartesian_to_cylindrical(x, y, z)
+        np.testing.assert_allclose(geometry.cylindrical_to_cartesian(rho, phi_c, z_c), (x, y, z))
+        r2, phi2 = geometry.cartesian_to_polar(x, y)
+        np.testing.assert_allclose(geometry.polar_to_cartesian(r2, phi2), (x, y))
+        vec = geometry.Vector((x[0], y[0], z[0])).convert_to(geometry.VectorType.SPHERICAL)
+        np.testing.assert_allclose(vec.components, (r[0], theta[0], phi[0]))
+
+
+if __name__ == "__main__":
+    unittest.main()
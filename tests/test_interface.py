@@ -0,0 +1,69 @@
+import datetime
+import json
+import sys
+import tempfile
+import unittest
+import uuid
+from dataclasses import dataclass
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).resolve().parents[1] / "math" / "__FBMathEngine__"))
+
+from interface_improved import ExportConfig, export_to_canon
+
+RAW = ExportConfig(include_metadata=False)
+
+
+@dataclass
+class Point:
+    x: int
+
+
+class TestExportToCanon(unittest.TestCase):
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.dir = Path(tmp.name)
+        self.out = self.dir / "out.json"
+
+    def test_round_trip(self):
+        data = {"name": "café", "values": [1, 2.5, None, True], "nested": {"k": []}}
+        self.assertTrue(export_to_canon(self.out, data, RAW))
+        self.assertEqual(json.loads(self.out.read_text(encoding="utf-8")), data)
+
+    def test_failed_overwrite_keeps_existing_file(self):
+        self.out.write_text('{"precious": 1}', encoding="utf-8")
+        with self.assertRaises(ValueError):
+            export_to_canon(self.out, {"bad": object()}, RAW, overwrite=True)
+        self.assertEqual(self.out.read_text(encoding="utf-8"), '{"precious": 1}')
+        self.assertEqual([p.name for p in self.dir.iterdir()], ["out.json"])
+
+    def test_existing_file_requires_overwrite(self):
+        self.out.write_text("{}", encoding="utf-8")
+        with self.assertRaises(FileExistsError):
+            export_to_canon(self.out, {"a": 1}, RAW)
+
+    def test_non_finite_floats_match_stdlib(self):
+        data = {"nan": float("nan"), "inf": [float("inf"), -float("inf")]}
+        export_to_canon(self.out, data, RAW)
+        expected = json.dumps(data, indent=2, ensure_ascii=False)
+        self.assertEqual(self.out.read_text(encoding="utf-8"), expected)
+
+    def test_types_stdlib_rejects_are_rejected(self):
+        for value in (datetime.date(2024, 1, 31), uuid.uuid4(), Point(1)):
+            with self.subTest(value=value):
+                with self.assertRaisesRegex(ValueError, "not JSON-serializable"):
+                    export_to_canon(self.out, {"v": value}, RAW, overwrite=True)
+
+    def test_output_matches_stdlib(self):
+        data = {"a": [1, -2, 3.25, "ü"], "1": {"t": (True, None)}, "empty": {}}
+        for pretty in (True, False):
+            with self.subTest(pretty=pretty):
+                config = ExportConfig(include_metadata=False, pretty_print=pretty)
+                export_to_canon(self.out, data, config, overwrite=True)
+                expected = json.dumps(data, indent=2 if pretty else None, ensure_ascii=False)
+                self.assertEqual(json.loads(self.out.read_bytes()), json.loads(expected))
+
+
+if __name__ == "__main__":
+    unittest.main()